@@ -0,0 +1,54 @@
+"""add cocktails complexity
+
+Revision ID: 7c1e5b83d2fa
+Revises: e4a7c2d95f18
+Create Date: 2026-10-18 16:02:41.518220
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+revision = '7c1e5b83d2fa'
+down_revision = 'e4a7c2d95f18'
+branch_labels = None
+depends_on = None
+
+cocktails = sa.table(
+    'cocktails',
+    sa.column('id', sa.String()),
+    sa.column('ingredients', sa.JSON()),
+    sa.column('steps', sa.JSON()),
+    sa.column('complexity', sa.Integer()),
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        'cocktails',
+        sa.Column('complexity', sa.Integer(), nullable=False, server_default=sa.text('0')),
+    )
+    op.alter_column('cocktails', 'complexity', server_default=None)
+
+    # Backfill from the JSON columns: one point per ingredient and per step.
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(cocktails.c.id, cocktails.c.ingredients, cocktails.c.steps)
+    ).all()
+    if rows:
+        connection.execute(
+            cocktails.update()
+            .where(cocktails.c.id == sa.bindparam('cocktail_id'))
+            .values(complexity=sa.bindparam('value')),
+            [
+                {'cocktail_id': row.id, 'value': len(row.ingredients) + len(row.steps)}
+                for row in rows
+            ],
+        )
+
+
+def downgrade() -> None:
+    op.drop_column('cocktails', 'complexity')
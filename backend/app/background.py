@@ -0,0 +1,45 @@
+"""Periodic background work driven from the FastAPI lifespan."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """Runs a blocking callable in a worker thread every ``interval`` seconds."""
+
+    def __init__(self, name: str, interval: float, work: Callable[[], object]) -> None:
+        self.name = name
+        self.interval = interval
+        self.work = work
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.work)
+            except Exception:
+                logger.exception("Background task %s failed.", self.name)
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self.run(), name=self.name)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
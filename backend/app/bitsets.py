@@ -0,0 +1,106 @@
+"""Big-integer bitsets keyed by catalog rank position."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+from typing import TypeVar
+
+CHUNK_BITS = 4096
+# Postings denser than one position in this many are kept as bitsets, so expanding a sparse
+# position array at query time stays a short loop.
+DENSE_POSTING_RATIO = 256
+
+Posting = int | array
+Tier = TypeVar("Tier")
+
+
+def bits_from_positions(positions: Iterable[int], size: int) -> int:
+    """Build a bitset in one pass; OR-ing ``1 << position`` per item is quadratic."""
+    data = bytearray((size + 7) // 8)
+    for position in positions:
+        data[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(data, "little")
+
+
+def pack_positions(positions: list[int], size: int) -> Posting:
+    """Keep dense posting lists as bitsets and sparse ones as compact position arrays."""
+    if len(positions) * DENSE_POSTING_RATIO >= size:
+        return bits_from_positions(positions, size)
+    return array("I", positions)
+
+
+def unpack_positions(posting: Posting, size: int) -> int:
+    if isinstance(posting, int):
+        return posting
+    return bits_from_positions(posting, size)
+
+
+def iter_positions(bits: int, offset: int = 0) -> Iterator[int]:
+    """Yield set bit positions in ascending order, skipping the first ``offset`` of them.
+
+    Whole chunks are skipped by popcount so deep offsets do not walk every bit.
+    """
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    chunk_bytes = CHUNK_BITS // 8
+    for chunk_start in range(0, len(data), chunk_bytes):
+        chunk = int.from_bytes(data[chunk_start : chunk_start + chunk_bytes], "little")
+        population = chunk.bit_count()
+        if offset >= population:
+            offset -= population
+            continue
+        base = chunk_start * 8
+        while chunk:
+            lowest = chunk & -chunk
+            if offset:
+                offset -= 1
+            else:
+                yield base + lowest.bit_length() - 1
+            chunk ^= lowest
+
+
+def score_tiers(
+    candidates: int, boosts: Sequence[int], cap: int | None = None
+) -> list[tuple[int, int]]:
+    """Split ``candidates`` by how many ``boosts`` bitsets each one hits, best tier first.
+
+    ``at_least[count]`` holds the candidates hitting at least ``count`` boosts. Folding each
+    boost in from the highest count down counts it once per cocktail. With ``cap``, counts
+    stop at ``cap``, which bounds the work per boost when higher counts cannot occur.
+    """
+    at_least = [candidates]
+    for boost in boosts:
+        if cap is None or len(at_least) <= cap:
+            at_least.append(0)
+        for count in range(len(at_least) - 1, 0, -1):
+            at_least[count] |= at_least[count - 1] & boost
+    at_least.append(0)
+    tiers = []
+    for score in range(len(at_least) - 2, -1, -1):
+        bits = at_least[score] & ~at_least[score + 1]
+        if bits:
+            tiers.append((score, bits))
+    return tiers
+
+
+def slice_tiers(
+    tiers: Iterable[tuple[Tier, int]], offset: int, limit: int
+) -> list[tuple[int, Tier]]:
+    """Page through ``(tier, bits)`` groups in order, positions ascending within each tier.
+
+    Tiers before ``offset`` are skipped by popcount and iteration stops once the page is full,
+    so lazily generated tiers past the page are never built.
+    """
+    items: list[tuple[int, Tier]] = []
+    for tier, bits in tiers:
+        if len(items) >= limit:
+            break
+        population = bits.bit_count()
+        if offset >= population:
+            offset -= population
+            continue
+        for position in islice(iter_positions(bits, offset), limit - len(items)):
+            items.append((position, tier))
+        offset = 0
+    return items
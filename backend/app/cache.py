@@ -0,0 +1,285 @@
+"""Shared response cache for catalog endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import secrets
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Protocol
+from urllib.parse import urlencode
+
+import orjson
+
+from app.settings import get_settings
+
+LOCK_POLL_SECONDS = 0.05
+# Deletes KEYS[1] only while it still holds ARGV[1], so a lock is released by its owner alone.
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class CacheBackend(Protocol):
+    blocking: bool
+    errors: tuple[type[Exception], ...]
+
+    def get(self, key: str) -> bytes | None: ...
+
+    def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def delete_if_equal(self, key: str, value: bytes) -> bool: ...
+
+
+class InMemoryCacheBackend:
+    """Process-local LRU backend with per-entry expiry."""
+
+    blocking = False
+    errors: tuple[type[Exception], ...] = ()
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = Lock()
+
+    def _get_unlocked(self, key: str) -> bytes | None:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _set_unlocked(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            return self._get_unlocked(key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._set_unlocked(key, value, ttl)
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        with self._lock:
+            if self._get_unlocked(key) is not None:
+                return False
+            self._set_unlocked(key, value, ttl)
+            return True
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_if_equal(self, key: str, value: bytes) -> bool:
+        with self._lock:
+            if self._get_unlocked(key) != value:
+                return False
+            del self._entries[key]
+            return True
+
+
+class RedisCacheBackend:
+    """Redis backend shared by every API replica; requires the ``redis`` extra."""
+
+    blocking = True
+
+    def __init__(self, url: str) -> None:
+        try:
+            import redis
+        except ImportError as error:
+            raise RuntimeError(
+                "Install the 'redis' extra to use a Redis response cache."
+            ) from error
+        self.errors = (redis.RedisError,)
+        self._client = redis.Redis.from_url(url)
+        self._release = self._client.register_script(RELEASE_LOCK_SCRIPT)
+
+    def get(self, key: str) -> bytes | None:
+        return self._client.get(key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._client.set(key, value, px=int(ttl * 1000))
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        return bool(self._client.set(key, value, px=int(ttl * 1000), nx=True))
+
+    def delete(self, key: str) -> None:
+        self._client.delete(key)
+
+    def delete_if_equal(self, key: str, value: bytes) -> bool:
+        return bool(self._release(keys=[key], args=[value]))
+
+
+@dataclass(frozen=True)
+class CachedEntry:
+    value: Any
+    compute_seconds: float
+    expires_at: float
+
+
+class ResponseCache:
+    """Versioned response cache with lock-based and probabilistic early-refresh protection.
+
+    Keys embed the catalog version, so a new seed run makes every older entry unreachable.
+    Entries are refreshed early with a probability that grows as expiry nears (XFetch), and
+    only the caller holding the per-key lock recomputes; others keep serving the old value.
+    Each lock holds a random token, so a computation that outlives ``lock_ttl`` cannot release
+    a lock another caller has taken since.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl: float,
+        lock_ttl: float,
+        namespace: str = "vibe-and-sip",
+        beta: float = 1.0,
+    ) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.lock_ttl = lock_ttl
+        self.namespace = namespace
+        self.beta = beta
+        self.hits = 0
+        self.misses = 0
+
+    def build_key(self, version: str, route: str, **params: object) -> str:
+        query = urlencode(sorted((name, str(value)) for name, value in params.items()))
+        return f"{self.namespace}:{version}:{route}?{query}"
+
+    def read(self, key: str) -> CachedEntry | None:
+        try:
+            raw = self.backend.get(key)
+        except self.backend.errors:
+            return None
+        if raw is None:
+            return None
+        payload = orjson.loads(raw)
+        return CachedEntry(payload["value"], payload["computeSeconds"], payload["expiresAt"])
+
+    def write(self, key: str, value: Any, compute_seconds: float) -> None:
+        payload = {
+            "value": value,
+            "computeSeconds": compute_seconds,
+            "expiresAt": time.time() + self.ttl,
+        }
+        try:
+            self.backend.set(key, orjson.dumps(payload), self.ttl)
+        except self.backend.errors:
+            pass
+
+    def needs_refresh(self, entry: CachedEntry) -> bool:
+        jitter = entry.compute_seconds * self.beta * math.log(1.0 - random.random())
+        return time.time() - jitter >= entry.expires_at
+
+    def acquire(self, key: str) -> bytes | None:
+        """Take the per-key lock, returning its token, or ``None`` when another caller holds it."""
+        token = secrets.token_hex(16).encode()
+        try:
+            return token if self.backend.add(f"{key}:lock", token, self.lock_ttl) else None
+        except self.backend.errors:
+            return token
+
+    def release(self, key: str, token: bytes | None) -> None:
+        if token is None:
+            return
+        try:
+            self.backend.delete_if_equal(f"{key}:lock", token)
+        except self.backend.errors:
+            pass
+
+    def serve(self, entry: CachedEntry) -> Any:
+        self.hits += 1
+        return entry.value
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        entry = self.read(key)
+        if entry is not None and not self.needs_refresh(entry):
+            return self.serve(entry)
+        token = self.acquire(key)
+        if token is None:
+            if entry is not None:
+                return self.serve(entry)
+            deadline = time.monotonic() + self.lock_ttl
+            while time.monotonic() < deadline:
+                time.sleep(LOCK_POLL_SECONDS)
+                entry = self.read(key)
+                if entry is not None:
+                    return self.serve(entry)
+        self.misses += 1
+        try:
+            started = time.perf_counter()
+            value = compute()
+            self.write(key, value, time.perf_counter() - started)
+            return value
+        finally:
+            self.release(key, token)
+
+    async def _call(self, function: Callable[..., Any], *args: Any) -> Any:
+        if self.backend.blocking:
+            return await asyncio.to_thread(function, *args)
+        return function(*args)
+
+    async def get_or_compute_async(
+        self, key: str, compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        entry = await self._call(self.read, key)
+        if entry is not None and not self.needs_refresh(entry):
+            return self.serve(entry)
+        token = await self._call(self.acquire, key)
+        if token is None:
+            if entry is not None:
+                return self.serve(entry)
+            deadline = time.monotonic() + self.lock_ttl
+            while time.monotonic() < deadline:
+                await asyncio.sleep(LOCK_POLL_SECONDS)
+                entry = await self._call(self.read, key)
+                if entry is not None:
+                    return self.serve(entry)
+        self.misses += 1
+        try:
+            started = time.perf_counter()
+            value = await compute()
+            await self._call(self.write, key, value, time.perf_counter() - started)
+            return value
+        finally:
+            await self._call(self.release, key, token)
+
+
+def build_cache_backend(cache_url: str | None) -> CacheBackend:
+    if cache_url and cache_url.startswith(("redis://", "rediss://")):
+        return RedisCacheBackend(cache_url)
+    return InMemoryCacheBackend()
+
+
+@lru_cache(maxsize=1)
+def get_response_cache() -> ResponseCache | None:
+    settings = get_settings()
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return None
+    return ResponseCache(
+        backend=build_cache_backend(settings.REDIS_URL or settings.CACHE_URL),
+        ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+        lock_ttl=settings.RESPONSE_CACHE_LOCK_SECONDS,
+    )
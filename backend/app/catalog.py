@@ -0,0 +1,220 @@
+"""In-memory catalog index and the catalog version stamp written by the seed script."""
+
+from __future__ import annotations
+
+import uuid
+from bisect import bisect_right
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from threading import Lock
+from typing import TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.background import PeriodicTask
+from app.bitsets import bits_from_positions, iter_positions
+from app.db import create_session
+from app.models import CatalogMetadata, Cocktail, cocktail_occasions, cocktail_vibes
+from app.pantry import PantryIndex
+from app.search import SearchIndex, load_search_documents
+from app.settings import get_settings
+
+CATALOG_VERSION_KEY = "catalog_version"
+
+CursorKey = tuple[()] | tuple[int, str, str]
+Key = TypeVar("Key", bound=Hashable)
+
+
+def read_catalog_version(session: Session) -> str | None:
+    return session.execute(
+        select(CatalogMetadata.value).where(CatalogMetadata.key == CATALOG_VERSION_KEY)
+    ).scalar_one_or_none()
+
+
+def bump_catalog_version(session: Session) -> str:
+    """Stamp the catalog with a fresh version so running API processes reload it."""
+    version = uuid.uuid4().hex
+    stamp = session.get(CatalogMetadata, CATALOG_VERSION_KEY)
+    if stamp is None:
+        session.add(CatalogMetadata(key=CATALOG_VERSION_KEY, value=version))
+    else:
+        stamp.value = version
+    return version
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogEntry:
+    id: str
+    name: str
+    description: str
+    image_url: str | None
+    rank: int
+    difficulty_id: str
+    alcohol_level_id: str
+    complexity: int
+
+    @property
+    def sort_key(self) -> tuple[int, str, str]:
+        return (self.rank, self.name, self.id)
+
+
+def build_postings(
+    links: Iterable[tuple[str, Key]], positions: dict[str, int]
+) -> dict[Key, int]:
+    """Fold ``(cocktail_id, key)`` pairs into one bitset per key, bit = rank position.
+
+    Positions are collected per key first and each bitset is built once.
+    """
+    grouped: dict[Key, list[int]] = {}
+    for cocktail_id, key in links:
+        position = positions.get(cocktail_id)
+        if position is not None:
+            grouped.setdefault(key, []).append(position)
+    size = len(positions)
+    return {key: bits_from_positions(found, size) for key, found in grouped.items()}
+
+
+class CatalogIndex:
+    """Rank-ordered cocktail summaries with a bitset per filterable attribute value.
+
+    ``search`` and ``pantry`` hold the free-text and ingredient indexes over the same
+    positions when they have been loaded.
+    """
+
+    def __init__(
+        self,
+        version: str | None,
+        entries: list[CatalogEntry],
+        vibe_links: Iterable[tuple[str, str]],
+        occasion_links: Iterable[tuple[str, str]],
+    ) -> None:
+        self.version = version
+        self.entries = sorted(entries, key=lambda entry: entry.sort_key)
+        self.sort_keys = [entry.sort_key for entry in self.entries]
+        self.positions = {entry.id: position for position, entry in enumerate(self.entries)}
+        self.all_bits = (1 << len(self.entries)) - 1
+        self.vibe_postings = build_postings(vibe_links, self.positions)
+        self.occasion_postings = build_postings(occasion_links, self.positions)
+        self.difficulty_postings = build_postings(
+            ((entry.id, entry.difficulty_id) for entry in self.entries), self.positions
+        )
+        self.alcohol_level_postings = build_postings(
+            ((entry.id, entry.alcohol_level_id) for entry in self.entries), self.positions
+        )
+        self.complexity_postings = build_postings(
+            ((entry.id, entry.complexity) for entry in self.entries), self.positions
+        )
+        self.search: SearchIndex | None = None
+        self.pantry: PantryIndex | None = None
+
+    def match(self, vibe_id: str, difficulty_id: str, occasion_id: str) -> int:
+        """Return the bitset of cocktails matching every non-empty filter."""
+        bits = self.all_bits
+        if vibe_id:
+            bits &= self.vibe_postings.get(vibe_id, 0)
+        if occasion_id:
+            bits &= self.occasion_postings.get(occasion_id, 0)
+        if difficulty_id:
+            bits &= self.difficulty_postings.get(difficulty_id, 0)
+        return bits
+
+    def seek(self, bits: int, cursor_key: CursorKey) -> int:
+        """Drop matches that sort at or before ``cursor_key`` in ``(rank, name, id)`` order."""
+        start = bisect_right(self.sort_keys, cursor_key)
+        return bits >> start << start
+
+    def slice(self, bits: int, offset: int, limit: int) -> list[CatalogEntry]:
+        return [self.entries[position] for position in islice(iter_positions(bits, offset), limit)]
+
+
+def load_catalog_index(session: Session, version: str | None) -> CatalogIndex:
+    rows = session.execute(
+        select(
+            Cocktail.id,
+            Cocktail.name,
+            Cocktail.description,
+            Cocktail.image_url,
+            Cocktail.rank,
+            Cocktail.difficulty_id,
+            Cocktail.alcohol_level_id,
+            Cocktail.complexity,
+        )
+    ).all()
+    vibe_links = session.execute(select(cocktail_vibes.c.cocktail_id, cocktail_vibes.c.vibe_id))
+    occasion_links = session.execute(
+        select(cocktail_occasions.c.cocktail_id, cocktail_occasions.c.occasion_id)
+    )
+    return CatalogIndex(
+        version=version,
+        entries=[CatalogEntry(*row) for row in rows],
+        vibe_links=vibe_links.tuples(),
+        occasion_links=occasion_links.tuples(),
+    )
+
+
+def load_content_indexes(
+    session: Session, catalog_index: CatalogIndex, search: bool, pantry: bool
+) -> None:
+    """Attach the indexes built from the JSON content columns, reading those columns once."""
+    if not (search or pantry):
+        return
+    documents = load_search_documents(session, catalog_index.positions)
+    if search:
+        catalog_index.search = SearchIndex(documents)
+    if pantry:
+        catalog_index.pantry = PantryIndex([document.ingredients for document in documents])
+
+
+class CatalogIndexManager:
+    """Tracks the catalog version stamp and reloads the live index when it changes."""
+
+    def __init__(
+        self,
+        poll_interval: float,
+        session_factory: Callable[[], Session] = create_session,
+        load_index: bool = True,
+        load_search: bool = True,
+        load_pantry: bool = True,
+    ) -> None:
+        self.version: str | None = None
+        self.index: CatalogIndex | None = None
+        self.session_factory = session_factory
+        self.load_index = load_index
+        self.load_search = load_search
+        self.load_pantry = load_pantry
+        self._refresh_lock = Lock()
+        self._task = PeriodicTask("catalog-index", poll_interval, self.refresh)
+
+    def refresh(self) -> bool:
+        """Pick up a new version stamp, reloading the index; return whether anything changed."""
+        with self._refresh_lock, self.session_factory() as session:
+            version = read_catalog_version(session)
+            index_missing = self.load_index and self.index is None
+            if version == self.version and not index_missing:
+                return False
+            if self.load_index:
+                index = load_catalog_index(session, version)
+                load_content_indexes(session, index, self.load_search, self.load_pantry)
+                self.index = index
+            self.version = version
+            return True
+
+    def start(self) -> None:
+        self._task.start()
+
+    async def stop(self) -> None:
+        await self._task.stop()
+
+
+@lru_cache(maxsize=1)
+def get_catalog_manager() -> CatalogIndexManager:
+    settings = get_settings()
+    return CatalogIndexManager(
+        poll_interval=settings.CATALOG_VERSION_POLL_SECONDS,
+        load_index=settings.CATALOG_INDEX_ENABLED,
+        load_search=settings.SEARCH_INDEX_ENABLED,
+        load_pantry=settings.PANTRY_INDEX_ENABLED,
+    )
@@ -0,0 +1,231 @@
+"""gzip/brotli response compression with a per-catalog-version cache of compressed bodies."""
+
+from __future__ import annotations
+
+import gzip
+from collections.abc import Callable
+from functools import lru_cache
+from threading import Lock
+from types import ModuleType
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.http_cache import is_catalog_path
+from app.settings import get_settings
+
+# Compression settings per encoding: responses compressed on every request favor speed; bodies
+# that are cached for the whole catalog version are compressed harder, once.
+LIVE_LEVELS = {"br": 5, "gzip": 6}
+CACHED_LEVELS = {"br": 9, "gzip": 9}
+# Bodies at least this large are compressed in a worker thread instead of the event loop.
+OFFLOAD_SIZE = 32 * 1024
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+# Catalog routes whose URLs are driven by free-form input; their bodies rarely repeat.
+FREE_FORM_PATHS = frozenset(
+    {"/cocktails/search", "/cocktails/makeable", "/cocktails/ranked", "/cocktails/details"}
+)
+
+
+def load_brotli() -> ModuleType | None:
+    """Return the ``brotli`` module when the ``brotli`` extra is installed."""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def available_encodings() -> tuple[str, ...]:
+    """Encodings this process can produce, in server preference order."""
+    return ("br", "gzip") if load_brotli() is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str, available: tuple[str, ...]) -> str | None:
+    """Pick the acceptable encoding with the highest q-value, preferring earlier ``available``."""
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip() == "q":
+            try:
+                weight = float(value)
+            except ValueError:
+                weight = 0.0
+        weights[coding] = weight
+    best, best_weight = None, 0.0
+    for encoding in available:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def compress(body: bytes, encoding: str, level: int) -> bytes:
+    if encoding == "br":
+        brotli = load_brotli()
+        if brotli is None:
+            raise RuntimeError("Install the 'brotli' extra to serve brotli responses.")
+        return brotli.compress(body, quality=level)
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+class CompressedBodyCache:
+    """Compressed bodies for the current catalog version, keyed by ``(encoding, etag)``.
+
+    The first lookup under a new version drops every body compressed for the previous one;
+    the oldest bodies are evicted once ``max_bytes`` is reached.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.size = 0
+        self._state: tuple[str | None, dict[tuple[str, str], bytes]] = (None, {})
+        self._lock = Lock()
+
+    def get(self, version: str, key: tuple[str, str]) -> bytes | None:
+        cached_version, bodies = self._state
+        body = bodies.get(key) if cached_version == version else None
+        if body is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return body
+
+    def put(self, version: str, key: tuple[str, str], body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            cached_version, bodies = self._state
+            if cached_version != version:
+                bodies = {}
+                self._state = (version, bodies)
+                self.size = 0
+            while bodies and self.size + len(body) > self.max_bytes:
+                self.size -= len(bodies.pop(next(iter(bodies))))
+            previous = bodies.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+            bodies[key] = body
+            self.size += len(body)
+
+
+@lru_cache(maxsize=1)
+def get_compressed_body_cache() -> CompressedBodyCache:
+    return CompressedBodyCache(get_settings().COMPRESSION_CACHE_MAX_BYTES)
+
+
+def is_repeatable_path(path: str) -> bool:
+    """Whether ``path`` is a list, detail or vibes URL, whose bodies are worth caching."""
+    if path in {"/vibes", "/cocktails"}:
+        return True
+    return (
+        path.startswith("/cocktails/")
+        and path.count("/") == 2
+        and path not in FREE_FORM_PATHS
+    )
+
+
+def is_compressible(message: Message) -> bool:
+    headers = MutableHeaders(raw=message.get("headers", []))
+    content_type = headers.get("content-type", "")
+    return (
+        message["status"] == 200
+        and "content-encoding" not in headers
+        and content_type.startswith(COMPRESSIBLE_TYPES)
+    )
+
+
+class CompressionMiddleware:
+    """Negotiate gzip or brotli for JSON and text responses of at least ``minimum_size`` bytes.
+
+    Responses carrying an ETag on a ``cacheable_path`` are compressed once per catalog version
+    and encoding and then served from ``cache``; everything else is compressed at the faster
+    live levels on every request. A compressed response's ETag is weakened, since it now names
+    the decoded content, which is what ``ConditionalGetMiddleware`` compares. Every catalog
+    response, 304s included, carries ``Vary: Accept-Encoding`` so shared caches keep one entry
+    per encoding. Streamed responses pass through otherwise untouched.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        cache: CompressedBodyCache | None = None,
+        version_provider: Callable[[], str | None] = lambda: None,
+        cacheable_path: Callable[[str], bool] = is_repeatable_path,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.cache = cache
+        self.version_provider = version_provider
+        self.cacheable_path = cacheable_path
+        self.encodings = available_encodings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = dict(scope["headers"]).get(b"accept-encoding", b"").decode("latin-1")
+        encoding = negotiate_encoding(accept_encoding, self.encodings)
+        cacheable = self.cache is not None and self.cacheable_path(scope["path"])
+        catalog = is_catalog_path(scope["path"])
+        start: Message | None = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                if is_compressible(message):
+                    start = message
+                    return
+                if catalog:
+                    headers = MutableHeaders(raw=list(message.get("headers", [])))
+                    headers.add_vary_header("Accept-Encoding")
+                    message = {**message, "headers": headers.raw}
+                await send(message)
+                return
+            if message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+            pending, start = start, None
+            headers = MutableHeaders(raw=list(pending.get("headers", [])))
+            headers.add_vary_header("Accept-Encoding")
+            body = message.get("body", b"")
+            if message.get("more_body") or encoding is None or len(body) < self.minimum_size:
+                await send({**pending, "headers": headers.raw})
+                await send(message)
+                return
+            etag = headers.get("etag") if cacheable else None
+            body = await self.encode(body, encoding, etag)
+            headers["content-encoding"] = encoding
+            headers["content-length"] = str(len(body))
+            if "etag" in headers and not headers["etag"].startswith("W/"):
+                headers["etag"] = f"W/{headers['etag']}"
+            await send({**pending, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
+
+    async def encode(self, body: bytes, encoding: str, etag: str | None) -> bytes:
+        version = self.version_provider() if etag is not None else None
+        if self.cache is None or etag is None or version is None:
+            return await self.run(body, encoding, LIVE_LEVELS[encoding])
+        key = (encoding, etag)
+        compressed = self.cache.get(version, key)
+        if compressed is None:
+            compressed = await self.run(body, encoding, CACHED_LEVELS[encoding])
+            self.cache.put(version, key, compressed)
+        return compressed
+
+    @staticmethod
+    async def run(body: bytes, encoding: str, level: int) -> bytes:
+        if len(body) >= OFFLOAD_SIZE:
+            return await run_in_threadpool(compress, body, encoding, level)
+        return compress(body, encoding, level)
@@ -2,27 +2,193 @@
 
 from __future__ import annotations
 
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+import time
+from threading import Lock
+
+from sqlalchemy import AsyncAdaptedQueuePool, QueuePool, create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import ConnectionPoolEntry
 
-from app.health import get_database_url
+from app.metrics import observe_pool_wait
+from app.settings import Settings, get_settings
 
 Base = declarative_base()
 
+_engines: dict[str, Engine] = {}
+_session_factories: dict[str, sessionmaker] = {}
+_pool_checkouts: dict[str, int] = {}
+_async_engines: dict[str, AsyncEngine] = {}
+_async_session_factories: dict[str, async_sessionmaker[AsyncSession]] = {}
+_engine_lock = Lock()
+
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "psycopg"}
+
+
+class CheckoutTimingMixin:
+    """Report how long each pool checkout waited for a connection."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            observe_pool_wait(time.perf_counter() - started)
+
+
+class TimedQueuePool(CheckoutTimingMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    pass
 
-def build_engine(database_url: str) -> Engine:
-    return create_engine(database_url, pool_pre_ping=True, future=True)
+
+def build_pool_options(database_url: str, settings: Settings) -> dict[str, int | float]:
+    """Return queue pool sizing options; SQLite keeps SQLAlchemy's default pool."""
+    if make_url(database_url).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+    }
+
+
+def build_engine(database_url: str, settings: Settings | None = None) -> Engine:
+    pool_options = build_pool_options(database_url, settings or get_settings())
+    pool_class = TimedQueuePool if pool_options else None
+    return create_engine(
+        database_url, pool_pre_ping=True, future=True, poolclass=pool_class, **pool_options
+    )
+
+
+def to_async_database_url(database_url: str) -> str:
+    """Swap in the async driver for a backend; psycopg serves both modes unchanged."""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    async_driver = ASYNC_DRIVERS.get(backend)
+    if async_driver is None or url.get_driver_name() == async_driver:
+        return database_url
+    return url.set(drivername=f"{backend}+{async_driver}").render_as_string(hide_password=False)
+
+
+def build_async_engine(database_url: str, settings: Settings | None = None) -> AsyncEngine:
+    pool_options = build_pool_options(database_url, settings or get_settings())
+    pool_class = TimedAsyncAdaptedQueuePool if pool_options else None
+    return create_async_engine(
+        to_async_database_url(database_url),
+        pool_pre_ping=True,
+        poolclass=pool_class,
+        **pool_options,
+    )
 
 
 def resolve_database_url(database_url: str | None = None) -> str:
-    resolved_url = database_url or get_database_url()
+    resolved_url = database_url or get_settings().DATABASE_URL
     if not resolved_url:
         raise ValueError("DATABASE_URL is required for database access.")
     return resolved_url
 
 
+def track_pool_checkouts(engine: Engine, database_url: str) -> None:
+    _pool_checkouts[database_url] = 0
+
+    def count_checkout(*_: object) -> None:
+        _pool_checkouts[database_url] += 1
+
+    event.listen(engine, "checkout", count_checkout)
+
+
+def get_engine(database_url: str | None = None) -> Engine:
+    """Return the process-wide engine for a database URL, creating it on first use."""
+    resolved_url = resolve_database_url(database_url)
+    engine = _engines.get(resolved_url)
+    if engine is not None:
+        return engine
+    with _engine_lock:
+        engine = _engines.get(resolved_url)
+        if engine is None:
+            engine = build_engine(resolved_url)
+            track_pool_checkouts(engine, resolved_url)
+            _session_factories[resolved_url] = sessionmaker(bind=engine, future=True)
+            _engines[resolved_url] = engine
+    return engine
+
+
+def get_session_factory(database_url: str | None = None) -> sessionmaker:
+    resolved_url = resolve_database_url(database_url)
+    get_engine(resolved_url)
+    return _session_factories[resolved_url]
+
+
 def create_session(database_url: str | None = None) -> Session:
-    engine = build_engine(resolve_database_url(database_url))
-    session_factory = sessionmaker(bind=engine, future=True)
-    return session_factory()
+    return get_session_factory(database_url)()
+
+
+def get_async_engine(database_url: str | None = None) -> AsyncEngine:
+    """Return the process-wide async engine for a database URL, creating it on first use."""
+    resolved_url = resolve_database_url(database_url)
+    engine = _async_engines.get(resolved_url)
+    if engine is not None:
+        return engine
+    with _engine_lock:
+        engine = _async_engines.get(resolved_url)
+        if engine is None:
+            engine = build_async_engine(resolved_url)
+            _async_session_factories[resolved_url] = async_sessionmaker(
+                bind=engine, expire_on_commit=False
+            )
+            _async_engines[resolved_url] = engine
+    return engine
+
+
+def create_async_session(database_url: str | None = None) -> AsyncSession:
+    resolved_url = resolve_database_url(database_url)
+    get_async_engine(resolved_url)
+    return _async_session_factories[resolved_url]()
+
+
+def dispose_engines() -> None:
+    """Close every pooled connection and forget the cached engines."""
+    with _engine_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+        _session_factories.clear()
+        _pool_checkouts.clear()
+
+
+async def dispose_async_engines() -> None:
+    with _engine_lock:
+        engines = list(_async_engines.values())
+        _async_engines.clear()
+        _async_session_factories.clear()
+    for engine in engines:
+        await engine.dispose()
+
+
+def get_pool_stats() -> list[dict[str, object]]:
+    """Return checkout and occupancy figures for each process-wide pool."""
+    stats: list[dict[str, object]] = []
+    for database_url, engine in list(_engines.items()):
+        pool = engine.pool
+        stats.append(
+            {
+                "database": make_url(database_url).render_as_string(hide_password=True),
+                "pool": type(pool).__name__,
+                "size": getattr(pool, "size", lambda: None)(),
+                "checkedIn": getattr(pool, "checkedin", lambda: None)(),
+                "checkedOut": getattr(pool, "checkedout", lambda: None)(),
+                "overflow": getattr(pool, "overflow", lambda: None)(),
+                "checkouts": _pool_checkouts.get(database_url, 0),
+            }
+        )
+    return stats
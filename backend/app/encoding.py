@@ -0,0 +1,73 @@
+"""orjson encoding helpers and a version-scoped cache of pre-encoded JSON fragments."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from threading import Lock
+from typing import Any
+
+import orjson
+from starlette.responses import Response
+
+from app.settings import get_settings
+
+
+def dumps(value: Any) -> bytes:
+    return orjson.dumps(value)
+
+
+def encode_array(fragments: Iterable[bytes]) -> bytes:
+    return b"[" + b",".join(fragments) + b"]"
+
+
+def encode_object(fields: dict[str, bytes]) -> bytes:
+    """Join already-encoded values into one JSON object, keeping the given key order."""
+    return b"{" + b",".join(dumps(name) + b":" + value for name, value in fields.items()) + b"}"
+
+
+class EncodedJSONResponse(Response):
+    """A response whose body is JSON that has already been encoded."""
+
+    media_type = "application/json"
+
+
+class FragmentCache:
+    """Encoded JSON fragments for the current catalog version.
+
+    Fragments are keyed by ``(kind, id)``; the first lookup under a new version drops every
+    fragment built for the previous one. Without a version nothing is cached.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._state: tuple[str | None, dict[tuple[str, str], bytes]] = (None, {})
+        self._lock = Lock()
+
+    def get(self, version: str | None, kind: str, key: str, build: Callable[[], Any]) -> bytes:
+        cached_version, fragments = self._state
+        if version is not None and version == cached_version:
+            fragment = fragments.get((kind, key))
+            if fragment is not None:
+                self.hits += 1
+                return fragment
+        self.misses += 1
+        fragment = dumps(build())
+        if version is None or self.max_entries <= 0:
+            return fragment
+        with self._lock:
+            cached_version, fragments = self._state
+            if cached_version != version:
+                fragments = {}
+                self._state = (version, fragments)
+            if len(fragments) >= self.max_entries:
+                del fragments[next(iter(fragments))]
+            fragments[(kind, key)] = fragment
+        return fragment
+
+
+@lru_cache(maxsize=1)
+def get_fragment_cache() -> FragmentCache:
+    return FragmentCache(get_settings().FRAGMENT_CACHE_MAX_ENTRIES)
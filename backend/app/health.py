@@ -1,28 +1,94 @@
 """Health check utilities for the API."""
 
+from __future__ import annotations
+
+import math
 import socket
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import lru_cache
+from threading import Lock
 from urllib.parse import urlparse
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import Engine, QueuePool, create_engine, make_url, text
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.background import PeriodicTask
 from app.settings import get_settings
 
+_probe_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="health-probe")
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    ok: bool
+    latency_ms: float
+    timed_out: bool = False
+
+
+@dataclass(frozen=True)
+class HealthSnapshot:
+    results: dict[str, ProbeResult]
+    checked_at: float
+
+    def statuses(self) -> dict[str, bool]:
+        return {name: result.ok for name, result in self.results.items()}
+
+    def age_seconds(self) -> float:
+        return time.monotonic() - self.checked_at
+
+    def is_stale(self, max_age: float) -> bool:
+        return self.age_seconds() > max_age
+
 
 def get_database_url() -> str | None:
     return get_settings().DATABASE_URL
 
 
-def run_database_probe(database_url: str) -> bool:
-    engine = create_engine(database_url, pool_pre_ping=True)
+def build_probe_connect_args(database_url: str, timeout: float) -> dict[str, object]:
+    """Driver options that bound how long a probe may wait to connect and to run its query."""
+    backend = make_url(database_url).get_backend_name()
+    if backend == "postgresql":
+        return {
+            "connect_timeout": max(1, math.ceil(timeout)),
+            "options": f"-c statement_timeout={math.ceil(timeout * 1000)}",
+        }
+    if backend == "sqlite":
+        return {"timeout": timeout}
+    return {}
+
+
+@lru_cache(maxsize=8)
+def get_probe_engine(database_url: str, timeout: float) -> Engine:
+    """Return a one-connection engine for probes that keeps its connection between probes.
+
+    The application pool's checkout timeout is sized for requests, so probes get their own
+    single-slot pool that waits at most ``timeout`` for its connection. The driver gives up
+    connecting or querying after the same bound, so a hung database cannot pin the
+    ``_probe_executor`` workers.
+    """
+    return create_engine(
+        database_url,
+        future=True,
+        poolclass=QueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=timeout,
+        pool_pre_ping=True,
+        connect_args=build_probe_connect_args(database_url, timeout),
+    )
+
+
+def run_database_probe(database_url: str, timeout: float | None = None) -> bool:
+    resolved_timeout = timeout or get_settings().HEALTH_PROBE_TIMEOUT_SECONDS
     try:
-        with engine.connect() as connection:
+        with get_probe_engine(database_url, resolved_timeout).connect() as connection:
             connection.execute(text("SELECT 1"))
         return True
     except (SQLAlchemyError, OSError):
         return False
-    finally:
-        engine.dispose()
 
 
 def check_database(database_url: str | None = None) -> bool:
@@ -37,14 +103,15 @@ def get_cache_url() -> str | None:
     return settings.REDIS_URL or settings.CACHE_URL
 
 
-def can_connect_to_cache(cache_url: str) -> bool:
+def can_connect_to_cache(cache_url: str, timeout: float | None = None) -> bool:
     parsed = urlparse(cache_url)
     host = parsed.hostname
     port = parsed.port or (6379 if parsed.scheme in {"redis", "rediss"} else None)
     if not host or not port:
         return False
+    resolved_timeout = timeout or get_settings().HEALTH_PROBE_TIMEOUT_SECONDS
     try:
-        with socket.create_connection((host, port), timeout=2):
+        with socket.create_connection((host, port), timeout=resolved_timeout):
             return True
     except OSError:
         return False
@@ -57,12 +124,110 @@ def check_cache(cache_url: str | None = None) -> bool:
     return can_connect_to_cache(resolved_url)
 
 
+def get_dependency_checks() -> dict[str, Callable[[], bool]]:
+    return {"database": check_database, "cache": check_cache}
+
+
+def run_probe(check: Callable[[], bool]) -> ProbeResult:
+    started = time.perf_counter()
+    ok = check()
+    return ProbeResult(ok=ok, latency_ms=(time.perf_counter() - started) * 1000)
+
+
+def collect_probe_results(timeout: float) -> dict[str, ProbeResult]:
+    """Run every dependency probe concurrently, failing any that exceed the timeout."""
+    futures = {
+        name: _probe_executor.submit(run_probe, check)
+        for name, check in get_dependency_checks().items()
+    }
+    done, _ = wait(futures.values(), timeout=timeout)
+    results: dict[str, ProbeResult] = {}
+    for name, future in futures.items():
+        if future in done and future.exception() is None:
+            results[name] = future.result()
+        elif future in done:
+            results[name] = ProbeResult(ok=False, latency_ms=0.0)
+        else:
+            results[name] = ProbeResult(ok=False, latency_ms=timeout * 1000, timed_out=True)
+    return results
+
+
+class HealthMonitor:
+    """Caches the latest probe results and refreshes them on a background schedule."""
+
+    def __init__(self, interval: float, max_age: float, timeout: float) -> None:
+        self.interval = interval
+        self.max_age = max_age
+        self.timeout = timeout
+        self._snapshot: HealthSnapshot | None = None
+        self._refresh_lock = Lock()
+        self._task = PeriodicTask("health-monitor", interval, self.refresh)
+
+    def refresh(self) -> HealthSnapshot:
+        with self._refresh_lock:
+            return self._probe()
+
+    def snapshot(self) -> HealthSnapshot:
+        """Return the cached snapshot without waiting on probes whenever one exists.
+
+        While the background task runs, a stale snapshot is returned as is and the task replaces
+        it. Without the task, one caller probes inline and concurrent callers reuse its result.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and (not snapshot.is_stale(self.max_age) or self._task.running):
+            return snapshot
+        with self._refresh_lock:
+            snapshot = self._snapshot
+            if snapshot is not None and not snapshot.is_stale(self.max_age):
+                return snapshot
+            return self._probe()
+
+    def _probe(self) -> HealthSnapshot:
+        snapshot = HealthSnapshot(
+            results=collect_probe_results(self.timeout),
+            checked_at=time.monotonic(),
+        )
+        self._snapshot = snapshot
+        return snapshot
+
+    def start(self) -> None:
+        self._task.start()
+
+    async def stop(self) -> None:
+        await self._task.stop()
+
+
+@lru_cache(maxsize=1)
+def get_health_monitor() -> HealthMonitor:
+    settings = get_settings()
+    return HealthMonitor(
+        interval=settings.HEALTH_CHECK_INTERVAL_SECONDS,
+        max_age=settings.HEALTH_CHECK_MAX_AGE_SECONDS,
+        timeout=settings.HEALTH_PROBE_TIMEOUT_SECONDS,
+    )
+
+
 def get_dependency_statuses() -> dict[str, bool]:
-    dependency_checks = {"database": check_database, "cache": check_cache}
-    return {name: check() for name, check in dependency_checks.items()}
+    return get_health_monitor().snapshot().statuses()
 
 
 def get_overall_status(dependency_statuses: dict[str, bool]) -> dict[str, str]:
     is_healthy = all(dependency_statuses.values())
     status = "ok" if is_healthy else "degraded"
     return {"status": status}
+
+
+def serialize_health_snapshot(snapshot: HealthSnapshot, max_age: float) -> dict[str, object]:
+    return {
+        **get_overall_status(snapshot.statuses()),
+        "ageSeconds": round(snapshot.age_seconds(), 3),
+        "stale": snapshot.is_stale(max_age),
+        "dependencies": {
+            name: {
+                "ok": result.ok,
+                "latencyMs": round(result.latency_ms, 3),
+                "timedOut": result.timed_out,
+            }
+            for name, result in snapshot.results.items()
+        },
+    }
@@ -0,0 +1,92 @@
+"""Conditional GET and Cache-Control headers for catalog responses."""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+def is_catalog_path(path: str) -> bool:
+    return path in {"/vibes", "/cocktails"} or path.startswith("/cocktails/")
+
+
+def build_etag(version: str, path: str, query_string: bytes) -> str:
+    """Return a strong ETag for one catalog URL at one catalog version."""
+    target = hashlib.sha1(path.encode() + b"?" + query_string).hexdigest()[:16]
+    return f'"{version}-{target}"'
+
+
+def parse_if_none_match(if_none_match: str | None) -> set[str]:
+    if not if_none_match:
+        return set()
+    return {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether ``If-None-Match`` lists ``etag``; the ``*`` wildcard is not a match here."""
+    return etag in parse_if_none_match(if_none_match)
+
+
+def build_cache_control(max_age: int, stale_while_revalidate: int) -> str:
+    return f"public, max-age={max_age}, stale-while-revalidate={stale_while_revalidate}"
+
+
+class ConditionalGetMiddleware:
+    """Tag catalog responses with the catalog version and answer revalidations with 304.
+
+    A matching ``If-None-Match`` is answered before the route runs, so it costs no query.
+    ``If-None-Match: *`` only matches a resource that exists, so the route runs first and a
+    ``200`` is turned into a ``304``; a ``404`` passes through.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        version_provider: Callable[[], str | None],
+        cache_control: str,
+    ) -> None:
+        self.app = app
+        self.version_provider = version_provider
+        self.cache_control = cache_control
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not is_catalog_path(scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+        version = self.version_provider()
+        if version is None:
+            await self.app(scope, receive, send)
+            return
+
+        etag = build_etag(version, scope["path"], scope["query_string"])
+        validators = [(b"etag", etag.encode()), (b"cache-control", self.cache_control.encode())]
+        if_none_match = dict(scope["headers"]).get(b"if-none-match")
+        candidates = parse_if_none_match(if_none_match.decode("latin-1") if if_none_match else None)
+        if etag in candidates:
+            await send({"type": "http.response.start", "status": 304, "headers": validators})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        any_etag = "*" in candidates
+        not_modified = False
+
+        async def send_with_validators(message: Message) -> None:
+            nonlocal not_modified
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                if any_etag:
+                    not_modified = True
+                    message = {"type": "http.response.start", "status": 304, "headers": validators}
+                else:
+                    message = {**message, "headers": [*message.get("headers", []), *validators]}
+            elif message["type"] == "http.response.body" and not_modified:
+                if message.get("more_body"):
+                    return
+                message = {"type": "http.response.body", "body": b""}
+            await send(message)
+
+        await self.app(scope, receive, send_with_validators)
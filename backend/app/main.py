@@ -1,19 +1,177 @@
 """FastAPI application entrypoint for Vibe & Sip API."""
 
-from fastapi import FastAPI, HTTPException, Query
-from sqlalchemy import func, select
+import base64
+import binascii
+import itertools
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Sequence
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
+from functools import cache, partial
+from typing import Annotated, Any
+
+from fastapi import APIRouter, FastAPI, HTTPException, Query
+from fastapi.responses import JSONResponse, ORJSONResponse, PlainTextResponse
+from sqlalchemy import Row, func, select
 import sqlalchemy as sa
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import configure_mappers, undefer_group
 
-from app.db import create_session
-from app.health import get_dependency_statuses, get_overall_status
-from app.models import Cocktail, Occasion, Vibe
+from app.cache import get_response_cache
+from app.catalog import CatalogEntry, CatalogIndex, CursorKey, get_catalog_manager
+from app.compression import CompressionMiddleware, get_compressed_body_cache
+from app.db import (
+    create_async_session,
+    create_session,
+    dispose_async_engines,
+    dispose_engines,
+    get_async_engine,
+    get_engine,
+    get_pool_stats,
+)
+from app.encoding import (
+    EncodedJSONResponse,
+    dumps,
+    encode_array,
+    encode_object,
+    get_fragment_cache,
+)
+from app.health import (
+    get_database_url,
+    get_dependency_statuses,
+    get_health_monitor,
+    get_overall_status,
+    serialize_health_snapshot,
+)
+from app.http_cache import ConditionalGetMiddleware, build_cache_control
+from app.metrics import (
+    MetricsMiddleware,
+    install_query_instrumentation,
+    registry,
+    render_counter,
+    render_metrics,
+)
+from app.models import (
+    COCKTAIL_DETAIL_GROUP,
+    Cocktail,
+    Occasion,
+    Vibe,
+    cocktail_occasions,
+    cocktail_vibes,
+)
+from app.pantry import MAX_MISSING
+from app.query_budget import QueryBudgetMiddleware, route_query_budget
+from app.ranking import RankingQuery, rank_cocktails
+from app.settings import get_settings
+from app.warmup import (
+    WarmupStep,
+    get_warmup,
+    preconnect_async_pool,
+    preconnect_pool,
+    serialize_warmup,
+)
 
 DEFAULT_PAGE = 1
 DEFAULT_LIMIT = 12
 DEFAULT_DIFFICULTY = "difficulty-balanced"
+DETAIL_OPTIONS = [undefer_group(COCKTAIL_DETAIL_GROUP)]
+# Filter value the warm-up uses to run the filtered statement shapes; it matches no row.
+WARMUP_FILTER_ID = "warmup"
+
+CocktailSummary = Row | CatalogEntry
+# Which of vibe, difficulty and occasion a list request filters on.
+CocktailFilterShape = tuple[bool, bool, bool]
+PAGING_WITH_TOTAL = "total"
+PAGING_WITH_NEXT = "next"
+PAGING_AFTER_CURSOR = "cursor"
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    settings = get_settings()
+    catalog_manager = get_catalog_manager()
+    if get_database_url():
+        get_engine()
+        catalog_manager.start()
+    health_monitor = get_health_monitor()
+    health_monitor.start()
+    warmup = get_warmup()
+    if settings.WARMUP_ENABLED:
+        warmup.start(build_warmup_steps(settings.DB_ASYNC))
+    else:
+        warmup.skip()
+    try:
+        yield
+    finally:
+        await warmup.stop()
+        await health_monitor.stop()
+        await catalog_manager.stop()
+        dispose_engines()
+        await dispose_async_engines()
+
+
+def current_catalog_version() -> str | None:
+    return get_catalog_manager().version
+
 
-app = FastAPI(title="Vibe & Sip API")
+def collect_cache_metrics() -> Iterator[str]:
+    response_cache = get_response_cache()
+    fragment_cache = get_fragment_cache()
+    compressed_cache = get_compressed_body_cache()
+    samples = [
+        (("fragment", "hit"), fragment_cache.hits),
+        (("fragment", "miss"), fragment_cache.misses),
+        (("compressed", "hit"), compressed_cache.hits),
+        (("compressed", "miss"), compressed_cache.misses),
+    ]
+    statement_infos = [
+        statements.cache_info()
+        for statements in (get_cocktails_page_statement, get_cocktails_count_statement)
+    ]
+    samples += [
+        (("statement", "hit"), sum(info.hits for info in statement_infos)),
+        (("statement", "miss"), sum(info.misses for info in statement_infos)),
+    ]
+    if response_cache is not None:
+        samples += [
+            (("response", "hit"), response_cache.hits),
+            (("response", "miss"), response_cache.misses),
+        ]
+    return render_counter(
+        "cache_requests_total", "Response cache lookups by result.", ("cache", "result"), samples
+    )
+
+
+app = FastAPI(
+    title="Vibe & Sip API", lifespan=lifespan, default_response_class=ORJSONResponse
+)
+app.add_middleware(
+    ConditionalGetMiddleware,
+    version_provider=current_catalog_version,
+    cache_control=build_cache_control(
+        get_settings().CATALOG_CACHE_MAX_AGE_SECONDS,
+        get_settings().CATALOG_STALE_WHILE_REVALIDATE_SECONDS,
+    ),
+)
+if get_settings().COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=get_settings().COMPRESSION_MINIMUM_SIZE,
+        cache=get_compressed_body_cache(),
+        version_provider=current_catalog_version,
+    )
+if get_settings().QUERY_BUDGET_ENABLED:
+    app.add_middleware(
+        QueryBudgetMiddleware,
+        strict=get_settings().QUERY_BUDGET_STRICT,
+        repeat_threshold=get_settings().QUERY_REPEAT_THRESHOLD,
+    )
+if get_settings().METRICS_ENABLED:
+    install_query_instrumentation()
+    registry.add_collector(collect_cache_metrics)
+    app.add_middleware(MetricsMiddleware)
+sync_router = APIRouter()
+async_router = APIRouter()
 
 
 def serialize_vibe(vibe: Vibe) -> dict[str, str | None | list[str]]:
@@ -26,7 +184,7 @@ def serialize_vibe(vibe: Vibe) -> dict[str, str | None | list[str]]:
     }
 
 
-def serialize_cocktail(cocktail: Cocktail) -> dict[str, str | None]:
+def serialize_cocktail(cocktail: CocktailSummary) -> dict[str, str | None]:
     return {
         "id": cocktail.id,
         "name": cocktail.name,
@@ -59,7 +217,110 @@ def resolve_page(value: int) -> int:
 
 
 def resolve_limit(value: int) -> int:
-    return value if value > 0 else DEFAULT_LIMIT
+    return min(value, get_settings().COCKTAILS_MAX_LIMIT) if value > 0 else DEFAULT_LIMIT
+
+
+def parse_cocktail_ids(ids: str) -> list[str]:
+    """Split a comma-separated ``ids`` parameter, dropping blanks and repeats but keeping order."""
+    cocktail_ids = list(dict.fromkeys(part.strip() for part in ids.split(",") if part.strip()))
+    if not cocktail_ids:
+        raise HTTPException(status_code=400, detail="At least one cocktail id is required.")
+    max_ids = get_settings().COCKTAIL_DETAILS_MAX_IDS
+    if len(cocktail_ids) > max_ids:
+        raise HTTPException(
+            status_code=400, detail=f"At most {max_ids} cocktail ids can be requested at once."
+        )
+    return cocktail_ids
+
+
+def encode_cursor(cocktail: CocktailSummary) -> str:
+    raw = json.dumps([cocktail.rank, cocktail.name, cocktail.id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None) -> CursorKey | None:
+    """Decode a ``cursor`` parameter: ``None`` selects page mode, ``""`` the first keyset page."""
+    if cursor is None:
+        return None
+    if not cursor:
+        return ()
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        rank, name, cocktail_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError, binascii.Error) as error:
+        raise HTTPException(status_code=400, detail="Invalid cursor.") from error
+    if not (isinstance(rank, int) and isinstance(name, str) and isinstance(cocktail_id, str)):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+    return (rank, name, cocktail_id)
+
+
+def build_vibes_query(occasion_id: str = ""):
+    """Vibes by name; with an occasion, vibes sharing the most cocktails with it come first."""
+    if not occasion_id:
+        return select(Vibe).order_by(Vibe.name)
+    pairings = (
+        select(func.count())
+        .select_from(
+            cocktail_vibes.join(
+                cocktail_occasions,
+                cocktail_occasions.c.cocktail_id == cocktail_vibes.c.cocktail_id,
+            )
+        )
+        .where(cocktail_vibes.c.vibe_id == Vibe.id)
+        .where(cocktail_occasions.c.occasion_id == occasion_id)
+        .scalar_subquery()
+    )
+    return select(Vibe).order_by(pairings.desc(), Vibe.name)
+
+
+# Everything a list item or its cursor needs; rows stay plain tuples and the JSON detail
+# columns are never read on the list path.
+COCKTAIL_SUMMARY_COLUMNS = (
+    Cocktail.id,
+    Cocktail.name,
+    Cocktail.description,
+    Cocktail.image_url,
+    Cocktail.rank,
+)
+
+
+def filter_cocktails_query(query, shape: CocktailFilterShape):
+    """Join and filter on each filter the shape has, leaving its value as a bound parameter."""
+    has_vibe, has_difficulty, has_occasion = shape
+    if has_vibe:
+        query = query.join(Cocktail.vibes).where(Vibe.id == sa.bindparam("vibe_id"))
+
+    if has_occasion:
+        query = query.join(Cocktail.occasions).where(Occasion.id == sa.bindparam("occasion_id"))
+
+    if has_difficulty:
+        query = query.where(Cocktail.difficulty_id == sa.bindparam("difficulty_id"))
+
+    return query
+
+
+def build_filter_values(vibe_id: str, difficulty_id: str, occasion_id: str) -> dict[str, str]:
+    """Bound values for the filters that are set; unset filters drop out of the statement."""
+    values = {"vibe_id": vibe_id, "difficulty_id": difficulty_id, "occasion_id": occasion_id}
+    return {name: value for name, value in values.items() if value}
+
+
+def get_filter_shape(filter_values: dict[str, str]) -> CocktailFilterShape:
+    return (
+        "vibe_id" in filter_values,
+        "difficulty_id" in filter_values,
+        "occasion_id" in filter_values,
+    )
+
+
+def build_cocktails_shape_query(shape: CocktailFilterShape):
+    query = filter_cocktails_query(select(*COCKTAIL_SUMMARY_COLUMNS), shape)
+    return query.order_by(Cocktail.rank.asc(), Cocktail.name.asc(), Cocktail.id.asc())
+
+
+def build_cocktails_count_shape_query(shape: CocktailFilterShape):
+    query = select(func.count(sa.distinct(Cocktail.id))).select_from(Cocktail)
+    return filter_cocktails_query(query, shape)
 
 
 def build_cocktails_query(
@@ -67,18 +328,8 @@ def build_cocktails_query(
     difficulty_id: str,
     occasion_id: str,
 ):
-    query = select(Cocktail)
-
-    if vibe_id:
-        query = query.join(Cocktail.vibes).where(Vibe.id == vibe_id)
-
-    if occasion_id:
-        query = query.join(Cocktail.occasions).where(Occasion.id == occasion_id)
-
-    if difficulty_id:
-        query = query.where(Cocktail.difficulty_id == difficulty_id)
-
-    return query.order_by(Cocktail.rank.asc(), Cocktail.name.asc())
+    filter_values = build_filter_values(vibe_id, difficulty_id, occasion_id)
+    return build_cocktails_shape_query(get_filter_shape(filter_values)).params(filter_values)
 
 
 def build_cocktails_count_query(
@@ -86,18 +337,321 @@ def build_cocktails_count_query(
     difficulty_id: str,
     occasion_id: str,
 ):
-    query = select(func.count(sa.distinct(Cocktail.id))).select_from(Cocktail)
+    filter_values = build_filter_values(vibe_id, difficulty_id, occasion_id)
+    return build_cocktails_count_shape_query(get_filter_shape(filter_values)).params(
+        filter_values
+    )
 
-    if vibe_id:
-        query = query.join(Cocktail.vibes).where(Vibe.id == vibe_id)
 
-    if occasion_id:
-        query = query.join(Cocktail.occasions).where(Occasion.id == occasion_id)
+def build_cocktail_details_query(cocktail_ids: Sequence[str]):
+    return (
+        select(Cocktail)
+        .where(Cocktail.id.in_(cocktail_ids))
+        .options(*DETAIL_OPTIONS)
+    )
 
-    if difficulty_id:
-        query = query.where(Cocktail.difficulty_id == difficulty_id)
 
-    return query
+@dataclass(frozen=True)
+class CocktailListParams:
+    vibe_id: str
+    difficulty_id: str
+    occasion_id: str
+    page: int
+    limit: int
+    cursor_key: CursorKey | None
+    include_total: bool
+
+    @property
+    def offset(self) -> int:
+        return (self.page - 1) * self.limit
+
+    @property
+    def counts_total(self) -> bool:
+        return self.cursor_key is None and self.include_total
+
+    @property
+    def paging(self) -> str:
+        if self.cursor_key:
+            return PAGING_AFTER_CURSOR
+        return PAGING_WITH_TOTAL if self.counts_total else PAGING_WITH_NEXT
+
+    def filter_values(self) -> dict[str, str]:
+        return build_filter_values(self.vibe_id, self.difficulty_id, self.occasion_id)
+
+    def cache_params(self) -> dict[str, object]:
+        return {
+            "vibe": self.vibe_id,
+            "difficulty": self.difficulty_id,
+            "occasion": self.occasion_id,
+            "page": self.page,
+            "limit": self.limit,
+            "cursor": self.cursor_key,
+            "includeTotal": self.include_total,
+        }
+
+
+@cache
+def get_cocktails_page_statement(shape: CocktailFilterShape, paging: str):
+    """Build the page statement for one filter shape and paging mode, once per process.
+
+    Filters, cursor, offset and limit are all bound parameters, so the statement object and
+    its memoized cache key are reused by every request of that shape. Pages with a total carry
+    it as a window count; the others fetch one extra row so the response knows whether more
+    exist.
+    """
+    query = build_cocktails_shape_query(shape)
+    limit = sa.bindparam("limit", type_=sa.Integer)
+    if paging == PAGING_AFTER_CURSOR:
+        cursor = sa.tuple_(
+            sa.bindparam("cursor_rank", type_=sa.Integer),
+            sa.bindparam("cursor_name", type_=sa.String),
+            sa.bindparam("cursor_id", type_=sa.String),
+        )
+        return query.where(sa.tuple_(Cocktail.rank, Cocktail.name, Cocktail.id) > cursor).limit(
+            limit
+        )
+    if paging == PAGING_WITH_TOTAL:
+        query = query.add_columns(func.count().over().label("total"))
+    return query.offset(sa.bindparam("offset", type_=sa.Integer)).limit(limit)
+
+
+@cache
+def get_cocktails_count_statement(shape: CocktailFilterShape):
+    return build_cocktails_count_shape_query(shape)
+
+
+def bind_cocktails_page(params: CocktailListParams) -> tuple[Any, dict[str, object]]:
+    """Return the prebuilt statement for a page and the values to execute it with."""
+    filter_values = params.filter_values()
+    statement = get_cocktails_page_statement(get_filter_shape(filter_values), params.paging)
+    values: dict[str, object] = {**filter_values, "limit": params.limit + 1}
+    if params.paging == PAGING_AFTER_CURSOR:
+        rank, name, cocktail_id = params.cursor_key
+        values.update(cursor_rank=rank, cursor_name=name, cursor_id=cocktail_id)
+    elif params.paging == PAGING_WITH_TOTAL:
+        values.update(limit=params.limit, offset=params.offset)
+    else:
+        # An empty cursor starts a keyset walk at the first row, whatever the page.
+        values["offset"] = 0 if params.cursor_key is not None else params.offset
+    return statement, values
+
+
+def build_cocktails_statement(params: CocktailListParams):
+    """Return one page's statement with its values bound in, for use outside a session."""
+    statement, values = bind_cocktails_page(params)
+    return statement.params(values)
+
+
+def bind_cocktails_count(params: CocktailListParams) -> tuple[Any, dict[str, str]]:
+    filter_values = params.filter_values()
+    return get_cocktails_count_statement(get_filter_shape(filter_values)), filter_values
+
+
+def split_cocktail_rows(rows: Sequence[Row]) -> tuple[list[Row], int | None]:
+    total = rows[0].total if rows and "total" in rows[0]._fields else None
+    return list(rows), total
+
+
+def encode_cocktail_summary(cocktail: CocktailSummary, version: str | None) -> bytes:
+    return get_fragment_cache().get(
+        version, "summary", cocktail.id, partial(serialize_cocktail, cocktail)
+    )
+
+
+def encode_cocktail_detail(cocktail: Cocktail, version: str | None) -> bytes:
+    return get_fragment_cache().get(
+        version, "detail", cocktail.id, partial(serialize_cocktail_detail, cocktail)
+    )
+
+
+def build_cocktails_payload(
+    results: Sequence[CocktailSummary],
+    page: int | None,
+    limit: int,
+    total: int | None,
+    next_cursor: str | None = None,
+    version: str | None = None,
+) -> bytes:
+    """Encode a list page by joining each cocktail's cached summary fragment."""
+    return encode_object(
+        {
+            "items": encode_array(encode_cocktail_summary(item, version) for item in results),
+            "page": dumps(page),
+            "limit": dumps(limit),
+            "total": dumps(total),
+            "nextCursor": dumps(next_cursor),
+        }
+    )
+
+
+def build_cocktails_page_payload(
+    results: Sequence[CocktailSummary],
+    params: CocktailListParams,
+    total: int | None,
+    version: str | None,
+) -> bytes:
+    page = params.page if params.cursor_key is None else None
+    if params.counts_total:
+        has_more = params.offset + len(results) < (total or 0)
+        next_cursor = encode_cursor(results[-1]) if has_more else None
+        return build_cocktails_payload(
+            results, page, params.limit, total or 0, next_cursor, version
+        )
+    has_more = len(results) > params.limit
+    next_cursor = encode_cursor(results[params.limit - 1]) if has_more else None
+    return build_cocktails_payload(
+        results[: params.limit], page, params.limit, None, next_cursor, version
+    )
+
+
+def list_cocktails_from_index(catalog_index: CatalogIndex, params: CocktailListParams) -> bytes:
+    matches = catalog_index.match(params.vibe_id, params.difficulty_id, params.occasion_id)
+    version = catalog_index.version
+    if params.counts_total:
+        results = catalog_index.slice(matches, params.offset, params.limit)
+        return build_cocktails_page_payload(results, params, matches.bit_count(), version)
+    if params.cursor_key is not None:
+        matches = catalog_index.seek(matches, params.cursor_key)
+        results = catalog_index.slice(matches, 0, params.limit + 1)
+    else:
+        results = catalog_index.slice(matches, params.offset, params.limit + 1)
+    return build_cocktails_page_payload(results, params, None, version)
+
+
+def build_cocktail_details_payload(
+    cocktails: Sequence[Cocktail], cocktail_ids: Sequence[str], version: str | None
+) -> bytes:
+    """Encode details in the requested order, listing ids that matched no cocktail."""
+    by_id = {cocktail.id: cocktail for cocktail in cocktails}
+    return encode_object(
+        {
+            "items": encode_array(
+                encode_cocktail_detail(by_id[cocktail_id], version)
+                for cocktail_id in cocktail_ids
+                if cocktail_id in by_id
+            ),
+            "missing": dumps(
+                [cocktail_id for cocktail_id in cocktail_ids if cocktail_id not in by_id]
+            ),
+        }
+    )
+
+
+def parse_multi_value(values: Sequence[str]) -> tuple[str, ...]:
+    """Accept repeated and comma-separated query values, dropping blanks and repeats."""
+    return tuple(
+        dict.fromkeys(part.strip() for value in values for part in value.split(",") if part.strip())
+    )
+
+
+def build_ranking_query(
+    vibe: Sequence[str],
+    occasion: Sequence[str],
+    alcohol_level: Sequence[str],
+    difficulty: str,
+    min_complexity: int | None,
+    max_complexity: int | None,
+) -> RankingQuery:
+    return RankingQuery(
+        vibe_ids=parse_multi_value(vibe),
+        occasion_ids=parse_multi_value(occasion),
+        alcohol_level_ids=parse_multi_value(alcohol_level),
+        difficulty_id=difficulty,
+        min_complexity=min_complexity,
+        max_complexity=max_complexity,
+    )
+
+
+def encode_annotated_summary(
+    entry: CatalogEntry, version: str | None, annotations: dict[str, object]
+) -> bytes:
+    """Prefix the cached summary fragment with per-request fields."""
+    fields = b"".join(
+        dumps(name) + b":" + dumps(value) + b"," for name, value in annotations.items()
+    )
+    return b"{" + fields + encode_cocktail_summary(entry, version)[1:]
+
+
+def encode_ranked_item(entry: CatalogEntry, score: float, version: str | None) -> bytes:
+    return encode_annotated_summary(entry, version, {"score": score})
+
+
+def require_catalog_index() -> CatalogIndex:
+    catalog_index = get_catalog_manager().index
+    if catalog_index is None:
+        raise HTTPException(status_code=503, detail="The catalog index is not loaded.")
+    return catalog_index
+
+
+def rank_cocktails_from_index(query: RankingQuery, page: int, limit: int) -> bytes:
+    catalog_index = require_catalog_index()
+    ranked = rank_cocktails(catalog_index, query, (page - 1) * limit, limit)
+    return encode_object(
+        {
+            "items": encode_array(
+                encode_ranked_item(entry, score, catalog_index.version)
+                for entry, score in ranked.items
+            ),
+            "page": dumps(page),
+            "limit": dumps(limit),
+            "total": dumps(ranked.total),
+        }
+    )
+
+
+def search_cocktails_from_index(query: str, page: int, limit: int) -> bytes:
+    catalog_index = require_catalog_index()
+    if catalog_index.search is None:
+        raise HTTPException(status_code=503, detail="The search index is not loaded.")
+    found = catalog_index.search.search(query, (page - 1) * limit, limit)
+    return encode_object(
+        {
+            "items": encode_array(
+                encode_ranked_item(
+                    catalog_index.entries[position], score, catalog_index.version
+                )
+                for position, score in found.hits
+            ),
+            "page": dumps(page),
+            "limit": dumps(limit),
+            "total": dumps(found.total),
+        }
+    )
+
+
+def match_pantry_from_index(
+    have: Sequence[str],
+    max_missing: int,
+    vibe_id: str,
+    difficulty_id: str,
+    occasion_id: str,
+    page: int,
+    limit: int,
+) -> bytes:
+    catalog_index = require_catalog_index()
+    if catalog_index.pantry is None:
+        raise HTTPException(status_code=503, detail="The pantry index is not loaded.")
+    pantry = catalog_index.pantry.resolve(parse_multi_value(have))
+    candidates = catalog_index.match(vibe_id, difficulty_id, occasion_id)
+    matched = catalog_index.pantry.match(pantry, candidates, max_missing, (page - 1) * limit, limit)
+    return encode_object(
+        {
+            "items": encode_array(
+                encode_annotated_summary(
+                    catalog_index.entries[position], catalog_index.version, {"missing": missing}
+                )
+                for position, missing in matched.items
+            ),
+            "page": dumps(page),
+            "limit": dumps(limit),
+            "total": dumps(matched.total),
+            "unmatched": dumps(pantry.unmatched),
+        }
+    )
+
+
+def build_cocktail_not_found(cocktail_id: str) -> HTTPException:
+    return HTTPException(status_code=404, detail=f"Cocktail with id '{cocktail_id}' not found.")
 
 
 @app.get("/health")
@@ -106,61 +660,459 @@ def health() -> dict[str, str]:
     return get_overall_status(dependency_statuses)
 
 
-@app.get("/vibes")
-def list_vibes() -> list[dict[str, str | None | list[str]]]:
+@app.get("/health/live")
+def health_live() -> dict[str, str]:
+    return {"status": "ok"}
+
+
+@app.get("/health/ready")
+def health_ready() -> JSONResponse:
+    """Ready once warm-up has finished and every dependency probe passes."""
+    warmup = get_warmup()
+    monitor = get_health_monitor()
+    payload = {
+        **serialize_health_snapshot(monitor.snapshot(), monitor.max_age),
+        "warmup": serialize_warmup(warmup),
+    }
+    if payload["status"] == "ok" and not warmup.ready:
+        payload["status"] = "warming"
+    status_code = 200 if payload["status"] == "ok" else 503
+    return JSONResponse(payload, status_code=status_code)
+
+
+@app.get("/health/pool")
+def pool_stats() -> dict[str, list[dict[str, object]]]:
+    return {"pools": get_pool_stats()}
+
+
+def metrics() -> PlainTextResponse:
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
+if get_settings().METRICS_ENABLED:
+    app.add_api_route("/metrics", metrics, methods=["GET"], include_in_schema=False)
+
+
+def serve_cached(
+    route: str, compute: Callable[[], bytes], **params: object
+) -> EncodedJSONResponse:
+    """Serve from the response cache under the current catalog version, when both exist.
+
+    Cached entries hold the encoded body as text, so hits are returned without re-encoding.
+    """
+    response_cache = get_response_cache()
+    version = get_catalog_manager().version
+    if response_cache is None or version is None:
+        return EncodedJSONResponse(compute())
+    body = response_cache.get_or_compute(
+        response_cache.build_key(version, route, **params), lambda: compute().decode()
+    )
+    return EncodedJSONResponse(body.encode())
+
+
+async def serve_cached_async(
+    route: str, compute: Callable[[], Awaitable[bytes]], **params: object
+) -> EncodedJSONResponse:
+    response_cache = get_response_cache()
+    version = get_catalog_manager().version
+    if response_cache is None or version is None:
+        return EncodedJSONResponse(await compute())
+
+    async def compute_text() -> str:
+        return (await compute()).decode()
+
+    body = await response_cache.get_or_compute_async(
+        response_cache.build_key(version, route, **params), compute_text
+    )
+    return EncodedJSONResponse(body.encode())
+
+
+def load_vibes(occasion_id: str = "") -> bytes:
     try:
         with create_session() as session:
-            vibes = session.execute(select(Vibe).order_by(Vibe.name)).scalars().all()
-        return [serialize_vibe(vibe) for vibe in vibes]
+            vibes = session.execute(build_vibes_query(occasion_id)).scalars().all()
+        return dumps([serialize_vibe(vibe) for vibe in vibes])
     except SQLAlchemyError as error:
         raise HTTPException(status_code=500, detail=f"Failed to load vibes: {error}") from error
 
 
-@app.get("/cocktails")
-def list_cocktails(
-    vibe: str = "",
-    occasion: str = "",
-    difficulty: str = DEFAULT_DIFFICULTY,
-    page: int = Query(DEFAULT_PAGE, ge=1),
-    limit: int = Query(DEFAULT_LIMIT, ge=1),
-) -> dict[str, object]:
+def load_cocktails(params: CocktailListParams) -> bytes:
+    """Load one page in a single round trip; only a page past the end needs a second count."""
+    version = current_catalog_version()
     try:
         with create_session() as session:
-            resolved_page = resolve_page(page)
-            resolved_limit = resolve_limit(limit)
-            query = build_cocktails_query(vibe, difficulty, occasion)
-            total = session.execute(
-                build_cocktails_count_query(vibe, difficulty, occasion)
-            ).scalar()
-            results = (
-                session.execute(
-                    query.offset((resolved_page - 1) * resolved_limit).limit(resolved_limit)
-                )
-                .scalars()
-                .all()
-            )
+            rows = session.execute(*bind_cocktails_page(params)).all()
+            results, total = split_cocktail_rows(rows)
+            if params.counts_total and total is None:
+                total = session.execute(*bind_cocktails_count(params)).scalar_one()
 
-        return {
-            "items": [serialize_cocktail(cocktail) for cocktail in results],
-            "page": resolved_page,
-            "limit": resolved_limit,
-            "total": total or 0,
-        }
+        return build_cocktails_page_payload(results, params, total, version)
     except SQLAlchemyError as error:
         raise HTTPException(status_code=500, detail=f"Failed to load cocktails: {error}") from error
 
 
-@app.get("/cocktails/{cocktail_id}")
-def get_cocktail_detail(cocktail_id: str) -> dict[str, object]:
+def load_cocktail_detail(cocktail_id: str) -> bytes:
+    version = current_catalog_version()
     try:
         with create_session() as session:
-            cocktail = session.get(Cocktail, cocktail_id)
+            cocktail = session.get(Cocktail, cocktail_id, options=DETAIL_OPTIONS)
         if cocktail is None:
-            raise HTTPException(
-                status_code=404, detail=f"Cocktail with id '{cocktail_id}' not found."
-            )
-        return serialize_cocktail_detail(cocktail)
+            raise build_cocktail_not_found(cocktail_id)
+        return encode_cocktail_detail(cocktail, version)
     except SQLAlchemyError as error:
         raise HTTPException(
             status_code=500, detail=f"Failed to load cocktail detail: {error}"
         ) from error
+
+
+def load_cocktail_details(cocktail_ids: list[str]) -> bytes:
+    version = current_catalog_version()
+    try:
+        with create_session() as session:
+            cocktails = session.execute(build_cocktail_details_query(cocktail_ids)).scalars().all()
+        return build_cocktail_details_payload(cocktails, cocktail_ids, version)
+    except SQLAlchemyError as error:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to load cocktail details: {error}"
+        ) from error
+
+
+async def load_vibes_async(occasion_id: str = "") -> bytes:
+    try:
+        async with create_async_session() as session:
+            vibes = (await session.execute(build_vibes_query(occasion_id))).scalars().all()
+        return dumps([serialize_vibe(vibe) for vibe in vibes])
+    except SQLAlchemyError as error:
+        raise HTTPException(status_code=500, detail=f"Failed to load vibes: {error}") from error
+
+
+async def load_cocktails_async(params: CocktailListParams) -> bytes:
+    version = current_catalog_version()
+    try:
+        async with create_async_session() as session:
+            rows = (await session.execute(*bind_cocktails_page(params))).all()
+            results, total = split_cocktail_rows(rows)
+            if params.counts_total and total is None:
+                total = (await session.execute(*bind_cocktails_count(params))).scalar_one()
+
+        return build_cocktails_page_payload(results, params, total, version)
+    except SQLAlchemyError as error:
+        raise HTTPException(status_code=500, detail=f"Failed to load cocktails: {error}") from error
+
+
+async def load_cocktail_detail_async(cocktail_id: str) -> bytes:
+    version = current_catalog_version()
+    try:
+        async with create_async_session() as session:
+            cocktail = await session.get(Cocktail, cocktail_id, options=DETAIL_OPTIONS)
+        if cocktail is None:
+            raise build_cocktail_not_found(cocktail_id)
+        return encode_cocktail_detail(cocktail, version)
+    except SQLAlchemyError as error:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to load cocktail detail: {error}"
+        ) from error
+
+
+async def load_cocktail_details_async(cocktail_ids: list[str]) -> bytes:
+    version = current_catalog_version()
+    try:
+        async with create_async_session() as session:
+            result = await session.execute(build_cocktail_details_query(cocktail_ids))
+            cocktails = result.scalars().all()
+        return build_cocktail_details_payload(cocktails, cocktail_ids, version)
+    except SQLAlchemyError as error:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to load cocktail details: {error}"
+        ) from error
+
+
+@sync_router.get("/vibes")
+@route_query_budget(1)
+def list_vibes(occasion: str = "") -> EncodedJSONResponse:
+    return serve_cached("vibes", partial(load_vibes, occasion), occasion=occasion)
+
+
+@sync_router.get("/cocktails")
+@route_query_budget(2)
+def list_cocktails(
+    vibe: str = "",
+    occasion: str = "",
+    difficulty: str = DEFAULT_DIFFICULTY,
+    page: int = Query(DEFAULT_PAGE, ge=1),
+    limit: int = Query(DEFAULT_LIMIT, ge=1),
+    cursor: str | None = None,
+    include_total: bool = Query(True, alias="includeTotal"),
+) -> EncodedJSONResponse:
+    params = CocktailListParams(
+        vibe_id=vibe,
+        difficulty_id=difficulty,
+        occasion_id=occasion,
+        page=resolve_page(page),
+        limit=resolve_limit(limit),
+        cursor_key=decode_cursor(cursor),
+        include_total=include_total,
+    )
+    catalog_index = get_catalog_manager().index
+    if catalog_index is not None:
+        return EncodedJSONResponse(list_cocktails_from_index(catalog_index, params))
+    return serve_cached("cocktails", partial(load_cocktails, params), **params.cache_params())
+
+
+@sync_router.get("/cocktails/ranked")
+@route_query_budget(0)
+def list_ranked_cocktails(
+    vibe: Annotated[tuple[str, ...], Query()] = (),
+    occasion: Annotated[tuple[str, ...], Query()] = (),
+    alcohol_level: Annotated[tuple[str, ...], Query(alias="alcoholLevel")] = (),
+    difficulty: str = "",
+    min_complexity: int | None = Query(None, alias="minComplexity", ge=0),
+    max_complexity: int | None = Query(None, alias="maxComplexity", ge=0),
+    page: int = Query(DEFAULT_PAGE, ge=1),
+    limit: int = Query(DEFAULT_LIMIT, ge=1),
+) -> EncodedJSONResponse:
+    query = build_ranking_query(
+        vibe, occasion, alcohol_level, difficulty, min_complexity, max_complexity
+    )
+    return EncodedJSONResponse(rank_cocktails_from_index(query, page, resolve_limit(limit)))
+
+
+@sync_router.get("/cocktails/search")
+@route_query_budget(0)
+def search_cocktails(
+    q: str = Query(..., min_length=1),
+    page: int = Query(DEFAULT_PAGE, ge=1),
+    limit: int = Query(DEFAULT_LIMIT, ge=1),
+) -> EncodedJSONResponse:
+    return EncodedJSONResponse(search_cocktails_from_index(q, page, resolve_limit(limit)))
+
+
+@sync_router.get("/cocktails/makeable")
+@route_query_budget(0)
+def list_makeable_cocktails(
+    have: Annotated[tuple[str, ...], Query()] = (),
+    max_missing: int = Query(0, alias="maxMissing", ge=0, le=MAX_MISSING),
+    vibe: str = "",
+    occasion: str = "",
+    difficulty: str = "",
+    page: int = Query(DEFAULT_PAGE, ge=1),
+    limit: int = Query(DEFAULT_LIMIT, ge=1),
+) -> EncodedJSONResponse:
+    return EncodedJSONResponse(
+        match_pantry_from_index(
+            have, max_missing, vibe, difficulty, occasion, page, resolve_limit(limit)
+        )
+    )
+
+
+@sync_router.get("/cocktails/details")
+@route_query_budget(1)
+def get_cocktail_details(ids: str) -> EncodedJSONResponse:
+    cocktail_ids = parse_cocktail_ids(ids)
+    return serve_cached(
+        "cocktail-details", partial(load_cocktail_details, cocktail_ids), ids=",".join(cocktail_ids)
+    )
+
+
+@sync_router.get("/cocktails/{cocktail_id}")
+@route_query_budget(1)
+def get_cocktail_detail(cocktail_id: str) -> EncodedJSONResponse:
+    return serve_cached("cocktail", partial(load_cocktail_detail, cocktail_id), id=cocktail_id)
+
+
+@async_router.get("/vibes")
+@route_query_budget(1)
+async def list_vibes_async(occasion: str = "") -> EncodedJSONResponse:
+    return await serve_cached_async(
+        "vibes", partial(load_vibes_async, occasion), occasion=occasion
+    )
+
+
+@async_router.get("/cocktails")
+@route_query_budget(2)
+async def list_cocktails_async(
+    vibe: str = "",
+    occasion: str = "",
+    difficulty: str = DEFAULT_DIFFICULTY,
+    page: int = Query(DEFAULT_PAGE, ge=1),
+    limit: int = Query(DEFAULT_LIMIT, ge=1),
+    cursor: str | None = None,
+    include_total: bool = Query(True, alias="includeTotal"),
+) -> EncodedJSONResponse:
+    params = CocktailListParams(
+        vibe_id=vibe,
+        difficulty_id=difficulty,
+        occasion_id=occasion,
+        page=resolve_page(page),
+        limit=resolve_limit(limit),
+        cursor_key=decode_cursor(cursor),
+        include_total=include_total,
+    )
+    catalog_index = get_catalog_manager().index
+    if catalog_index is not None:
+        return EncodedJSONResponse(list_cocktails_from_index(catalog_index, params))
+    return await serve_cached_async(
+        "cocktails", partial(load_cocktails_async, params), **params.cache_params()
+    )
+
+
+@async_router.get("/cocktails/ranked")
+@route_query_budget(0)
+async def list_ranked_cocktails_async(
+    vibe: Annotated[tuple[str, ...], Query()] = (),
+    occasion: Annotated[tuple[str, ...], Query()] = (),
+    alcohol_level: Annotated[tuple[str, ...], Query(alias="alcoholLevel")] = (),
+    difficulty: str = "",
+    min_complexity: int | None = Query(None, alias="minComplexity", ge=0),
+    max_complexity: int | None = Query(None, alias="maxComplexity", ge=0),
+    page: int = Query(DEFAULT_PAGE, ge=1),
+    limit: int = Query(DEFAULT_LIMIT, ge=1),
+) -> EncodedJSONResponse:
+    query = build_ranking_query(
+        vibe, occasion, alcohol_level, difficulty, min_complexity, max_complexity
+    )
+    return EncodedJSONResponse(rank_cocktails_from_index(query, page, resolve_limit(limit)))
+
+
+@async_router.get("/cocktails/search")
+@route_query_budget(0)
+async def search_cocktails_async(
+    q: str = Query(..., min_length=1),
+    page: int = Query(DEFAULT_PAGE, ge=1),
+    limit: int = Query(DEFAULT_LIMIT, ge=1),
+) -> EncodedJSONResponse:
+    return EncodedJSONResponse(search_cocktails_from_index(q, page, resolve_limit(limit)))
+
+
+@async_router.get("/cocktails/makeable")
+@route_query_budget(0)
+async def list_makeable_cocktails_async(
+    have: Annotated[tuple[str, ...], Query()] = (),
+    max_missing: int = Query(0, alias="maxMissing", ge=0, le=MAX_MISSING),
+    vibe: str = "",
+    occasion: str = "",
+    difficulty: str = "",
+    page: int = Query(DEFAULT_PAGE, ge=1),
+    limit: int = Query(DEFAULT_LIMIT, ge=1),
+) -> EncodedJSONResponse:
+    return EncodedJSONResponse(
+        match_pantry_from_index(
+            have, max_missing, vibe, difficulty, occasion, page, resolve_limit(limit)
+        )
+    )
+
+
+@async_router.get("/cocktails/details")
+@route_query_budget(1)
+async def get_cocktail_details_async(ids: str) -> EncodedJSONResponse:
+    cocktail_ids = parse_cocktail_ids(ids)
+    return await serve_cached_async(
+        "cocktail-details",
+        partial(load_cocktail_details_async, cocktail_ids),
+        ids=",".join(cocktail_ids),
+    )
+
+
+@async_router.get("/cocktails/{cocktail_id}")
+@route_query_budget(1)
+async def get_cocktail_detail_async(cocktail_id: str) -> EncodedJSONResponse:
+    return await serve_cached_async(
+        "cocktail", partial(load_cocktail_detail_async, cocktail_id), id=cocktail_id
+    )
+
+
+def build_warmup_list_params() -> list[CocktailListParams]:
+    """One list request per statement shape: each filter present or absent, each paging mode."""
+    filter_values = ("", WARMUP_FILTER_ID)
+    paging_modes = ((None, True), (None, False), ((0, "", ""), False))
+    return [
+        CocktailListParams(
+            vibe_id=vibe_id,
+            difficulty_id=difficulty_id,
+            occasion_id=occasion_id,
+            page=DEFAULT_PAGE,
+            limit=1,
+            cursor_key=cursor_key,
+            include_total=include_total,
+        )
+        for vibe_id, difficulty_id, occasion_id in itertools.product(filter_values, repeat=3)
+        for cursor_key, include_total in paging_modes
+    ]
+
+
+def warm_statements() -> None:
+    """Run every statement shape the catalog endpoints issue, filling the compiled cache."""
+    for params in build_warmup_list_params():
+        load_cocktails(params)
+    for occasion_id in ("", WARMUP_FILTER_ID):
+        load_vibes(occasion_id)
+    load_cocktail_details([WARMUP_FILTER_ID])
+    with suppress(HTTPException):
+        load_cocktail_detail(WARMUP_FILTER_ID)
+
+
+async def warm_statements_async() -> None:
+    for params in build_warmup_list_params():
+        await load_cocktails_async(params)
+    for occasion_id in ("", WARMUP_FILTER_ID):
+        await load_vibes_async(occasion_id)
+    await load_cocktail_details_async([WARMUP_FILTER_ID])
+    with suppress(HTTPException):
+        await load_cocktail_detail_async(WARMUP_FILTER_ID)
+
+
+def warm_responses() -> None:
+    """Serve the landing requests once so their cached bodies and fragments exist."""
+    list_vibes(occasion="")
+    list_cocktails(
+        vibe="",
+        occasion="",
+        difficulty=DEFAULT_DIFFICULTY,
+        page=DEFAULT_PAGE,
+        limit=DEFAULT_LIMIT,
+        cursor=None,
+        include_total=True,
+    )
+
+
+async def warm_responses_async() -> None:
+    await list_vibes_async(occasion="")
+    await list_cocktails_async(
+        vibe="",
+        occasion="",
+        difficulty=DEFAULT_DIFFICULTY,
+        page=DEFAULT_PAGE,
+        limit=DEFAULT_LIMIT,
+        cursor=None,
+        include_total=True,
+    )
+
+
+def build_warmup_steps(use_async: bool) -> list[WarmupStep]:
+    """Warm-up in dependency order; without a database only the mappers are configured."""
+    steps = [WarmupStep("mappers", configure_mappers)]
+    if not get_database_url():
+        return steps
+    if use_async:
+        pool = WarmupStep("pool", partial(preconnect_async_pool, get_async_engine()))
+        statements = WarmupStep("statements", warm_statements_async)
+        responses = WarmupStep("responses", warm_responses_async)
+    else:
+        pool = WarmupStep("pool", partial(preconnect_pool, get_engine()))
+        statements = WarmupStep("statements", warm_statements)
+        responses = WarmupStep("responses", warm_responses)
+    return [
+        *steps,
+        pool,
+        WarmupStep("catalog", get_catalog_manager().refresh),
+        statements,
+        responses,
+    ]
+
+
+def include_catalog_routes(target: FastAPI, use_async: bool) -> None:
+    """Mount the catalog endpoints backed by either the sync or the async session."""
+    target.include_router(async_router if use_async else sync_router)
+
+
+include_catalog_routes(app, get_settings().DB_ASYNC)
@@ -0,0 +1,290 @@
+"""In-process Prometheus metrics for requests, database queries, pools and caches."""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, default
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+UNMATCHED_ROUTE = "unmatched"
+
+LabelValues = tuple[str, ...]
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [
+        f'{name}="{escape_label_value(value)}"' for name, value in zip(names, values, strict=True)
+    ]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+def render_counter(
+    name: str,
+    documentation: str,
+    labelnames: tuple[str, ...],
+    samples: Iterable[tuple[LabelValues, float]],
+) -> Iterator[str]:
+    yield f"# HELP {name} {documentation}"
+    yield f"# TYPE {name} counter"
+    for labelvalues, value in samples:
+        yield f"{name}{format_labels(labelnames, labelvalues)} {format_value(value)}"
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[LabelValues, float] = {}
+        self._lock = Lock()
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def value(self, *labelvalues: str) -> float:
+        return self._values.get(labelvalues, 0.0)
+
+    def render(self) -> Iterator[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return render_counter(self.name, self.documentation, self.labelnames, values)
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self._series: dict[LabelValues, list[float]] = {}
+        self._lock = Lock()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """Add one sample; each series stores per-bucket counts, then the sum and the count."""
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [0.0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def count(self, *labelvalues: str) -> float:
+        series = self._series.get(labelvalues)
+        return series[-1] if series else 0.0
+
+    def sum(self, *labelvalues: str) -> float:
+        series = self._series.get(labelvalues)
+        return series[-2] if series else 0.0
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            all_series = sorted((labels, list(series)) for labels, series in self._series.items())
+        bucket_names = (*self.labelnames, "le")
+        for labelvalues, series in all_series:
+            cumulative = 0.0
+            for bound, bucket_count in zip(self.buckets, series, strict=False):
+                cumulative += bucket_count
+                labels = format_labels(bucket_names, (*labelvalues, format_value(bound)))
+                yield f"{self.name}_bucket{labels} {format_value(cumulative)}"
+            labels = format_labels(bucket_names, (*labelvalues, "+Inf"))
+            yield f"{self.name}_bucket{labels} {format_value(series[-1])}"
+            labels = format_labels(self.labelnames, labelvalues)
+            yield f"{self.name}_sum{labels} {format_value(series[-2])}"
+            yield f"{self.name}_count{labels} {format_value(series[-1])}"
+
+
+Collector = Callable[[], Iterable[str]]
+
+
+class MetricsRegistry:
+    """Holds metrics plus collectors that read counters kept elsewhere at scrape time."""
+
+    def __init__(self) -> None:
+        self.metrics: list[Counter | Histogram] = []
+        self.collectors: list[Collector] = []
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self.metrics.append(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self.metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Collector) -> None:
+        self.collectors.append(collector)
+
+    def render(self) -> str:
+        lines = [line for metric in self.metrics for line in metric.render()]
+        for collector in self.collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+REQUESTS = registry.counter(
+    "http_requests_total", "HTTP responses by route and status code.", ("method", "route", "status")
+)
+REQUEST_LATENCY = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route.", ("method", "route")
+)
+REQUEST_QUERIES = registry.histogram(
+    "db_queries_per_request",
+    "SQL statements executed while serving one request.",
+    ("route",),
+    QUERY_COUNT_BUCKETS,
+)
+REQUEST_QUERY_TIME = registry.histogram(
+    "db_query_seconds_per_request",
+    "Time spent executing SQL while serving one request.",
+    ("route",),
+)
+POOL_CHECKOUT_WAIT = registry.histogram(
+    "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection."
+)
+COMPILED_CACHE = registry.counter(
+    "db_compiled_cache_total",
+    "SQL executions by whether SQLAlchemy's compiled-statement cache had the statement.",
+    ("result",),
+)
+COMPILED_CACHE_RESULTS = {
+    default.CACHE_HIT: "hit",
+    default.CACHE_MISS: "miss",
+    default.CACHING_DISABLED: "disabled",
+    default.NO_CACHE_KEY: "uncacheable",
+    default.NO_DIALECT_SUPPORT: "unsupported",
+}
+
+
+@dataclass
+class RequestQueryStats:
+    count: int = 0
+    seconds: float = 0.0
+
+
+_request_queries: ContextVar[RequestQueryStats | None] = ContextVar(
+    "request_queries", default=None
+)
+
+
+def current_query_stats() -> RequestQueryStats | None:
+    return _request_queries.get()
+
+
+def before_cursor_execute(conn: Any, *_: object) -> None:
+    if _request_queries.get() is not None:
+        conn.info["query_started_at"] = time.perf_counter()
+
+
+def after_cursor_execute(
+    conn: Any, _cursor: object, _statement: str, _parameters: object, context: Any, *_: object
+) -> None:
+    cache_result = COMPILED_CACHE_RESULTS.get(getattr(context, "cache_hit", None))
+    if cache_result is not None:
+        COMPILED_CACHE.inc(cache_result)
+    stats = _request_queries.get()
+    started = conn.info.pop("query_started_at", None)
+    if stats is None or started is None:
+        return
+    stats.count += 1
+    stats.seconds += time.perf_counter() - started
+
+
+def install_query_instrumentation() -> None:
+    """Attach the per-request query listeners to every engine, once."""
+    if not event.contains(Engine, "before_cursor_execute", before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", after_cursor_execute)
+
+
+def observe_pool_wait(seconds: float) -> None:
+    POOL_CHECKOUT_WAIT.observe(seconds)
+
+
+def resolve_route(scope: Scope) -> str:
+    """Return the matched route template, keeping label cardinality bounded."""
+    route = scope.get("route")
+    if route is None and "app" in scope:
+        for candidate in scope["app"].router.routes:
+            match, _ = candidate.matches(scope)
+            if match == Match.FULL:
+                route = candidate
+                break
+    return getattr(route, "path", UNMATCHED_ROUTE)
+
+
+class MetricsMiddleware:
+    """Record latency, status and SQL usage for every HTTP request."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        stats = RequestQueryStats()
+        token = _request_queries.set(stats)
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            _request_queries.reset(token)
+            route = resolve_route(scope)
+            REQUESTS.inc(scope["method"], route, str(status))
+            REQUEST_LATENCY.observe(elapsed, scope["method"], route)
+            REQUEST_QUERIES.observe(stats.count, route)
+            REQUEST_QUERY_TIME.observe(stats.seconds, route)
+
+
+def render_metrics() -> str:
+    return registry.render()
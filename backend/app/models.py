@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
-from sqlalchemy import JSON, Column, ForeignKey, Integer, String, Table
-from sqlalchemy.orm import relationship
+from sqlalchemy import JSON, Column, ForeignKey, Index, Integer, String, Table
+from sqlalchemy.orm import deferred, relationship
 
 from app.db import Base
 
+COCKTAIL_DETAIL_GROUP = "detail"
+
 cocktail_vibes = Table(
     "cocktail_vibes",
     Base.metadata,
     Column("cocktail_id", ForeignKey("cocktails.id"), primary_key=True),
     Column("vibe_id", ForeignKey("vibes.id"), primary_key=True),
+    Index("ix_cocktail_vibes_vibe_id_cocktail_id", "vibe_id", "cocktail_id"),
 )
 
 cocktail_occasions = Table(
@@ -19,6 +22,7 @@ cocktail_occasions = Table(
     Base.metadata,
     Column("cocktail_id", ForeignKey("cocktails.id"), primary_key=True),
     Column("occasion_id", ForeignKey("occasions.id"), primary_key=True),
+    Index("ix_cocktail_occasions_occasion_id_cocktail_id", "occasion_id", "cocktail_id"),
 )
 
 
@@ -65,17 +69,25 @@ class AlcoholLevel(Base):
 
 class Cocktail(Base):
     __tablename__ = "cocktails"
+    __table_args__ = (
+        Index("ix_cocktails_rank_name_id", "rank", "name", "id"),
+        Index("ix_cocktails_difficulty_id_rank_name_id", "difficulty_id", "rank", "name", "id"),
+    )
 
     id = Column(String, primary_key=True)
     name = Column(String, nullable=False)
     description = Column(String, nullable=False)
     image_url = Column(String, nullable=True)
     rank = Column(Integer, nullable=False, default=0)
-    ingredients = Column(JSON, nullable=False)
-    steps = Column(JSON, nullable=False)
+    # Ingredient count plus step count, precomputed at seed time for range filters.
+    complexity = Column(Integer, nullable=False, default=0)
+    # The JSON columns are only needed for detail payloads; load them with
+    # ``undefer_group(COCKTAIL_DETAIL_GROUP)``.
+    ingredients = deferred(Column(JSON, nullable=False), group=COCKTAIL_DETAIL_GROUP)
+    steps = deferred(Column(JSON, nullable=False), group=COCKTAIL_DETAIL_GROUP)
     glassware = Column(String, nullable=True)
     garnish = Column(String, nullable=True)
-    tags = Column(JSON, nullable=True)
+    tags = deferred(Column(JSON, nullable=True), group=COCKTAIL_DETAIL_GROUP)
     difficulty_id = Column(String, ForeignKey("difficulties.id"), nullable=False)
     alcohol_level_id = Column(String, ForeignKey("alcohol_levels.id"), nullable=False)
 
@@ -83,3 +95,18 @@ class Cocktail(Base):
     alcohol_level = relationship("AlcoholLevel", back_populates="cocktails")
     vibes = relationship("Vibe", secondary=cocktail_vibes, back_populates="cocktails")
     occasions = relationship("Occasion", secondary=cocktail_occasions, back_populates="cocktails")
+
+
+class CatalogMetadata(Base):
+    __tablename__ = "catalog_metadata"
+
+    key = Column(String, primary_key=True)
+    value = Column(String, nullable=False)
+
+
+class SeedManifest(Base):
+    __tablename__ = "seed_manifest"
+
+    entity = Column(String, primary_key=True)
+    entity_id = Column(String, primary_key=True)
+    content_hash = Column(String, nullable=False)
@@ -0,0 +1,138 @@
+"""Pantry matching: which cocktails can be made from the ingredients a user already has.
+
+Ingredient names are normalized into a dictionary of small integer ids. Each cocktail keeps
+its requirements as a bitset over that dictionary (bit = ingredient id), used to list what a
+returned cocktail is missing. Each ingredient keeps a posting over cocktails (bit = rank
+position), so counting how many of a pantry's ingredients every cocktail uses is a handful of
+big-integer operations per pantry item, and ``missing <= k`` follows from comparing that count
+with the cocktail's requirement count.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+from app.bitsets import (
+    Posting,
+    bits_from_positions,
+    iter_positions,
+    pack_positions,
+    score_tiers,
+    slice_tiers,
+    unpack_positions,
+)
+from app.search import tokenize
+
+# Words that describe how an ingredient is prepared rather than what it is.
+QUALIFIERS = frozenset({"chilled", "cold", "fresh", "freshly", "hot", "squeezed"})
+# Always assumed to be on hand, so never counted as missing.
+STAPLES = frozenset({"ice", "water"})
+MAX_MISSING = 5
+
+
+def singularize(token: str) -> str:
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def normalize_ingredient(name: str) -> str:
+    """Map "Fresh lime juice" and "lime juices" to the same dictionary key."""
+    return " ".join(singularize(token) for token in tokenize(name) if token not in QUALIFIERS)
+
+
+@dataclass(frozen=True)
+class Pantry:
+    ingredient_ids: frozenset[int]
+    bits: int
+    unmatched: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class PantryPage:
+    items: list[tuple[int, tuple[str, ...]]]
+    total: int
+
+
+class PantryIndex:
+    """Ingredient dictionary and requirement bitsets over cocktails in catalog rank order."""
+
+    def __init__(self, requirements: Sequence[Iterable[str]]) -> None:
+        self.size = len(requirements)
+        self.ingredient_ids: dict[str, int] = {}
+        self.labels: list[str] = []
+        self.requirements: list[int] = []
+        ingredient_positions: list[list[int]] = []
+        count_positions: dict[int, list[int]] = {}
+        for position, names in enumerate(requirements):
+            bits = 0
+            for name in names:
+                key = normalize_ingredient(name)
+                if not key or key in STAPLES:
+                    continue
+                ingredient_id = self.ingredient_ids.get(key)
+                if ingredient_id is None:
+                    ingredient_id = self.ingredient_ids[key] = len(self.labels)
+                    self.labels.append(name)
+                    ingredient_positions.append([])
+                if not bits >> ingredient_id & 1:
+                    bits |= 1 << ingredient_id
+                    ingredient_positions[ingredient_id].append(position)
+            self.requirements.append(bits)
+            count_positions.setdefault(bits.bit_count(), []).append(position)
+        self.postings: list[Posting] = [
+            pack_positions(positions, self.size) for positions in ingredient_positions
+        ]
+        self.count_postings = {
+            count: bits_from_positions(positions, self.size)
+            for count, positions in count_positions.items()
+        }
+
+    def resolve(self, names: Iterable[str]) -> Pantry:
+        """Look pantry items up in the dictionary; staples are implied, not reported."""
+        ingredient_ids = set()
+        unmatched = []
+        for name in names:
+            key = normalize_ingredient(name)
+            ingredient_id = self.ingredient_ids.get(key)
+            if ingredient_id is not None:
+                ingredient_ids.add(ingredient_id)
+            elif key not in STAPLES:
+                unmatched.append(name)
+        bits = sum(1 << ingredient_id for ingredient_id in ingredient_ids)
+        return Pantry(frozenset(ingredient_ids), bits, tuple(unmatched))
+
+    def missing_tiers(self, pantry: Pantry, candidates: int, max_missing: int) -> list[int]:
+        """Split ``candidates`` by missing-ingredient count, ``0`` through ``max_missing``.
+
+        ``score_tiers`` counts how many pantry ingredients each candidate uses, up to the
+        largest requirement count; a cocktail needing ``count`` ingredients is missing
+        ``count - used`` of them.
+        """
+        postings = [
+            unpack_positions(self.postings[ingredient_id], self.size)
+            for ingredient_id in sorted(pantry.ingredient_ids)
+        ]
+        used = dict(score_tiers(candidates, postings, cap=max(self.count_postings, default=0)))
+        tiers = [0] * (max_missing + 1)
+        for count, required in self.count_postings.items():
+            for missing in range(min(count, max_missing) + 1):
+                tiers[missing] |= required & used.get(count - missing, 0)
+        return tiers
+
+    def missing_labels(self, position: int, pantry: Pantry) -> tuple[str, ...]:
+        missing = self.requirements[position] & ~pantry.bits
+        labels = [self.labels[ingredient_id] for ingredient_id in iter_positions(missing)]
+        return tuple(sorted(labels, key=str.lower))
+
+    def match(
+        self, pantry: Pantry, candidates: int, max_missing: int, offset: int, limit: int
+    ) -> PantryPage:
+        """Return one page ordered by missing count, then by the catalog's rank order."""
+        tiers = self.missing_tiers(pantry, candidates, max_missing)
+        items = [
+            (position, self.missing_labels(position, pantry))
+            for position, _ in slice_tiers(enumerate(tiers), offset, limit)
+        ]
+        return PantryPage(items=items, total=sum(bits.bit_count() for bits in tiers))
@@ -0,0 +1,185 @@
+"""Per-request SQL statement budgets and repeated-statement (probable N+1) detection."""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPEAT_THRESHOLD = 2
+BUDGET_ATTRIBUTE = "query_budget"
+EXCEEDED_BODY = b'{"detail":"Query budget exceeded."}'
+
+Endpoint = TypeVar("Endpoint", bound=Callable[..., Any])
+
+
+class QueryBudgetExceeded(RuntimeError):
+    pass
+
+
+@dataclass
+class QueryTracker:
+    """SQL statements seen while a budget is active, keyed by statement text."""
+
+    label: str
+    budget: int | None = None
+    statements: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def count(self) -> int:
+        return sum(self.statements.values())
+
+    def repeated(self, threshold: int = DEFAULT_REPEAT_THRESHOLD) -> dict[str, int]:
+        """Statements executed at least ``threshold`` times, the usual N+1 signature."""
+        return {
+            statement: count
+            for statement, count in self.statements.items()
+            if count >= threshold
+        }
+
+    def problems(self, repeat_threshold: int = DEFAULT_REPEAT_THRESHOLD) -> list[str]:
+        problems = []
+        if self.budget is not None and self.count > self.budget:
+            problems.append(
+                f"{self.label} executed {self.count} SQL statements, budget is {self.budget}"
+            )
+        for statement, count in self.repeated(repeat_threshold).items():
+            summary = " ".join(statement.split())[:200]
+            problems.append(f"{self.label} repeated a statement {count} times: {summary}")
+        return problems
+
+
+_active_trackers: ContextVar[tuple[QueryTracker, ...]] = ContextVar(
+    "query_budget_trackers", default=()
+)
+
+
+def record_statement(_conn: Any, _cursor: Any, statement: str, *_: object) -> None:
+    for tracker in _active_trackers.get():
+        tracker.statements[statement] += 1
+
+
+def install_statement_listener() -> None:
+    """Attach the statement listener to every engine, once."""
+    if not event.contains(Engine, "before_cursor_execute", record_statement):
+        event.listen(Engine, "before_cursor_execute", record_statement)
+
+
+def enforce(tracker: QueryTracker, strict: bool, repeat_threshold: int) -> None:
+    problems = tracker.problems(repeat_threshold)
+    if not problems:
+        return
+    if strict:
+        raise QueryBudgetExceeded("; ".join(problems))
+    for problem in problems:
+        logger.warning("Query budget: %s.", problem)
+
+
+@contextmanager
+def query_budget(
+    budget: int | None = None,
+    *,
+    label: str = "block",
+    strict: bool = True,
+    repeat_threshold: int = DEFAULT_REPEAT_THRESHOLD,
+) -> Iterator[QueryTracker]:
+    """Count statements run inside the block and raise (or log) when over budget.
+
+    Budgets nest: every active tracker sees each statement. Checks are skipped when the block
+    itself raises, so the original error is not masked.
+    """
+    install_statement_listener()
+    tracker = QueryTracker(label=label, budget=budget)
+    token = _active_trackers.set((*_active_trackers.get(), tracker))
+    try:
+        yield tracker
+    finally:
+        _active_trackers.reset(token)
+    enforce(tracker, strict, repeat_threshold)
+
+
+def route_query_budget(budget: int) -> Callable[[Endpoint], Endpoint]:
+    """Declare how many SQL statements one request to the decorated endpoint may run."""
+
+    def decorate(endpoint: Endpoint) -> Endpoint:
+        setattr(endpoint, BUDGET_ATTRIBUTE, budget)
+        return endpoint
+
+    return decorate
+
+
+class QueryBudgetMiddleware:
+    """Check each request against its endpoint's declared budget and flag repeats.
+
+    The check runs when the response starts, so in strict mode a request over budget is
+    answered with a ``500`` instead of its body. Statements a streamed body runs after that
+    point are not counted.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        strict: bool = False,
+        repeat_threshold: int = DEFAULT_REPEAT_THRESHOLD,
+    ) -> None:
+        self.app = app
+        self.strict = strict
+        self.repeat_threshold = repeat_threshold
+        install_statement_listener()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        tracker = QueryTracker(label=f"{scope['method']} {scope['path']}")
+        exceeded = False
+
+        async def send_checked(message: Message) -> None:
+            nonlocal exceeded
+            if message["type"] == "http.response.start":
+                exceeded = not self.check(scope, tracker)
+                if exceeded:
+                    await send_exceeded(send)
+                    return
+            elif exceeded:
+                return
+            await send(message)
+
+        token = _active_trackers.set((*_active_trackers.get(), tracker))
+        try:
+            await self.app(scope, receive, send_checked)
+        finally:
+            _active_trackers.reset(token)
+
+    def check(self, scope: Scope, tracker: QueryTracker) -> bool:
+        """Label and budget the tracker from the matched route; ``False`` fails the request."""
+        route = scope.get("route")
+        if route is not None:
+            tracker.label = f"{scope['method']} {route.path}"
+        tracker.budget = getattr(scope.get("endpoint"), BUDGET_ATTRIBUTE, None)
+        try:
+            enforce(tracker, self.strict, self.repeat_threshold)
+        except QueryBudgetExceeded as error:
+            logger.error("Query budget: %s.", error)
+            return False
+        return True
+
+
+async def send_exceeded(send: Send) -> None:
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(EXCEEDED_BODY)).encode()),
+    ]
+    await send({"type": "http.response.start", "status": 500, "headers": headers})
+    await send({"type": "http.response.body", "body": EXCEEDED_BODY})
@@ -0,0 +1,80 @@
+"""Multi-valued filtering and occasion-boosted ranking over the in-memory catalog index.
+
+Each cocktail's features (vibes, occasions, difficulty, alcohol level, complexity) are held
+column-wise as the index's bitsets, so filtering and scoring a query touches every cocktail
+through a handful of big-integer operations instead of a per-row loop.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+from app.bitsets import score_tiers, slice_tiers
+from app.catalog import CatalogEntry, CatalogIndex
+
+# Mirrors COMPLEXITY_WEIGHTS in the frontend's difficulty config.
+INGREDIENT_WEIGHT = 1
+STEP_WEIGHT = 1
+
+
+def compute_complexity(ingredients: Sequence[object], steps: Sequence[object]) -> int:
+    return len(ingredients) * INGREDIENT_WEIGHT + len(steps) * STEP_WEIGHT
+
+
+@dataclass(frozen=True)
+class RankingQuery:
+    """Hard filters match any of their values; occasions only boost the score."""
+
+    vibe_ids: tuple[str, ...] = ()
+    occasion_ids: tuple[str, ...] = ()
+    alcohol_level_ids: tuple[str, ...] = ()
+    difficulty_id: str = ""
+    min_complexity: int | None = None
+    max_complexity: int | None = None
+
+    def accepts_complexity(self, complexity: int) -> bool:
+        if self.min_complexity is not None and complexity < self.min_complexity:
+            return False
+        return self.max_complexity is None or complexity <= self.max_complexity
+
+
+@dataclass(frozen=True)
+class RankedPage:
+    items: list[tuple[CatalogEntry, int]]
+    total: int
+
+
+def match_any(postings: dict, keys: Iterable[object]) -> int:
+    bits = 0
+    for key in keys:
+        bits |= postings.get(key, 0)
+    return bits
+
+
+def filter_candidates(catalog_index: CatalogIndex, query: RankingQuery) -> int:
+    """Return the bitset of cocktails passing every hard filter."""
+    bits = catalog_index.all_bits
+    if query.vibe_ids:
+        bits &= match_any(catalog_index.vibe_postings, query.vibe_ids)
+    if query.alcohol_level_ids:
+        bits &= match_any(catalog_index.alcohol_level_postings, query.alcohol_level_ids)
+    if query.difficulty_id:
+        bits &= catalog_index.difficulty_postings.get(query.difficulty_id, 0)
+    if query.min_complexity is not None or query.max_complexity is not None:
+        complexities = filter(query.accepts_complexity, catalog_index.complexity_postings)
+        bits &= match_any(catalog_index.complexity_postings, complexities)
+    return bits
+
+
+def rank_cocktails(
+    catalog_index: CatalogIndex, query: RankingQuery, offset: int, limit: int
+) -> RankedPage:
+    """Return one page ordered by occasion score, then by the catalog's rank order."""
+    candidates = filter_candidates(catalog_index, query)
+    boosts = [catalog_index.occasion_postings.get(item, 0) for item in query.occasion_ids]
+    items = [
+        (catalog_index.entries[position], score)
+        for position, score in slice_tiers(score_tiers(candidates, boosts), offset, limit)
+    ]
+    return RankedPage(items=items, total=candidates.bit_count())
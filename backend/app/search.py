@@ -0,0 +1,305 @@
+"""Inverted index for free-text search over cocktail names, ingredients, tags and descriptions.
+
+Every normalized term maps to one group of cocktails per field-weight sum, each group held as
+a rank-position bitset (or a short position array while it is sparse). A query term expands to
+its exact term, prefix completions and, failing both, trigram-similar terms; its groups are
+made disjoint by best score so a cocktail counts once per query term. Terms are ANDed; a few
+matches are scored one by one, and larger result sets are split into score tiers token by
+token, so a query costs a few big-integer operations per tier rather than a per-cocktail loop.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache, reduce
+from operator import and_, or_
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.bitsets import (
+    Posting,
+    iter_positions,
+    pack_positions,
+    slice_tiers,
+    unpack_positions,
+)
+from app.models import Cocktail
+
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "ingredient": 2.0,
+    "spirit": 2.0,
+    "flavor": 1.5,
+    "description": 1.0,
+}
+STOPWORDS = frozenset({"a", "an", "and", "in", "of", "on", "or", "the", "to", "with"})
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+MIN_PREFIX_LENGTH = 2
+MAX_PREFIX_EXPANSIONS = 16
+PREFIX_FACTOR = 0.7
+MIN_FUZZY_LENGTH = 3
+MAX_FUZZY_EXPANSIONS = 8
+MIN_TRIGRAM_SIMILARITY = 0.3
+FUZZY_FACTOR = 0.5
+SCORE_PRECISION = 4
+LOAD_BATCH_SIZE = 5_000
+TERM_CACHE_SIZE = 16_384
+# Groups kept per query token; the lowest-scoring rest share one group.
+MAX_TOKEN_GROUPS = 32
+# Up to this many matches are scored one by one instead of tier by tier.
+DIRECT_SCORING_LIMIT = 2_048
+
+
+def normalize(text: str) -> str:
+    """Lowercase and strip accents, so "Añejo" and "anejo" index the same."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return decomposed.encode("ascii", "ignore").decode("ascii").lower()
+
+
+def tokenize(text: str) -> list[str]:
+    return [token for token in TOKEN_PATTERN.findall(normalize(text)) if token not in STOPWORDS]
+
+
+@lru_cache(maxsize=TERM_CACHE_SIZE)
+def field_terms(text: str) -> frozenset[str]:
+    """Distinct terms of one field value; ingredient, tag and description texts repeat a lot
+    across a catalog, so index builds tokenize each of them once."""
+    return frozenset(tokenize(text))
+
+
+def trigrams(term: str) -> set[str]:
+    padded = f"  {term} "
+    return {padded[index : index + 3] for index in range(len(padded) - 2)}
+
+
+@dataclass(frozen=True)
+class SearchDocument:
+    name: str
+    description: str = ""
+    ingredients: tuple[str, ...] = ()
+    spirits: tuple[str, ...] = ()
+    flavors: tuple[str, ...] = ()
+
+    def term_weights(self) -> dict[str, float]:
+        """Sum the weights of the distinct fields each term appears in."""
+        fields = (
+            ("name", (self.name,)),
+            ("ingredient", self.ingredients),
+            ("spirit", self.spirits),
+            ("flavor", self.flavors),
+            ("description", (self.description,)),
+        )
+        weights: dict[str, float] = {}
+        for field, texts in fields:
+            for term in frozenset().union(*map(field_terms, texts)):
+                weights[term] = weights.get(term, 0.0) + FIELD_WEIGHTS[field]
+        return weights
+
+
+def build_search_document(
+    name: str, description: str | None, ingredients: Any, tags: Any
+) -> SearchDocument:
+    """Map the cocktail JSON columns (``seedData.ts`` shapes) onto searchable fields."""
+    tags = tags if isinstance(tags, dict) else {}
+    return SearchDocument(
+        name=name,
+        description=description or "",
+        ingredients=tuple(
+            str(item.get("name", "")) if isinstance(item, dict) else str(item)
+            for item in ingredients or ()
+        ),
+        spirits=tuple(str(item) for item in tags.get("spirit") or ()),
+        flavors=tuple(str(item) for item in tags.get("flavor") or ()),
+    )
+
+
+@dataclass(frozen=True)
+class SearchPage:
+    hits: list[tuple[int, float]]
+    total: int
+
+
+class SearchIndex:
+    """Term postings over documents given in catalog rank order (position = bit)."""
+
+    def __init__(self, documents: Sequence[SearchDocument]) -> None:
+        self.size = len(documents)
+        grouped: dict[tuple[str, float], list[int]] = {}
+        for position, document in enumerate(documents):
+            for group in document.term_weights().items():
+                grouped.setdefault(group, []).append(position)
+        self.postings: dict[str, list[tuple[float, Posting]]] = {}
+        frequencies: Counter[str] = Counter()
+        for (term, weight), positions in sorted(grouped.items(), reverse=True):
+            posting = pack_positions(positions, self.size)
+            self.postings.setdefault(term, []).append((weight, posting))
+            frequencies[term] += len(positions)
+        self.idf = {
+            term: math.log(1 + self.size / frequency) for term, frequency in frequencies.items()
+        }
+        self.vocabulary = sorted(self.postings)
+        self.trigram_terms: dict[str, list[str]] = {}
+        self.trigram_sizes: dict[str, int] = {}
+        for term in self.vocabulary:
+            if not term.isalpha():
+                continue
+            grams = trigrams(term)
+            self.trigram_sizes[term] = len(grams)
+            for gram in grams:
+                self.trigram_terms.setdefault(gram, []).append(term)
+
+    def similar_terms(self, token: str) -> list[tuple[str, float]]:
+        """Vocabulary terms sharing enough trigrams with ``token`` (Jaccard), best first."""
+        grams = trigrams(token)
+        shared: Counter[str] = Counter()
+        for gram in grams:
+            shared.update(self.trigram_terms.get(gram, ()))
+        similar = []
+        for term, count in shared.items():
+            similarity = count / (len(grams) + self.trigram_sizes[term] - count)
+            if similarity >= MIN_TRIGRAM_SIMILARITY:
+                similar.append((term, similarity))
+        similar.sort(key=lambda pair: (-pair[1], pair[0]))
+        return similar[:MAX_FUZZY_EXPANSIONS]
+
+    def expand(self, token: str) -> dict[str, float]:
+        """Map one query token to the indexed terms it matches, with a score factor each."""
+        expansions: dict[str, float] = {}
+        if token in self.postings:
+            expansions[token] = 1.0
+        if len(token) >= MIN_PREFIX_LENGTH:
+            start = bisect_left(self.vocabulary, token)
+            for term in self.vocabulary[start : start + MAX_PREFIX_EXPANSIONS + 1]:
+                if not term.startswith(token):
+                    break
+                expansions.setdefault(term, PREFIX_FACTOR)
+        if not expansions and len(token) >= MIN_FUZZY_LENGTH:
+            for term, similarity in self.similar_terms(token):
+                expansions[term] = FUZZY_FACTOR * similarity
+        return expansions
+
+    def score_groups(self, token: str) -> list[tuple[float, int]]:
+        """Disjoint ``(score, bits)`` groups for one token, best score first.
+
+        A cocktail matching several expansions keeps only its best-scoring one.
+        """
+        candidates = [
+            (round(weight * factor * self.idf[term], SCORE_PRECISION), posting)
+            for term, factor in self.expand(token).items()
+            for weight, posting in self.postings[term]
+        ]
+        candidates.sort(key=lambda pair: pair[0], reverse=True)
+        groups = []
+        covered = 0
+        for score, posting in candidates:
+            bits = unpack_positions(posting, self.size) & ~covered
+            if bits:
+                groups.append((score, bits))
+                covered |= bits
+        return groups
+
+    def search(self, query: str, offset: int, limit: int) -> SearchPage:
+        """Return one page of ``(position, score)`` hits ordered by score, then rank."""
+        token_groups = [self.score_groups(token) for token in dict.fromkeys(tokenize(query))]
+        if not token_groups or not all(token_groups):
+            return SearchPage(hits=[], total=0)
+        matches = reduce(
+            and_, (reduce(or_, (bits for _, bits in groups)) for groups in token_groups)
+        )
+        total = matches.bit_count()
+        if not total:
+            return SearchPage(hits=[], total=0)
+        token_groups = [cap_groups(restrict_groups(groups, matches)) for groups in token_groups]
+        if total <= DIRECT_SCORING_LIMIT:
+            hits = score_positions(token_groups)[offset : offset + limit]
+        else:
+            hits = slice_tiers(score_tiers(token_groups, matches), offset, limit)
+        return SearchPage(hits=hits, total=total)
+
+
+def restrict_groups(groups: list[tuple[float, int]], matches: int) -> list[tuple[float, int]]:
+    """Keep only the matching cocktails of each group, dropping groups left empty."""
+    restricted = []
+    for score, bits in groups:
+        bits &= matches
+        if bits:
+            restricted.append((score, bits))
+    return restricted
+
+
+def cap_groups(groups: list[tuple[float, int]]) -> list[tuple[float, int]]:
+    """Fold groups past ``MAX_TOKEN_GROUPS`` into one, scored as the best of them."""
+    if len(groups) <= MAX_TOKEN_GROUPS:
+        return groups
+    tail = groups[MAX_TOKEN_GROUPS - 1 :]
+    return [*groups[: MAX_TOKEN_GROUPS - 1], (tail[0][0], reduce(or_, (bits for _, bits in tail)))]
+
+
+def score_positions(token_groups: list[list[tuple[float, int]]]) -> list[tuple[int, float]]:
+    """Score each matching cocktail on its own; cheapest when few cocktails match."""
+    scores: dict[int, float] = {}
+    for groups in token_groups:
+        for score, bits in groups:
+            for position in iter_positions(bits):
+                scores[position] = scores.get(position, 0.0) + score
+    hits = [(position, round(score, SCORE_PRECISION)) for position, score in scores.items()]
+    hits.sort(key=lambda hit: (-hit[1], hit[0]))
+    return hits
+
+
+def score_tiers(
+    token_groups: list[list[tuple[float, int]]], matches: int
+) -> list[tuple[float, int]]:
+    """Split ``matches`` into ``(score, bits)`` tiers, best score first.
+
+    Score sums are extended one token at a time, each partial tier ANDed with the next token's
+    groups. Partial tiers that come out empty are dropped before they are extended, so the work
+    is bounded by the tiers that hold matches rather than by every combination of groups.
+    """
+    partial = {0.0: matches}
+    for groups in token_groups:
+        extended: dict[float, int] = {}
+        for partial_score, partial_bits in partial.items():
+            remaining = partial_bits
+            for score, bits in groups:
+                shared = remaining & bits
+                if not shared:
+                    continue
+                key = partial_score + score
+                extended[key] = extended.get(key, 0) | shared
+                remaining ^= shared
+                if not remaining:
+                    break
+        partial = extended
+    tiers: dict[float, int] = {}
+    for score, bits in partial.items():
+        key = round(score, SCORE_PRECISION)
+        tiers[key] = tiers.get(key, 0) | bits
+    return sorted(tiers.items(), reverse=True)
+
+
+def load_search_documents(session: Session, positions: dict[str, int]) -> list[SearchDocument]:
+    """Read the searchable columns once, placing each cocktail at its catalog position."""
+    documents: list[SearchDocument] = [SearchDocument(name="")] * len(positions)
+    rows = session.execute(
+        select(
+            Cocktail.id,
+            Cocktail.name,
+            Cocktail.description,
+            Cocktail.ingredients,
+            Cocktail.tags,
+        ).execution_options(yield_per=LOAD_BATCH_SIZE)
+    )
+    for cocktail_id, name, description, ingredients, tags in rows:
+        position = positions.get(cocktail_id)
+        if position is not None:
+            documents[position] = build_search_document(name, description, ingredients, tags)
+    return documents
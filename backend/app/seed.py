@@ -3,27 +3,91 @@
 from __future__ import annotations
 
 import argparse
-import ast
-import re
+import hashlib
+import json
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import suppress
+from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    Column,
+    MetaData,
+    String,
+    Table,
+    bindparam,
+    cast,
+    delete,
+    exists,
+    insert,
+    literal,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from app.catalog import bump_catalog_version
 from app.db import create_session
-from app.models import AlcoholLevel, Cocktail, Difficulty, Occasion, Vibe
-
+from app.models import (
+    AlcoholLevel,
+    Cocktail,
+    Difficulty,
+    Occasion,
+    SeedManifest,
+    Vibe,
+    cocktail_occasions,
+    cocktail_vibes,
+)
+from app.ranking import compute_complexity
+from app.seed_source import load_compiled_exports
+
+DEFAULT_BATCH_SIZE = 1000
+MAX_REPORTED_IDS = 20
+SEED_EXPORTS = ("vibes", "occasions", "difficulties", "alcoholLevels", "cocktails")
 
 SeedConfig = dict[str, Any]
-SeedData = dict[str, list[dict[str, Any]]]
+SeedData = dict[str, Iterable[dict[str, Any]]]
 
 
 def parse_args() -> SeedConfig:
     parser = argparse.ArgumentParser(description="Seed the Vibe & Sip database.")
     parser.add_argument("--database-url", dest="database_url", default=None)
+    parser.add_argument(
+        "--batch-size",
+        dest="batch_size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Rows written per INSERT/DELETE batch.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        dest="dry_run",
+        action="store_true",
+        help="Report what would change without writing anything.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rewrite every entity even if its content hash is unchanged.",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Read seed records one at a time instead of loading the catalog into memory.",
+    )
     parsed = parser.parse_args()
-    return {"database_url": parsed.database_url}
+    return {
+        "database_url": parsed.database_url,
+        "batch_size": parsed.batch_size,
+        "dry_run": parsed.dry_run,
+        "force": parsed.force,
+        "stream": parsed.stream,
+    }
 
 
 def resolve_database_url(config: SeedConfig) -> str | None:
@@ -35,80 +99,231 @@ def get_seed_data_path() -> Path:
     return repo_root / "frontend" / "src" / "data" / "seedData.ts"
 
 
-def load_seed_data() -> SeedData:
-    seed_source = get_seed_data_path().read_text(encoding="utf-8")
-    return {
-        "vibes": parse_exported_array(seed_source, "vibes"),
-        "occasions": parse_exported_array(seed_source, "occasions"),
-        "difficulties": parse_exported_array(seed_source, "difficulties"),
-        "alcoholLevels": parse_exported_array(seed_source, "alcoholLevels"),
-        "cocktails": parse_exported_array(seed_source, "cocktails"),
-    }
+def get_seed_cache_dir() -> Path:
+    return Path(__file__).resolve().parents[1] / ".seed_cache"
+
+
+def load_seed_data(stream: bool = False, cache_dir: Path | None = None) -> SeedData:
+    """Load ``seedData.ts`` through its compiled artifact, parsing the source only when it
+    changed. ``stream`` returns re-iterable exports that read one record at a time."""
+    return load_compiled_exports(
+        get_seed_data_path(), cache_dir or get_seed_cache_dir(), SEED_EXPORTS, stream
+    )
+
+
+@dataclass
+class EntityDiff:
+    entity: str
+    inserted: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def changed_ids(self) -> list[str]:
+        return self.inserted + self.updated
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.inserted or self.updated or self.deleted)
+
+    def summary(self) -> str:
+        return (
+            f"{self.entity}: {len(self.inserted)} inserted, {len(self.updated)} updated, "
+            f"{len(self.deleted)} deleted, {self.unchanged} unchanged"
+        )
+
+
+@dataclass
+class SeedPlan:
+    diffs: dict[str, EntityDiff]
+    hashes: dict[str, dict[str, str]]
 
+    @property
+    def changed(self) -> bool:
+        return any(diff.changed for diff in self.diffs.values())
 
-def parse_exported_array(seed_source: str, export_name: str) -> list[dict[str, Any]]:
-    export_index = seed_source.find(f"export const {export_name}")
-    if export_index == -1:
-        raise ValueError(f"Seed export not found: {export_name}")
-    assignment_index = seed_source.find("=", export_index)
-    if assignment_index == -1:
-        raise ValueError(f"Seed export missing assignment: {export_name}")
-    bracket_start = seed_source.find("[", assignment_index)
-    if bracket_start == -1:
-        raise ValueError(f"Seed export not found: {export_name}")
-    bracket_end = find_matching_bracket(seed_source, bracket_start)
-    array_literal = seed_source[bracket_start : bracket_end + 1]
-    normalized = normalize_ts_literal(array_literal)
-    return ast.literal_eval(normalized)
-
-
-def find_matching_bracket(source: str, start_index: int) -> int:
-    depth = 0
-    for offset, char in enumerate(source[start_index:], start=0):
-        if char == "[":
-            depth += 1
-        elif char == "]":
-            depth -= 1
-            if depth == 0:
-                return start_index + offset
-    raise ValueError("Unmatched bracket in seed data.")
-
-
-def normalize_ts_literal(value: str) -> str:
-    normalized = re.sub(r"\btrue\b", "True", value)
-    normalized = re.sub(r"\bfalse\b", "False", normalized)
-    normalized = re.sub(r"\bnull\b", "None", normalized)
-    normalized = re.sub(r"([,{]\s*)([A-Za-z_][A-Za-z0-9_]*)\s*:", r'\1"\2":', normalized)
-    return normalized.replace("'", '"')
-
-
-def insert_seed_data(session: Session, seed_data: SeedData) -> None:
-    vibes_payloads = [normalize_vibe_payload(payload) for payload in seed_data["vibes"]]
-    vibes = upsert_entities(session, Vibe, vibes_payloads)
-    occasions = upsert_entities(session, Occasion, seed_data["occasions"])
-    difficulties = upsert_entities(session, Difficulty, seed_data["difficulties"])
-    alcohol_levels = upsert_entities(session, AlcoholLevel, seed_data["alcoholLevels"])
-    session.flush()
-
-    insert_cocktails(session, seed_data["cocktails"], vibes, occasions, difficulties, alcohol_levels)
-
-
-def upsert_entities(
+    def summary(self) -> list[str]:
+        return [diff.summary() for diff in self.diffs.values()]
+
+
+def hash_payload(payload: dict[str, Any]) -> str:
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def read_manifest(session: Session, entity: str) -> dict[str, str]:
+    rows = session.execute(
+        select(SeedManifest.entity_id, SeedManifest.content_hash).where(
+            SeedManifest.entity == entity
+        )
+    )
+    return {entity_id: content_hash for entity_id, content_hash in rows.tuples()}
+
+
+def plan_seed(session: Session, seed_data: SeedData, force: bool = False) -> SeedPlan:
+    """Diff each payload's content hash against the seed manifest.
+
+    ``force`` treats every payload as updated, which repairs rows changed outside the seeder.
+    """
+    diffs: dict[str, EntityDiff] = {}
+    hashes: dict[str, dict[str, str]] = {}
+    for entity in SEED_ENTITIES:
+        manifest = read_manifest(session, entity.name)
+        current = {payload["id"]: hash_payload(payload) for payload in seed_data[entity.name]}
+        diff = EntityDiff(entity.name)
+        for entity_id, content_hash in current.items():
+            previous_hash = manifest.get(entity_id)
+            if previous_hash is None:
+                diff.inserted.append(entity_id)
+            elif force or previous_hash != content_hash:
+                diff.updated.append(entity_id)
+            else:
+                diff.unchanged += 1
+        diff.deleted = sorted(set(manifest) - set(current))
+        diffs[entity.name] = diff
+        hashes[entity.name] = current
+    return SeedPlan(diffs, hashes)
+
+
+def apply_seed_plan(
+    session: Session, seed_data: SeedData, plan: SeedPlan, batch_size: int
+) -> None:
+    """Write only the rows the plan marks as changed, then record their hashes."""
+    for entity in SEED_ENTITIES:
+        changed_ids = set(plan.diffs[entity.name].changed_ids)
+        changed_payloads = (
+            payload for payload in seed_data[entity.name] if payload["id"] in changed_ids
+        )
+        for payloads in iter_batches(changed_payloads, batch_size):
+            rows = [entity.build_row(payload) for payload in payloads]
+            upsert_rows(session, entity.table, rows, batch_size)
+            if entity.name == "cocktails":
+                sync_associations(
+                    session, cocktail_vibes, "vibe_id", payloads, "vibeIds", batch_size
+                )
+                sync_associations(
+                    session, cocktail_occasions, "occasion_id", payloads, "occasionIds", batch_size
+                )
+
+    for entity in reversed(SEED_ENTITIES):
+        deleted_ids = plan.diffs[entity.name].deleted
+        for table, column in entity.dependents:
+            delete_rows(session, table, column, deleted_ids, batch_size)
+        delete_rows(session, entity.table, "id", deleted_ids, batch_size)
+
+    for entity in SEED_ENTITIES:
+        diff = plan.diffs[entity.name]
+        manifest_rows = [
+            {
+                "entity": entity.name,
+                "entity_id": entity_id,
+                "content_hash": plan.hashes[entity.name][entity_id],
+            }
+            for entity_id in diff.changed_ids
+        ]
+        upsert_rows(session, SeedManifest.__table__, manifest_rows, batch_size)
+        connection = session.connection()
+        delete_manifest_row = delete(SeedManifest).where(
+            SeedManifest.entity == entity.name, SeedManifest.entity_id == bindparam("entity_id")
+        )
+        for batch in iter_batches([{"entity_id": item} for item in diff.deleted], batch_size):
+            connection.execute(delete_manifest_row, batch)
+
+
+def insert_seed_data(
     session: Session,
-    model: type[Vibe | Occasion | Difficulty | AlcoholLevel],
+    seed_data: SeedData,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    force: bool = False,
+) -> SeedPlan:
+    """Insert, update or delete only the entities whose content hash changed."""
+    validate_cocktail_references(seed_data)
+    plan = plan_seed(session, seed_data, force)
+    apply_seed_plan(session, seed_data, plan, batch_size)
+    return plan
+
+
+def build_upsert(session: Session, table: Table, columns: Iterable[str]):
+    """Return ``INSERT ... ON CONFLICT (pk) DO UPDATE`` for the session's dialect."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        statement = postgresql_insert(table)
+    elif dialect == "sqlite":
+        statement = sqlite_insert(table)
+    else:
+        raise ValueError(f"Bulk seeding is not supported for the {dialect} dialect.")
+    key_columns = [column.name for column in table.primary_key.columns]
+    update_columns = [column for column in columns if column not in key_columns]
+    if not update_columns:
+        return statement.on_conflict_do_nothing(index_elements=key_columns)
+    return statement.on_conflict_do_update(
+        index_elements=key_columns,
+        set_={column: statement.excluded[column] for column in update_columns},
+    )
+
+
+def iter_batches(rows: Iterable[Any], batch_size: int) -> Iterator[list[Any]]:
+    iterator = iter(rows)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def upsert_rows(
+    session: Session, table: Table, rows: list[dict[str, Any]], batch_size: int
+) -> None:
+    if not rows:
+        return
+    statement = build_upsert(session, table, rows[0].keys())
+    for batch in iter_batches(rows, batch_size):
+        session.execute(statement, batch)
+
+
+def sync_associations(
+    session: Session,
+    table: Table,
+    key_column: str,
     payloads: list[dict[str, Any]],
-) -> dict[str, Any]:
-    entities: dict[str, Any] = {}
-    for payload in payloads:
-        entity = session.get(model, payload["id"])
-        if entity is None:
-            entity = model(**payload)
-            session.add(entity)
-        else:
-            for key, value in payload.items():
-                setattr(entity, key, value)
-        entities[payload["id"]] = entity
-    return entities
+    payload_key: str,
+    batch_size: int,
+) -> None:
+    """Insert missing and delete stale links for the given cocktails, leaving others alone."""
+    desired = {
+        (payload["id"], key_id) for payload in payloads for key_id in payload[payload_key]
+    }
+    existing: set[tuple[str, str]] = set()
+    for batch in iter_batches([payload["id"] for payload in payloads], batch_size):
+        existing.update(
+            session.execute(
+                select(table.c.cocktail_id, table.c[key_column]).where(
+                    table.c.cocktail_id.in_(batch)
+                )
+            ).tuples()
+        )
+    added = [
+        {"cocktail_id": cocktail_id, key_column: key_id}
+        for cocktail_id, key_id in sorted(desired - existing)
+    ]
+    removed = [
+        {"cocktail_id": cocktail_id, key_column: key_id}
+        for cocktail_id, key_id in sorted(existing - desired)
+    ]
+    connection = session.connection()
+    for batch in iter_batches(added, batch_size):
+        connection.execute(insert(table), batch)
+    delete_link = delete(table).where(
+        table.c.cocktail_id == bindparam("cocktail_id"),
+        table.c[key_column] == bindparam(key_column),
+    )
+    for batch in iter_batches(removed, batch_size):
+        connection.execute(delete_link, batch)
+
+
+def delete_rows(
+    session: Session, table: Table, column: str, values: list[str], batch_size: int
+) -> None:
+    for batch in iter_batches(values, batch_size):
+        session.execute(delete(table).where(table.c[column].in_(batch)))
 
 
 def normalize_vibe_payload(payload: dict[str, Any]) -> dict[str, Any]:
@@ -120,73 +335,189 @@ def normalize_vibe_payload(payload: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def insert_cocktails(
-    session: Session,
-    payloads: list[dict[str, Any]],
-    vibe_map: dict[str, Vibe],
-    occasion_map: dict[str, Occasion],
-    difficulty_map: dict[str, Difficulty],
-    alcohol_map: dict[str, AlcoholLevel],
-) -> None:
-    for payload in payloads:
-        cocktail = session.get(Cocktail, payload["id"])
-        if cocktail is None:
-            cocktail = Cocktail(id=payload["id"])
-            session.add(cocktail)
-        apply_cocktail_fields(cocktail, payload)
-        cocktail.vibes = [vibe_map[vibe_id] for vibe_id in payload["vibeIds"]]
-        cocktail.occasions = [occasion_map[occasion_id] for occasion_id in payload["occasionIds"]]
-        cocktail.difficulty = difficulty_map[payload["difficultyId"]]
-        cocktail.alcohol_level = alcohol_map[payload["alcoholLevelId"]]
-
-
-def apply_cocktail_fields(cocktail: Cocktail, payload: dict[str, Any]) -> None:
-    cocktail.name = payload["name"]
-    cocktail.description = payload["description"]
-    cocktail.image_url = payload.get("imageUrl")
-    cocktail.ingredients = payload["ingredients"]
-    cocktail.steps = payload["steps"]
-    cocktail.glassware = payload.get("glassware")
-    cocktail.garnish = payload.get("garnish")
-    cocktail.tags = payload.get("tags")
-    cocktail.difficulty_id = payload["difficultyId"]
-    cocktail.alcohol_level_id = payload["alcoholLevelId"]
+def validate_cocktail_references(seed_data: SeedData) -> None:
+    known_ids = {
+        payload_key: {target["id"] for target in seed_data[export_name]}
+        for payload_key, export_name in (
+            ("vibeIds", "vibes"),
+            ("occasionIds", "occasions"),
+            ("difficultyId", "difficulties"),
+            ("alcoholLevelId", "alcoholLevels"),
+        )
+    }
+    for payload in seed_data["cocktails"]:
+        for payload_key, target_ids in known_ids.items():
+            referenced = payload[payload_key]
+            referenced_ids = referenced if isinstance(referenced, list) else [referenced]
+            unknown_ids = [item for item in referenced_ids if item not in target_ids]
+            if unknown_ids:
+                raise ValueError(
+                    f"Cocktail {payload['id']} references unknown {payload_key}: {unknown_ids}"
+                )
+
+
+def build_cocktail_row(payload: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "id": payload["id"],
+        "name": payload["name"],
+        "description": payload["description"],
+        "image_url": payload.get("imageUrl"),
+        "ingredients": payload["ingredients"],
+        "steps": payload["steps"],
+        "complexity": compute_complexity(payload["ingredients"], payload["steps"]),
+        "glassware": payload.get("glassware"),
+        "garnish": payload.get("garnish"),
+        "tags": payload.get("tags"),
+        "difficulty_id": payload["difficultyId"],
+        "alcohol_level_id": payload["alcoholLevelId"],
+    }
 
 
-def collect_seed_check_errors(session: Session, seed_data: SeedData) -> list[str]:
-    checks = [
-        (Vibe, seed_data["vibes"]),
-        (Occasion, seed_data["occasions"]),
-        (Difficulty, seed_data["difficulties"]),
-        (AlcoholLevel, seed_data["alcoholLevels"]),
-        (Cocktail, seed_data["cocktails"]),
-    ]
-    errors: list[str] = []
-    for model, payloads in checks:
-        expected_ids = {payload["id"] for payload in payloads}
-        actual_ids = set(session.execute(select(model.id)).scalars().all())
-        missing_ids = expected_ids - actual_ids
-        if missing_ids:
-            errors.append(f"Missing {model.__tablename__} IDs: {sorted(missing_ids)}")
-        expected_count = len(expected_ids)
-        actual_count = session.execute(select(func.count()).select_from(model)).scalar_one()
-        if actual_count < expected_count:
-            errors.append(
-                f"{model.__tablename__} count {actual_count} is less than expected {expected_count}"
+@dataclass(frozen=True)
+class SeedEntity:
+    name: str
+    table: Table
+    build_row: Callable[[dict[str, Any]], dict[str, Any]]
+    dependents: tuple[tuple[Table, str], ...] = ()
+
+
+SEED_ENTITIES = (
+    SeedEntity("vibes", Vibe.__table__, normalize_vibe_payload, ((cocktail_vibes, "vibe_id"),)),
+    SeedEntity("occasions", Occasion.__table__, dict, ((cocktail_occasions, "occasion_id"),)),
+    SeedEntity("difficulties", Difficulty.__table__, dict),
+    SeedEntity("alcoholLevels", AlcoholLevel.__table__, dict),
+    SeedEntity(
+        "cocktails",
+        Cocktail.__table__,
+        build_cocktail_row,
+        ((cocktail_vibes, "cocktail_id"), (cocktail_occasions, "cocktail_id")),
+    ),
+)
+
+
+seed_expected_ids = Table(
+    "seed_expected_ids",
+    MetaData(),
+    Column("entity", String, primary_key=True),
+    Column("id", String, primary_key=True),
+    prefixes=["TEMPORARY"],
+)
+
+
+@dataclass
+class IdDiscrepancy:
+    """Count of mismatched ids plus the first few, so reports stay small at any size."""
+
+    count: int = 0
+    sample: list[str] = field(default_factory=list)
+
+    def add(self, entity_id: str) -> None:
+        self.count += 1
+        if len(self.sample) < MAX_REPORTED_IDS:
+            self.sample.append(entity_id)
+
+    def describe(self) -> str:
+        remainder = self.count - len(self.sample)
+        return f"{self.sample}" + (f" (and {remainder} more)" if remainder else "")
+
+
+@dataclass
+class SeedVerification:
+    missing: dict[str, IdDiscrepancy] = field(default_factory=dict)
+    unexpected: dict[str, IdDiscrepancy] = field(default_factory=dict)
+
+    def errors(self) -> list[str]:
+        return [
+            f"Missing {table_name} IDs: {discrepancy.describe()}"
+            for table_name, discrepancy in self.missing.items()
+        ]
+
+    def warnings(self) -> list[str]:
+        return [
+            f"Unexpected {table_name} IDs: {discrepancy.describe()}"
+            for table_name, discrepancy in self.unexpected.items()
+        ]
+
+
+def build_seed_check_query():
+    """Return one query listing expected ids absent from each table, and table ids not expected."""
+    checks = []
+    for entity in SEED_ENTITIES:
+        table = entity.table
+        table_name = cast(literal(table.name), String).label("entity")
+        checks.append(
+            select(table_name, seed_expected_ids.c.id, literal(True).label("missing")).where(
+                seed_expected_ids.c.entity == table.name,
+                ~exists().where(table.c.id == seed_expected_ids.c.id),
             )
-    return errors
+        )
+        checks.append(
+            select(table_name, table.c.id, literal(False).label("missing")).where(
+                ~exists().where(
+                    seed_expected_ids.c.entity == table.name,
+                    seed_expected_ids.c.id == table.c.id,
+                )
+            )
+        )
+    return union_all(*checks)
+
+
+def verify_seed_data(
+    session: Session, seed_data: SeedData, batch_size: int = DEFAULT_BATCH_SIZE
+) -> SeedVerification:
+    """Stage expected ids in a temporary table and diff every table against it in one query."""
+    connection = session.connection()
+    seed_expected_ids.create(connection)
+    try:
+        stage_ids = build_upsert(session, seed_expected_ids, ["entity", "id"])
+        for entity in SEED_ENTITIES:
+            rows = (
+                {"entity": entity.table.name, "id": payload["id"]}
+                for payload in seed_data[entity.name]
+            )
+            for batch in iter_batches(rows, batch_size):
+                connection.execute(stage_ids, batch)
+
+        verification = SeedVerification()
+        query = build_seed_check_query().execution_options(yield_per=batch_size)
+        for table_name, entity_id, missing in connection.execute(query):
+            discrepancies = verification.missing if missing else verification.unexpected
+            discrepancies.setdefault(table_name, IdDiscrepancy()).add(entity_id)
+    except BaseException:
+        # A failed statement aborts a Postgres transaction, so this drop fails too and must not
+        # hide the original error; the caller's rollback then discards the table with it.
+        with suppress(SQLAlchemyError):
+            seed_expected_ids.drop(connection)
+        raise
+    seed_expected_ids.drop(connection)
+    return verification
+
+
+def collect_seed_check_errors(session: Session, seed_data: SeedData) -> list[str]:
+    return verify_seed_data(session, seed_data).errors()
 
 
 def run_seed(config: SeedConfig) -> int:
     session = create_session(resolve_database_url(config))
     try:
-        seed_data = load_seed_data()
-        insert_seed_data(session, seed_data)
-        errors = collect_seed_check_errors(session, seed_data)
-        if errors:
-            raise ValueError("; ".join(errors))
+        seed_data = load_seed_data(stream=config.get("stream", False))
+        force = config.get("force", False)
+        if config.get("dry_run"):
+            validate_cocktail_references(seed_data)
+            plan = plan_seed(session, seed_data, force)
+            print("\n".join(["Seed dry run: no changes written.", *plan.summary()]))
+            return 0
+        batch_size = config.get("batch_size", DEFAULT_BATCH_SIZE)
+        plan = insert_seed_data(session, seed_data, batch_size, force)
+        verification = verify_seed_data(session, seed_data, batch_size)
+        if verification.errors():
+            raise ValueError("; ".join(verification.errors()))
+        for warning in verification.warnings():
+            print(f"Warning: {warning}")
+        if plan.changed:
+            bump_catalog_version(session)
         session.commit()
-        print("Seed successful: all entities inserted and verified.")
+        print("\n".join(["Seed successful: all entities inserted and verified.", *plan.summary()]))
         return 0
     except Exception:
         print("Seed failed: see error details above.")
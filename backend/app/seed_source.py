@@ -0,0 +1,204 @@
+"""Compile the exported arrays in ``seedData.ts`` into cached JSON Lines artifacts."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+EXPORT_PATTERN = re.compile(r"export\s+const\s+([A-Za-z_$][\w$]*)\s*(?::[^=]*)?=\s*")
+TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<skip>(?:\s+|//[^\n]*|/\*.*?\*/)+)
+    |(?P<punct>[\[\]{}:,])
+    |'(?P<single>(?:[^'\\\n]|\\.)*)'
+    |"(?P<double>(?:[^"\\\n]|\\.)*)"
+    |(?P<number>-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?)
+    |(?P<name>[A-Za-z_$][\w$]*)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+ESCAPE_PATTERN = re.compile(r"\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|.)", re.DOTALL)
+SIMPLE_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0"}
+KEYWORDS: dict[str, Any] = {"true": True, "false": False, "null": None}
+
+
+def decode_escape(match: re.Match[str]) -> str:
+    escape = match.group(1)
+    if escape.startswith("u{"):
+        return chr(int(escape[2:-1], 16))
+    if escape[0] in "ux" and len(escape) > 1:
+        return chr(int(escape[1:], 16))
+    return SIMPLE_ESCAPES.get(escape, escape)
+
+
+def decode_string(raw: str) -> str:
+    return ESCAPE_PATTERN.sub(decode_escape, raw) if "\\" in raw else raw
+
+
+class SeedSourceParser:
+    """Single-pass reader for the JSON-like literal subset used by ``seedData.ts``.
+
+    Handles unquoted and quoted keys, single- and double-quoted strings with escapes, trailing
+    commas and comments. Top-level arrays are yielded element by element.
+    """
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.position = 0
+
+    def error(self, message: str) -> ValueError:
+        line = self.source.count("\n", 0, self.position) + 1
+        return ValueError(f"Seed data line {line}: {message}")
+
+    def next_token(self) -> tuple[str, Any]:
+        while True:
+            match = TOKEN_PATTERN.match(self.source, self.position)
+            if match is None:
+                if self.position >= len(self.source):
+                    raise self.error("unexpected end of input")
+                raise self.error(f"unexpected character {self.source[self.position]!r}")
+            self.position = match.end()
+            kind = match.lastgroup
+            if kind != "skip":
+                break
+        if kind in {"single", "double"}:
+            return "string", decode_string(match.group(kind))
+        if kind == "number":
+            text = match.group(kind)
+            return "value", float(text) if any(char in text for char in ".eE") else int(text)
+        return kind, match.group(kind)
+
+    def expect(self, punctuation: str) -> None:
+        kind, token = self.next_token()
+        if kind != "punct" or token != punctuation:
+            raise self.error(f"expected {punctuation!r}, found {token!r}")
+
+    def parse_value(self, token: tuple[str, Any] | None = None) -> Any:
+        kind, value = token or self.next_token()
+        if kind == "punct" and value == "[":
+            return list(self.iter_array_items())
+        if kind == "punct" and value == "{":
+            return self.parse_object()
+        if kind == "name":
+            if value not in KEYWORDS:
+                raise self.error(f"unsupported identifier {value!r}")
+            return KEYWORDS[value]
+        if kind in {"string", "value"}:
+            return value
+        raise self.error(f"unexpected {value!r}")
+
+    def iter_array_items(self) -> Iterator[Any]:
+        """Yield the items of an array whose ``[`` was just consumed."""
+        while True:
+            token = self.next_token()
+            if token == ("punct", "]"):
+                return
+            yield self.parse_value(token)
+            kind, value = self.next_token()
+            if (kind, value) == ("punct", "]"):
+                return
+            if (kind, value) != ("punct", ","):
+                raise self.error(f"expected ',' or ']', found {value!r}")
+
+    def parse_object(self) -> dict[str, Any]:
+        result: dict[str, Any] = {}
+        while True:
+            kind, key = self.next_token()
+            if (kind, key) == ("punct", "}"):
+                return result
+            if kind not in {"name", "string"}:
+                raise self.error(f"expected a property name, found {key!r}")
+            self.expect(":")
+            result[key] = self.parse_value()
+            kind, value = self.next_token()
+            if (kind, value) == ("punct", "}"):
+                return result
+            if (kind, value) != ("punct", ","):
+                raise self.error(f"expected ',' or '}}', found {value!r}")
+
+    def iter_exports(self, names: Iterable[str]) -> Iterator[tuple[str, Iterator[Any]]]:
+        """Yield ``(name, items)`` for each wanted exported array, scanning the source once.
+
+        Each ``items`` iterator must be consumed before advancing to the next export.
+        """
+        wanted = set(names)
+        while match := EXPORT_PATTERN.search(self.source, self.position):
+            self.position = match.end()
+            name = match.group(1)
+            if name not in wanted or not self.source.startswith("[", self.position):
+                continue
+            self.position += 1
+            wanted.discard(name)
+            yield name, self.iter_array_items()
+        if wanted:
+            raise ValueError(f"Seed export not found: {', '.join(sorted(wanted))}")
+
+
+def hash_source(source_path: Path) -> str:
+    return hashlib.sha256(source_path.read_bytes()).hexdigest()
+
+
+def compile_seed_source(source_path: Path, artifact_dir: Path, names: Iterable[str]) -> None:
+    """Write one JSON Lines file per export, streaming items straight from the parser."""
+    staging_dir = Path(tempfile.mkdtemp(prefix=".compiling-", dir=artifact_dir.parent))
+    try:
+        parser = SeedSourceParser(source_path.read_text(encoding="utf-8"))
+        for name, items in parser.iter_exports(names):
+            with (staging_dir / f"{name}.jsonl").open("w", encoding="utf-8") as artifact:
+                for item in items:
+                    artifact.write(json.dumps(item, ensure_ascii=False, separators=(",", ":")))
+                    artifact.write("\n")
+    except BaseException:
+        shutil.rmtree(staging_dir)
+        raise
+    try:
+        os.replace(staging_dir, artifact_dir)
+    except OSError:
+        # Another process finished compiling the same source first.
+        shutil.rmtree(staging_dir)
+
+
+def ensure_compiled(source_path: Path, cache_dir: Path, names: Iterable[str]) -> Path:
+    """Return the artifact directory for the source's current hash, compiling it on a miss."""
+    names = list(names)
+    artifact_dir = cache_dir / f"{source_path.stem}-{hash_source(source_path)}"
+    if not all((artifact_dir / f"{name}.jsonl").exists() for name in names):
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        compile_seed_source(source_path, artifact_dir, names)
+        for stale_dir in cache_dir.glob(f"{source_path.stem}-*"):
+            if stale_dir != artifact_dir:
+                shutil.rmtree(stale_dir, ignore_errors=True)
+    return artifact_dir
+
+
+class SeedExport:
+    """Re-iterable view of one compiled export that reads a record at a time."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        with self.path.open(encoding="utf-8") as artifact:
+            for line in artifact:
+                yield json.loads(line)
+
+    def __repr__(self) -> str:
+        return f"SeedExport({str(self.path)!r})"
+
+
+def load_compiled_exports(
+    source_path: Path, cache_dir: Path, names: Iterable[str], stream: bool = False
+) -> dict[str, Any]:
+    names = list(names)
+    artifact_dir = ensure_compiled(source_path, cache_dir, names)
+    exports = {name: SeedExport(artifact_dir / f"{name}.jsonl") for name in names}
+    if stream:
+        return exports
+    return {name: list(export) for name, export in exports.items()}
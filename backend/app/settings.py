@@ -11,6 +11,34 @@ class Settings(BaseSettings):
     DATABASE_URL: str | None = None
     REDIS_URL: str | None = None
     CACHE_URL: str | None = None
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_ASYNC: bool = False
+    COCKTAILS_MAX_LIMIT: int = 100
+    COCKTAIL_DETAILS_MAX_IDS: int = 50
+    CATALOG_INDEX_ENABLED: bool = True
+    SEARCH_INDEX_ENABLED: bool = True
+    PANTRY_INDEX_ENABLED: bool = True
+    CATALOG_VERSION_POLL_SECONDS: float = 5.0
+    CATALOG_CACHE_MAX_AGE_SECONDS: int = 60
+    CATALOG_STALE_WHILE_REVALIDATE_SECONDS: int = 300
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL_SECONDS: float = 300.0
+    RESPONSE_CACHE_LOCK_SECONDS: float = 5.0
+    FRAGMENT_CACHE_MAX_ENTRIES: int = 100_000
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    WARMUP_ENABLED: bool = True
+    HEALTH_CHECK_INTERVAL_SECONDS: float = 10.0
+    HEALTH_CHECK_MAX_AGE_SECONDS: float = 30.0
+    HEALTH_PROBE_TIMEOUT_SECONDS: float = 2.0
+    METRICS_ENABLED: bool = True
+    QUERY_BUDGET_ENABLED: bool = True
+    QUERY_BUDGET_STRICT: bool = False
+    QUERY_REPEAT_THRESHOLD: int = 2
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
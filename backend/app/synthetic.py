@@ -0,0 +1,178 @@
+"""Deterministic synthetic catalogs for query-plan checks and benchmarks."""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models import (
+    AlcoholLevel,
+    Cocktail,
+    Difficulty,
+    Occasion,
+    Vibe,
+    cocktail_occasions,
+    cocktail_vibes,
+)
+from app.ranking import compute_complexity
+
+DIFFICULTY_IDS = ("difficulty-easy", "difficulty-balanced", "difficulty-advanced")
+ALCOHOL_LEVEL_IDS = ("alcohol-none", "alcohol-light", "alcohol-strong")
+INSERT_BATCH_SIZE = 5_000
+INGREDIENT_NAMES = (
+    "London dry gin",
+    "Fresh lime juice",
+    "Rich simple syrup",
+    "Angostura bitters",
+    "Chilled soda water",
+    "Mint leaves",
+    "Orange liqueur",
+)
+STEP_TEXTS = (
+    "Add every ingredient except the soda to a shaker filled with ice.",
+    "Shake hard for twelve seconds until the tin is frosted.",
+    "Double strain into a chilled glass over fresh ice.",
+    "Top with soda and garnish before serving.",
+)
+
+
+@dataclass(frozen=True)
+class SyntheticCatalog:
+    cocktails: int
+    vibes: int = 24
+    occasions: int = 16
+    seed: int = 7
+
+    @property
+    def vibe_ids(self) -> list[str]:
+        return [f"vibe-{index:03d}" for index in range(self.vibes)]
+
+    @property
+    def occasion_ids(self) -> list[str]:
+        return [f"occasion-{index:03d}" for index in range(self.occasions)]
+
+
+def iter_batches(rows: Iterator[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def build_cocktail_content(index: int) -> dict[str, Any]:
+    """Detail columns sized like a hand-written recipe, derived from ``index`` alone."""
+    return {
+        "ingredients": [
+            {
+                "name": INGREDIENT_NAMES[(index + offset) % len(INGREDIENT_NAMES)],
+                "amount": str(offset + 1),
+                "unit": "oz",
+            }
+            for offset in range(5)
+        ],
+        "steps": list(STEP_TEXTS),
+        "tags": {
+            "spirit": [INGREDIENT_NAMES[index % len(INGREDIENT_NAMES)]],
+            "flavor": ["citrus", "herbal"] if index % 2 else ["bitter"],
+        },
+    }
+
+
+def iter_cocktail_rows(catalog: SyntheticCatalog) -> Iterator[dict[str, Any]]:
+    generator = random.Random(catalog.seed)
+    for index in range(catalog.cocktails):
+        content = build_cocktail_content(index)
+        yield {
+            "id": f"cocktail-{index:07d}",
+            "name": f"Synthetic Cocktail {generator.randrange(catalog.cocktails):07d}",
+            "description": "Generated for load and query-plan testing.",
+            "image_url": None,
+            "rank": generator.randrange(100),
+            **content,
+            "complexity": compute_complexity(content["ingredients"], content["steps"]),
+            "glassware": None,
+            "garnish": None,
+            "difficulty_id": generator.choice(DIFFICULTY_IDS),
+            "alcohol_level_id": generator.choice(ALCOHOL_LEVEL_IDS),
+        }
+
+
+def iter_link_rows(
+    catalog: SyntheticCatalog, key_ids: list[str], key_column: str, max_links: int, seed: int
+) -> Iterator[dict[str, str]]:
+    generator = random.Random(seed)
+    for index in range(catalog.cocktails):
+        for key_id in generator.sample(key_ids, generator.randint(1, max_links)):
+            yield {"cocktail_id": f"cocktail-{index:07d}", key_column: key_id}
+
+
+def insert_synthetic_catalog(session: Session, catalog: SyntheticCatalog) -> None:
+    """Insert lookup rows plus ``catalog.cocktails`` cocktails, each tagged with a few
+    vibes and occasions, in batched multi-row inserts."""
+    session.add_all(
+        [Difficulty(id=item, label=item, rank=rank) for rank, item in enumerate(DIFFICULTY_IDS)]
+        + [
+            AlcoholLevel(id=item, label=item, rank=rank)
+            for rank, item in enumerate(ALCOHOL_LEVEL_IDS)
+        ]
+        + [Vibe(id=item, name=item, description=item, icon=None) for item in catalog.vibe_ids]
+        + [Occasion(id=item, name=item, description=item) for item in catalog.occasion_ids]
+    )
+    session.flush()
+    row_sources = (
+        (Cocktail.__table__, iter_cocktail_rows(catalog)),
+        (
+            cocktail_vibes,
+            iter_link_rows(catalog, catalog.vibe_ids, "vibe_id", 3, catalog.seed + 1),
+        ),
+        (
+            cocktail_occasions,
+            iter_link_rows(catalog, catalog.occasion_ids, "occasion_id", 2, catalog.seed + 2),
+        ),
+    )
+    for table, rows in row_sources:
+        for batch in iter_batches(rows, INSERT_BATCH_SIZE):
+            session.execute(insert(table), batch)
+
+
+def build_synthetic_seed_data(catalog: SyntheticCatalog) -> dict[str, list[dict[str, Any]]]:
+    """Return the catalog in the ``seedData.ts`` payload shape consumed by ``app.seed``."""
+    generator = random.Random(catalog.seed)
+    cocktails = []
+    for row in iter_cocktail_rows(catalog):
+        cocktails.append(
+            {
+                "id": row["id"],
+                "name": row["name"],
+                "description": row["description"],
+                "imageUrl": row["image_url"],
+                "ingredients": row["ingredients"],
+                "steps": row["steps"],
+                "tags": row["tags"],
+                "difficultyId": row["difficulty_id"],
+                "alcoholLevelId": row["alcohol_level_id"],
+                "vibeIds": generator.sample(catalog.vibe_ids, generator.randint(1, 3)),
+                "occasionIds": generator.sample(catalog.occasion_ids, generator.randint(1, 2)),
+            }
+        )
+    return {
+        "vibes": [
+            {"id": item, "name": item, "description": item, "imageUrl": None}
+            for item in catalog.vibe_ids
+        ],
+        "occasions": [
+            {"id": item, "name": item, "description": item} for item in catalog.occasion_ids
+        ],
+        "difficulties": [
+            {"id": item, "label": item, "rank": rank} for rank, item in enumerate(DIFFICULTY_IDS)
+        ],
+        "alcoholLevels": [
+            {"id": item, "label": item, "rank": rank}
+            for rank, item in enumerate(ALCOHOL_LEVEL_IDS)
+        ],
+        "cocktails": cocktails,
+    }
@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
-from sqlalchemy import create_engine, func, select, text
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event, func, select, text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, sessionmaker
 
-from app.db import Base
-from app.models import AlcoholLevel, Cocktail, Difficulty, Occasion, Vibe
-from app.seed import collect_seed_check_errors, insert_seed_data, load_seed_data
+from app import seed as seed_module
+from app.catalog import read_catalog_version
+from app.db import Base, create_session, dispose_engines, get_engine
+from app.models import AlcoholLevel, Cocktail, Difficulty, Occasion, Vibe, cocktail_vibes
+from app.seed import (
+    collect_seed_check_errors,
+    insert_seed_data,
+    load_seed_data,
+    plan_seed,
+    run_seed,
+    verify_seed_data,
+)
 
 
 def create_test_session() -> Session:
@@ -105,3 +118,165 @@ def test_seed_rerun_is_idempotent() -> None:
         assert_counts_match_seed(session, seed_data)
     finally:
         session.close()
+
+
+def test_seed_batches_upserts_and_diffs_associations() -> None:
+    session = create_test_session()
+    try:
+        seed_data = load_seed_data()
+        insert_seed_data(session, seed_data, batch_size=2)
+        session.commit()
+        assert_counts_match_seed(session, seed_data)
+
+        cocktail = seed_data["cocktails"][0]
+        cocktail["name"] = "Renamed Cocktail"
+        cocktail["vibeIds"] = cocktail["vibeIds"][:1]
+        statements: list[str] = []
+        event.listen(
+            session.get_bind(),
+            "before_cursor_execute",
+            lambda _conn, _cursor, statement, *_args: statements.append(statement),
+        )
+        insert_seed_data(session, seed_data, batch_size=2)
+        session.commit()
+
+        assert session.get(Cocktail, cocktail["id"]).name == "Renamed Cocktail"
+        linked_vibes = session.execute(
+            select(cocktail_vibes.c.vibe_id).where(cocktail_vibes.c.cocktail_id == cocktail["id"])
+        ).scalars()
+        assert list(linked_vibes) == cocktail["vibeIds"]
+        link_writes = [
+            statement.split(" ")[0]
+            for statement in statements
+            if "cocktail_vibes" in statement and not statement.startswith("SELECT")
+        ]
+        assert link_writes == ["DELETE"]
+    finally:
+        session.close()
+
+
+def test_seed_rejects_unknown_references() -> None:
+    session = create_test_session()
+    try:
+        seed_data = build_minimal_seed_data()
+        seed_data["cocktails"][0]["vibeIds"] = ["vibe-missing"]
+
+        with pytest.raises(ValueError, match="vibe-missing"):
+            insert_seed_data(session, seed_data)
+    finally:
+        session.close()
+
+
+def test_seed_writes_only_changed_entities() -> None:
+    session = create_test_session()
+    try:
+        seed_data = load_seed_data()
+        first_plan = insert_seed_data(session, seed_data)
+        session.commit()
+        assert first_plan.diffs["cocktails"].inserted == [
+            payload["id"] for payload in seed_data["cocktails"]
+        ]
+
+        assert not insert_seed_data(session, seed_data).changed
+
+        removed = seed_data["cocktails"].pop()
+        seed_data["cocktails"][0]["description"] = "Updated description."
+        plan = insert_seed_data(session, seed_data)
+        session.commit()
+
+        diff = plan.diffs["cocktails"]
+        assert diff.updated == [seed_data["cocktails"][0]["id"]]
+        assert diff.deleted == [removed["id"]]
+        assert diff.unchanged == len(seed_data["cocktails"]) - 1
+        assert session.get(Cocktail, removed["id"]) is None
+        assert not session.execute(
+            select(cocktail_vibes).where(cocktail_vibes.c.cocktail_id == removed["id"])
+        ).all()
+        assert not plan_seed(session, seed_data).changed
+    finally:
+        session.close()
+
+
+def test_run_seed_bumps_version_only_on_change(tmp_path: Path) -> None:
+    database_url = f"sqlite+pysqlite:///{tmp_path / 'seed.db'}"
+    Base.metadata.create_all(get_engine(database_url))
+    config = {"database_url": database_url}
+
+    def read_version() -> str | None:
+        with create_session(database_url) as session:
+            return read_catalog_version(session)
+
+    try:
+        assert run_seed({**config, "dry_run": True}) == 0
+        assert read_version() is None
+
+        run_seed(config)
+        first_version = read_version()
+        run_seed(config)
+
+        assert first_version is not None
+        assert read_version() == first_version
+    finally:
+        dispose_engines()
+
+
+def test_seed_accepts_streamed_exports() -> None:
+    session = create_test_session()
+    try:
+        plan = insert_seed_data(session, load_seed_data(stream=True), batch_size=2)
+        session.commit()
+
+        assert plan.changed
+        assert_counts_match_seed(session, load_seed_data())
+        assert not plan_seed(session, load_seed_data(stream=True)).changed
+    finally:
+        session.close()
+
+
+def test_verification_lists_missing_and_unexpected_ids_in_one_query() -> None:
+    session = create_test_session()
+    try:
+        seed_data = build_minimal_seed_data()
+        insert_seed_data(session, seed_data)
+        session.add(Occasion(id="occasion-extra", name="Extra", description="Not seeded."))
+        session.commit()
+        seed_data["vibes"].append({"id": "vibe-missing", "name": "Missing", "description": "-"})
+        statements: list[str] = []
+        event.listen(
+            session.get_bind(),
+            "before_cursor_execute",
+            lambda _conn, _cursor, statement, *_args: statements.append(statement),
+        )
+
+        verification = verify_seed_data(session, seed_data)
+
+        assert verification.errors() == ["Missing vibes IDs: ['vibe-missing']"]
+        assert verification.warnings() == ["Unexpected occasions IDs: ['occasion-extra']"]
+        assert sum(statement.lstrip().startswith("SELECT") for statement in statements) == 1
+    finally:
+        session.close()
+
+
+def test_failed_verification_keeps_its_error_and_drops_the_staging_table(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = create_test_session()
+    try:
+        seed_data = load_seed_data()
+        insert_seed_data(session, seed_data)
+
+        def fail_query() -> None:
+            raise RuntimeError("check query failed")
+
+        def aborted_drop(*_: object) -> None:
+            raise SQLAlchemyError("current transaction is aborted")
+
+        monkeypatch.setattr(seed_module, "build_seed_check_query", fail_query)
+        with pytest.raises(RuntimeError, match="check query failed"):
+            verify_seed_data(session, seed_data)
+
+        monkeypatch.setattr(seed_module.seed_expected_ids, "drop", aborted_drop)
+        with pytest.raises(RuntimeError, match="check query failed"):
+            verify_seed_data(session, seed_data)
+    finally:
+        session.close()
@@ -0,0 +1,107 @@
+"""Tests for seed source compilation."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app import seed_source
+from app.seed_source import SeedExport, SeedSourceParser, load_compiled_exports
+
+SOURCE = """import type { Vibe } from '../models';
+
+// Leading comment with an apostrophe: don't stop here.
+export const vibes: Vibe[] = [
+  {
+    id: 'vibe-one',
+    name: 'Bartender\\'s Choice',
+    description: "Mom's \\"famous\\" punch",
+    'quoted-key': 1.5,
+    tags: ['a', /* inline */ 'b',],
+    active: true,
+    icon: null,
+  },
+];
+
+export const helper = (): string[] => [];
+
+export const cocktails = [{ id: 'cocktail-one', steps: ['Shake\\nstrain'] }];
+"""
+
+
+def write_source(tmp_path: Path, source: str = SOURCE) -> Path:
+    source_path = tmp_path / "seedData.ts"
+    source_path.write_text(source, encoding="utf-8")
+    return source_path
+
+
+def test_parser_reads_every_export_in_one_scan() -> None:
+    parser = SeedSourceParser(SOURCE)
+    exports = {name: list(items) for name, items in parser.iter_exports(["vibes", "cocktails"])}
+
+    assert exports["vibes"] == [
+        {
+            "id": "vibe-one",
+            "name": "Bartender's Choice",
+            "description": 'Mom\'s "famous" punch',
+            "quoted-key": 1.5,
+            "tags": ["a", "b"],
+            "active": True,
+            "icon": None,
+        }
+    ]
+    assert exports["cocktails"] == [{"id": "cocktail-one", "steps": ["Shake\nstrain"]}]
+
+
+def test_parser_reports_missing_exports_and_bad_input() -> None:
+    with pytest.raises(ValueError, match="Seed export not found: occasions"):
+        list(SeedSourceParser(SOURCE).iter_exports(["occasions"]))
+
+    parser = SeedSourceParser("export const vibes = [{ id: undefinedValue }];")
+    with pytest.raises(ValueError, match="line 1: unsupported identifier"):
+        for _, items in parser.iter_exports(["vibes"]):
+            list(items)
+
+
+def test_compiled_artifact_is_reused_until_source_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source_path = write_source(tmp_path)
+    cache_dir = tmp_path / "cache"
+    first = load_compiled_exports(source_path, cache_dir, ["vibes", "cocktails"])
+
+    def fail_parse(_: str) -> SeedSourceParser:
+        raise AssertionError("An unchanged source should not be parsed again.")
+
+    monkeypatch.setattr(seed_source, "SeedSourceParser", fail_parse)
+    assert load_compiled_exports(source_path, cache_dir, ["vibes", "cocktails"]) == first
+
+    monkeypatch.undo()
+    write_source(tmp_path, SOURCE.replace("cocktail-one", "cocktail-two"))
+    changed = load_compiled_exports(source_path, cache_dir, ["vibes", "cocktails"])
+
+    assert changed["cocktails"][0]["id"] == "cocktail-two"
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_failed_compile_leaves_no_staging_dir(tmp_path: Path) -> None:
+    source_path = write_source(tmp_path, "export const vibes = [{ id: undefinedValue }];")
+    cache_dir = tmp_path / "cache"
+
+    with pytest.raises(ValueError, match="unsupported identifier"):
+        load_compiled_exports(source_path, cache_dir, ["vibes"])
+
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_stream_mode_reads_records_lazily(tmp_path: Path) -> None:
+    source_path = write_source(tmp_path)
+
+    exports = load_compiled_exports(
+        source_path, tmp_path / "cache", ["vibes", "cocktails"], stream=True
+    )
+
+    assert isinstance(exports["cocktails"], SeedExport)
+    assert [item["id"] for item in exports["cocktails"]] == ["cocktail-one"]
+    assert [item["id"] for item in exports["cocktails"]] == ["cocktail-one"]
@@ -0,0 +1,131 @@
+"""Startup warm-up: pay the one-time costs of a fresh worker before it reports ready."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from contextlib import AsyncExitStack, ExitStack
+from dataclasses import dataclass
+from functools import lru_cache
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class WarmupStep:
+    """One named piece of warm-up; blocking callables run in a worker thread."""
+
+    name: str
+    run: Callable[[], object] | Callable[[], Awaitable[object]]
+
+
+@dataclass(frozen=True)
+class StepResult:
+    ok: bool
+    duration_ms: float
+
+
+def pool_target_size(pool: object) -> int:
+    """Connections a pool keeps open between requests; pools without a queue keep one."""
+    return getattr(pool, "size", lambda: 1)()
+
+
+def preconnect_pool(engine: Engine) -> int:
+    """Open every connection the pool keeps so early requests skip the connect handshake."""
+    with ExitStack() as stack:
+        connections = [
+            stack.enter_context(engine.connect()) for _ in range(pool_target_size(engine.pool))
+        ]
+    return len(connections)
+
+
+async def preconnect_async_pool(engine: AsyncEngine) -> int:
+    async with AsyncExitStack() as stack:
+        connections = [
+            await stack.enter_async_context(engine.connect())
+            for _ in range(pool_target_size(engine.pool))
+        ]
+    return len(connections)
+
+
+class Warmup:
+    """Runs the warm-up steps once, in order, and records how long each took.
+
+    The worker is ready once every step has run. A failing step is logged and reported but does
+    not hold readiness back: the dependency probes already cover an unreachable database, and
+    whatever the step would have primed is then paid for by the first request instead.
+    """
+
+    def __init__(self) -> None:
+        self.results: dict[str, StepResult] = {}
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self.finished_at is not None
+
+    @property
+    def duration_ms(self) -> float | None:
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return (self.finished_at - self.started_at) * 1000
+
+    async def run(self, steps: Sequence[WarmupStep]) -> None:
+        self.started_at = time.perf_counter()
+        for step in steps:
+            started = time.perf_counter()
+            try:
+                if inspect.iscoroutinefunction(step.run):
+                    await step.run()
+                else:
+                    await asyncio.to_thread(step.run)
+                ok = True
+            except Exception:
+                logger.exception("Warm-up step %s failed.", step.name)
+                ok = False
+            self.results[step.name] = StepResult(ok, (time.perf_counter() - started) * 1000)
+        self.finished_at = time.perf_counter()
+        logger.info("Warm-up finished in %.1f ms.", self.duration_ms)
+
+    def start(self, steps: Sequence[WarmupStep]) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self.run(steps), name="warmup")
+
+    def skip(self) -> None:
+        """Report ready without warming, for workers that opt out."""
+        self.started_at = self.finished_at = time.perf_counter()
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+def serialize_warmup(warmup: Warmup) -> dict[str, object]:
+    duration_ms = warmup.duration_ms
+    return {
+        "ready": warmup.ready,
+        "durationMs": None if duration_ms is None else round(duration_ms, 3),
+        "steps": {
+            name: {"ok": result.ok, "durationMs": round(result.duration_ms, 3)}
+            for name, result in warmup.results.items()
+        },
+    }
+
+
+@lru_cache(maxsize=1)
+def get_warmup() -> Warmup:
+    return Warmup()
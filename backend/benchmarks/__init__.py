@@ -0,0 +1 @@
+"""Benchmarks for the Vibe & Sip backend."""
@@ -0,0 +1,68 @@
+"""Compare concurrency and tail latency of the sync and async catalog routes.
+
+Run from ``backend/``::
+
+    poetry run python -m benchmarks.bench_async --concurrency 64 --requests 2000
+    poetry run python -m benchmarks.bench_async --database-url postgresql+psycopg://...
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+
+import httpx
+from fastapi import FastAPI
+
+from app import main as main_module
+from app.db import dispose_async_engines, dispose_engines
+from benchmarks.common import create_seeded_sqlite_database, run_concurrently, use_database
+
+PATHS = ["/vibes", "/cocktails?difficulty=", "/cocktails/cocktail-citrus-negroni"]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark sync vs async catalog routes.")
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    return parser.parse_args()
+
+
+def build_app(use_async: bool) -> FastAPI:
+    benchmark_app = FastAPI()
+    main_module.include_catalog_routes(benchmark_app, use_async=use_async)
+    return benchmark_app
+
+
+async def benchmark_mode(use_async: bool, total: int, concurrency: int) -> dict[str, object]:
+    transport = httpx.ASGITransport(app=build_app(use_async))
+    results: dict[str, object] = {}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for path in PATHS:
+
+            async def request(path: str = path) -> None:
+                response = await client.get(path)
+                response.raise_for_status()
+
+            results[path] = await run_concurrently(request, total, concurrency)
+    return results
+
+
+async def run(args: argparse.Namespace) -> dict[str, object]:
+    use_database(args.database_url or create_seeded_sqlite_database())
+    report: dict[str, object] = {"concurrency": args.concurrency}
+    for mode, use_async in (("sync", False), ("async", True)):
+        report[mode] = await benchmark_mode(use_async, args.requests, args.concurrency)
+        dispose_engines()
+        await dispose_async_engines()
+    return report
+
+
+def main() -> None:
+    print(json.dumps(asyncio.run(run(parse_args())), indent=2))
+
+
+if __name__ == "__main__":
+    main()
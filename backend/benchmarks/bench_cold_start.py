@@ -0,0 +1,147 @@
+"""Measure cold start: from spawning an API worker to its first successful response.
+
+Seeds a synthetic catalog, then repeatedly spawns ``uvicorn app.main:app`` on a free port
+with warm-up enabled and disabled. Each run polls ``/health/ready`` the way a load balancer
+would and sends the first real request as soon as it reports 200, so ``firstOkMs`` is process
+spawn to the first 200 on ``--path``. ``firstRequestMs`` is that first request's own latency
+and ``steadyP50Ms`` the median of the requests after it. Run from ``backend/``::
+
+    poetry run python -m benchmarks.bench_cold_start --cocktails 10000 --runs 5
+
+Pass ``--output cold-start.jsonl`` to append the report as one line, to track it over time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+
+from app.synthetic import SyntheticCatalog
+from benchmarks.common import (
+    create_sqlite_database_url,
+    create_synthetic_database,
+    percentile,
+)
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+POLL_INTERVAL_SECONDS = 0.005
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark worker cold start.")
+    parser.add_argument("--cocktails", type=int, default=10_000)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--runs", type=int, default=5, help="Worker spawns per mode.")
+    parser.add_argument("--path", default="/cocktails?vibe=&difficulty=&limit=12")
+    parser.add_argument("--steady-requests", type=int, default=50)
+    parser.add_argument("--timeout", type=float, default=120.0, help="Seconds to wait for ready.")
+    parser.add_argument("--db-async", action="store_true", help="Serve the async routes.")
+    parser.add_argument("--output", default=None, help="Append the report to this JSONL file.")
+    return parser.parse_args()
+
+
+def find_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def spawn_worker(database_url: str, port: int, warmup: bool, db_async: bool) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "WARMUP_ENABLED": str(warmup).lower(),
+        "DB_ASYNC": str(db_async).lower(),
+    }
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port)]
+        + ["--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+
+
+def wait_until(client: httpx.Client, path: str, deadline: float) -> float | None:
+    """Poll ``path`` until it answers 200; return when the first response of any kind came."""
+    listening_at = None
+    while time.perf_counter() < deadline:
+        try:
+            response = client.get(path)
+        except httpx.TransportError:
+            time.sleep(POLL_INTERVAL_SECONDS)
+            continue
+        listening_at = listening_at or time.perf_counter()
+        if response.status_code == 200:
+            return listening_at
+        time.sleep(POLL_INTERVAL_SECONDS)
+    raise TimeoutError(f"Worker did not answer 200 on {path} in time.")
+
+
+def measure_run(database_url: str, args: argparse.Namespace, warmup: bool) -> dict[str, float]:
+    port = find_free_port()
+    spawned = time.perf_counter()
+    worker = spawn_worker(database_url, port, warmup, args.db_async)
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=args.timeout) as client:
+            listening_at = wait_until(client, "/health/ready", spawned + args.timeout)
+            ready_at = time.perf_counter()
+            client.get(args.path).raise_for_status()
+            first_ok_at = time.perf_counter()
+            samples = []
+            for _ in range(args.steady_requests):
+                started = time.perf_counter()
+                client.get(args.path).raise_for_status()
+                samples.append(time.perf_counter() - started)
+    finally:
+        worker.terminate()
+        worker.wait()
+    return {
+        "listeningMs": (listening_at - spawned) * 1000,
+        "readyMs": (ready_at - spawned) * 1000,
+        "firstOkMs": (first_ok_at - spawned) * 1000,
+        "firstRequestMs": (first_ok_at - ready_at) * 1000,
+        "steadyP50Ms": percentile(samples, 0.50) * 1000,
+    }
+
+
+def summarize_runs(runs: list[dict[str, float]]) -> dict[str, float]:
+    """Median of each measurement across runs, in milliseconds."""
+    return {key: round(statistics.median(run[key] for run in runs), 3) for key in runs[0]}
+
+
+def main() -> None:
+    args = parse_args()
+    database_url = args.database_url or create_sqlite_database_url()
+    if args.database_url is None:
+        create_synthetic_database(database_url, SyntheticCatalog(cocktails=args.cocktails))
+    report = {
+        "measuredAt": datetime.now(UTC).isoformat(timespec="seconds"),
+        "cocktails": args.cocktails,
+        "runs": args.runs,
+        "path": args.path,
+        "dbAsync": args.db_async,
+        "modes": {
+            mode: summarize_runs(
+                [measure_run(database_url, args, warmup) for _ in range(args.runs)]
+            )
+            for mode, warmup in (("warmup", True), ("noWarmup", False))
+        },
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as output:
+            output.write(json.dumps(report) + "\n")
+
+
+if __name__ == "__main__":
+    main()
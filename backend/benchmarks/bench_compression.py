@@ -0,0 +1,133 @@
+"""Measure bytes on the wire and CPU per request for each response encoding.
+
+Seeds a synthetic catalog, stamps a catalog version and drives the catalog endpoints through
+an app carrying the conditional-GET and compression middlewares, once compressing every
+response and once serving compressed bodies from the per-version cache. For each path and
+encoding the report gives the body size sent and the process CPU time per request. Run from
+``backend/``::
+
+    poetry run python -m benchmarks.bench_compression --cocktails 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy.orm import Session
+
+from app import main as main_module
+from app.catalog import bump_catalog_version, get_catalog_manager
+from app.compression import CompressedBodyCache, CompressionMiddleware, available_encodings
+from app.db import build_engine, dispose_engines
+from app.http_cache import ConditionalGetMiddleware, build_cache_control
+from app.synthetic import SyntheticCatalog
+from benchmarks.common import (
+    create_sqlite_database_url,
+    create_synthetic_database,
+    use_database,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark response compression.")
+    parser.add_argument("--cocktails", type=int, default=10_000)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--requests", type=int, default=200, help="Requests per path.")
+    parser.add_argument("--minimum-size", type=int, default=1024)
+    return parser.parse_args()
+
+
+def build_app(cache: CompressedBodyCache | None, minimum_size: int) -> FastAPI:
+    benchmark_app = FastAPI()
+    main_module.include_catalog_routes(benchmark_app, use_async=False)
+    benchmark_app.add_middleware(
+        ConditionalGetMiddleware,
+        version_provider=main_module.current_catalog_version,
+        cache_control=build_cache_control(60, 300),
+    )
+    benchmark_app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=minimum_size,
+        cache=cache,
+        version_provider=main_module.current_catalog_version,
+    )
+    return benchmark_app
+
+
+def build_paths(catalog: SyntheticCatalog) -> dict[str, str]:
+    detail_ids = ",".join(f"cocktail-{index:07d}" for index in range(0, 50))
+    return {
+        "vibes": "/vibes",
+        "list": "/cocktails?difficulty=&limit=12",
+        "listLarge": f"/cocktails?vibe={catalog.vibe_ids[0]}&difficulty=&limit=100",
+        "detail": "/cocktails/cocktail-0000001",
+        "details50": f"/cocktails/details?ids={detail_ids}",
+    }
+
+
+async def measure(
+    benchmark_app: FastAPI, path: str, encoding: str, requests: int
+) -> dict[str, float]:
+    transport = httpx.ASGITransport(app=benchmark_app)
+    headers = {"Accept-Encoding": encoding}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.get(path, headers=headers)
+        response.raise_for_status()
+        cpu_started = time.process_time()
+        for _ in range(requests):
+            await client.get(path, headers=headers)
+        cpu_seconds = time.process_time() - cpu_started
+    return {
+        "bytes": int(response.headers["content-length"]),
+        "contentEncoding": response.headers.get("content-encoding", "identity"),
+        "cpuMicrosecondsPerRequest": round(cpu_seconds / requests * 1_000_000, 1),
+    }
+
+
+async def run(args: argparse.Namespace) -> dict[str, object]:
+    catalog = SyntheticCatalog(cocktails=args.cocktails)
+    database_url = args.database_url or create_sqlite_database_url()
+    create_synthetic_database(database_url, catalog)
+    engine = build_engine(database_url)
+    with Session(engine) as session:
+        bump_catalog_version(session)
+        session.commit()
+    engine.dispose()
+    use_database(database_url)
+    get_catalog_manager().refresh()
+
+    variants = {
+        "perRequest": build_app(None, args.minimum_size),
+        "cached": build_app(CompressedBodyCache(256 * 1024 * 1024), args.minimum_size),
+    }
+    encodings = ("identity", *available_encodings())
+    report: dict[str, object] = {}
+    for name, path in build_paths(catalog).items():
+        report[name] = {
+            variant: {
+                encoding: await measure(benchmark_app, path, encoding, args.requests)
+                for encoding in encodings
+            }
+            for variant, benchmark_app in variants.items()
+        }
+    dispose_engines()
+    return report
+
+
+def main() -> None:
+    args = parse_args()
+    report = {
+        "cocktails": args.cocktails,
+        "requests": args.requests,
+        "paths": asyncio.run(run(args)),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Compare loading full ``Cocktail`` entities with the projected list-row columns.
+
+For each synthetic catalog size, reads the whole list ordering both ways and reports the raw
+bytes the driver returned per row and the time spent turning them into Python objects per
+row, plus page latency at random offsets. Run from ``backend/``::
+
+    poetry run python -m benchmarks.bench_projection --sizes 1000,100000
+    poetry run python -m benchmarks.bench_projection --database-url postgresql+psycopg://...
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from collections.abc import Callable
+
+from sqlalchemy import Engine, Select, select
+from sqlalchemy.orm import Session, undefer_group
+
+from app.db import build_engine
+from app.main import build_cocktails_query
+from app.models import COCKTAIL_DETAIL_GROUP, Cocktail
+from app.synthetic import SyntheticCatalog
+from benchmarks.common import (
+    create_sqlite_database_url,
+    create_synthetic_database,
+    summarize_latencies,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark list-path column projection.")
+    parser.add_argument("--sizes", default="1000,100000", help="Comma-separated cocktail counts.")
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--limit", type=int, default=100, help="Rows per sampled page.")
+    parser.add_argument("--pages", type=int, default=200, help="Random pages to time.")
+    return parser.parse_args()
+
+
+def build_entity_query() -> Select:
+    """The list query as it was before projection: whole entities, JSON columns included."""
+    return (
+        select(Cocktail)
+        .options(undefer_group(COCKTAIL_DETAIL_GROUP))
+        .order_by(Cocktail.rank, Cocktail.name, Cocktail.id)
+    )
+
+
+def build_projected_query() -> Select:
+    return build_cocktails_query("", "", "")
+
+
+def measure_raw_bytes(engine: Engine, query: Select) -> int:
+    """Sum the size of every value the driver hands back, before any type processing."""
+    compiled = query.compile(engine)
+    total = 0
+    with engine.connect() as connection:
+        for row in connection.exec_driver_sql(str(compiled), compiled.params or ()):
+            for value in row:
+                if isinstance(value, str):
+                    total += len(value.encode())
+                elif isinstance(value, bytes):
+                    total += len(value)
+                elif value is not None:
+                    total += 8
+    return total
+
+
+def time_full_read(engine: Engine, query: Select, fetch: Callable) -> tuple[int, float]:
+    with Session(engine) as session:
+        started = time.perf_counter()
+        rows = fetch(session.execute(query))
+        return len(rows), time.perf_counter() - started
+
+
+def time_pages(
+    engine: Engine, query: Select, fetch: Callable, offsets: list[int], limit: int
+) -> dict[str, float]:
+    samples = []
+    started = time.perf_counter()
+    with Session(engine) as session:
+        for offset in offsets:
+            page_started = time.perf_counter()
+            fetch(session.execute(query.offset(offset).limit(limit)))
+            samples.append(time.perf_counter() - page_started)
+            session.expunge_all()
+    return summarize_latencies(samples, time.perf_counter() - started)
+
+
+def benchmark_catalog(
+    database_url: str, cocktails: int, args: argparse.Namespace
+) -> dict[str, object]:
+    catalog = SyntheticCatalog(cocktails=cocktails)
+    create_synthetic_database(database_url, catalog)
+    engine = build_engine(database_url)
+    generator = random.Random(catalog.seed)
+    offsets = [generator.randrange(max(1, cocktails - args.limit)) for _ in range(args.pages)]
+    variants = {
+        "entities": (build_entity_query(), lambda result: result.scalars().all()),
+        "projection": (build_projected_query(), lambda result: result.all()),
+    }
+    report: dict[str, object] = {"cocktails": cocktails}
+    for name, (query, fetch) in variants.items():
+        raw_bytes = measure_raw_bytes(engine, query)
+        rows, seconds = time_full_read(engine, query, fetch)
+        report[name] = {
+            "bytesPerRow": round(raw_bytes / rows, 1),
+            "totalMegabytes": round(raw_bytes / 1_000_000, 2),
+            "decodeMicrosecondsPerRow": round(seconds / rows * 1_000_000, 2),
+            "pages": time_pages(engine, query, fetch, offsets, args.limit),
+        }
+    engine.dispose()
+    return report
+
+
+def main() -> None:
+    args = parse_args()
+    report = {
+        "limit": args.limit,
+        "runs": [
+            benchmark_catalog(
+                args.database_url or create_sqlite_database_url(), int(size), args
+            )
+            for size in args.sizes.split(",")
+        ],
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
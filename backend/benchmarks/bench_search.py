@@ -0,0 +1,99 @@
+"""Measure search index build time and ``SearchIndex.search`` latency.
+
+For each synthetic catalog size, loads the catalog and search indexes the way the API process
+does, then times a fixed mix of exact, multi-term, prefix and misspelled queries at shallow
+and deep pages. Run from ``backend/``::
+
+    poetry run python -m benchmarks.bench_search --sizes 1000,100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+from sqlalchemy.orm import Session
+
+from app.catalog import load_catalog_index
+from app.db import build_engine
+from app.search import SearchIndex, load_search_documents
+from app.synthetic import SyntheticCatalog
+from benchmarks.common import (
+    create_sqlite_database_url,
+    create_synthetic_database,
+    summarize_latencies,
+)
+
+QUERIES = (
+    "gin",
+    "lime gin",
+    "angostura bitters citrus",
+    "orange liq",
+    "mint herbal soda",
+    "bitterz",
+    "synthetic cocktail 0001234",
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the in-memory search index.")
+    parser.add_argument("--sizes", default="1000,100000", help="Comma-separated cocktail counts.")
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--limit", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=50, help="Timed runs per query and page.")
+    return parser.parse_args()
+
+
+def time_query(index: SearchIndex, query: str, offset: int, limit: int, repeat: int) -> dict:
+    samples = []
+    started = time.perf_counter()
+    for _ in range(repeat):
+        query_started = time.perf_counter()
+        page = index.search(query, offset, limit)
+        samples.append(time.perf_counter() - query_started)
+    return {"total": page.total, **summarize_latencies(samples, time.perf_counter() - started)}
+
+
+def benchmark_catalog(
+    database_url: str, cocktails: int, args: argparse.Namespace
+) -> dict[str, object]:
+    create_synthetic_database(database_url, SyntheticCatalog(cocktails=cocktails))
+    engine = build_engine(database_url)
+    with Session(engine) as session:
+        catalog_index = load_catalog_index(session, None)
+        started = time.perf_counter()
+        search_index = SearchIndex(load_search_documents(session, catalog_index.positions))
+        build_seconds = time.perf_counter() - started
+    engine.dispose()
+    deep_offset = max(0, cocktails // 2)
+    return {
+        "cocktails": cocktails,
+        "buildSeconds": round(build_seconds, 3),
+        "terms": len(search_index.vocabulary),
+        "queries": {
+            query: {
+                "firstPage": time_query(search_index, query, 0, args.limit, args.repeat),
+                "deepPage": time_query(search_index, query, deep_offset, args.limit, args.repeat),
+            }
+            for query in QUERIES
+        },
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    report = {
+        "limit": args.limit,
+        "runs": [
+            benchmark_catalog(
+                args.database_url or create_sqlite_database_url(), int(size), args
+            )
+            for size in args.sizes.split(",")
+        ],
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
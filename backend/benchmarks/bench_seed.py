@@ -0,0 +1,60 @@
+"""Time a cold seed and an unchanged re-seed of synthetic catalogs.
+
+Run from ``backend/``::
+
+    poetry run python -m benchmarks.bench_seed --sizes 1000,100000 --batch-size 2000
+    poetry run python -m benchmarks.bench_seed --database-url postgresql+psycopg://...
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+from sqlalchemy.orm import Session
+
+from app.db import Base, build_engine
+from app.seed import DEFAULT_BATCH_SIZE, insert_seed_data
+from app.synthetic import SyntheticCatalog, build_synthetic_seed_data
+from benchmarks.common import create_sqlite_database_url
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark bulk seeding.")
+    parser.add_argument("--sizes", default="1000,100000", help="Comma-separated cocktail counts.")
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    return parser.parse_args()
+
+
+def time_seed(database_url: str, cocktails: int, batch_size: int) -> dict[str, object]:
+    seed_data = build_synthetic_seed_data(SyntheticCatalog(cocktails=cocktails))
+    engine = build_engine(database_url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    timings: dict[str, object] = {"cocktails": cocktails}
+    for run in ("coldSeconds", "reseedSeconds"):
+        started = time.perf_counter()
+        with Session(engine) as session:
+            insert_seed_data(session, seed_data, batch_size)
+            session.commit()
+        timings[run] = round(time.perf_counter() - started, 3)
+    engine.dispose()
+    return timings
+
+
+def main() -> None:
+    args = parse_args()
+    report = {
+        "batchSize": args.batch_size,
+        "runs": [
+            time_seed(args.database_url or create_sqlite_database_url(), int(size), args.batch_size)
+            for size in args.sizes.split(",")
+        ],
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
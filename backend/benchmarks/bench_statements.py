@@ -0,0 +1,138 @@
+"""Measure the per-request Python overhead removed by prebuilt list statements.
+
+For every ``/cocktails`` filter shape and paging mode, times two ways of getting an executable
+statement: building the ``select()`` with its joins and generating its cache key on each call
+(what the list path did before statements were cached), and looking up the prebuilt statement,
+whose cache key is memoized. Both are then executed against a synthetic SQLite catalog with the
+same bound values, so ``executeUs`` shows the difference on a full round trip. Run from
+``backend/``::
+
+    poetry run python -m benchmarks.bench_statements --cocktails 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from itertools import product
+
+from sqlalchemy.orm import Session
+
+from app.db import build_engine
+from app.main import (
+    PAGING_AFTER_CURSOR,
+    PAGING_WITH_NEXT,
+    PAGING_WITH_TOTAL,
+    CocktailListParams,
+    bind_cocktails_page,
+    get_cocktails_page_statement,
+    get_filter_shape,
+)
+from app.metrics import COMPILED_CACHE, install_query_instrumentation
+from app.synthetic import DIFFICULTY_IDS, SyntheticCatalog
+from benchmarks.common import create_sqlite_database_url, create_synthetic_database
+
+CURSOR_KEY = (50, "Synthetic Cocktail", "")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark prebuilt list statements.")
+    parser.add_argument("--cocktails", type=int, default=10_000)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--repeat", type=int, default=2000, help="Timed builds per shape.")
+    parser.add_argument("--executions", type=int, default=200, help="Timed executions per shape.")
+    return parser.parse_args()
+
+
+def build_params(catalog: SyntheticCatalog) -> dict[str, CocktailListParams]:
+    params = {}
+    for vibe_id, difficulty_id, occasion_id in product(
+        ("", catalog.vibe_ids[0]), ("", DIFFICULTY_IDS[0]), ("", catalog.occasion_ids[0])
+    ):
+        for paging, cursor_key, include_total in (
+            (PAGING_WITH_TOTAL, None, True),
+            (PAGING_WITH_NEXT, None, False),
+            (PAGING_AFTER_CURSOR, CURSOR_KEY, False),
+        ):
+            filters = (("vibe", vibe_id), ("difficulty", difficulty_id), ("occasion", occasion_id))
+            name = "+".join(name for name, value in filters if value) or "unfiltered"
+            params[f"{name}:{paging}"] = CocktailListParams(
+                vibe_id=vibe_id,
+                difficulty_id=difficulty_id,
+                occasion_id=occasion_id,
+                page=2,
+                limit=12,
+                cursor_key=cursor_key,
+                include_total=include_total,
+            )
+    return params
+
+
+def rebuild_statement(params: CocktailListParams):
+    """Build the statement from scratch, as every request did before it was cached."""
+    shape = get_filter_shape(params.filter_values())
+    return get_cocktails_page_statement.__wrapped__(shape, params.paging)
+
+
+def time_builds(params: CocktailListParams, repeat: int) -> dict[str, float]:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        rebuild_statement(params)._generate_cache_key()
+    rebuild_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    for _ in range(repeat):
+        bind_cocktails_page(params)[0]._generate_cache_key()
+    prebuilt_seconds = time.perf_counter() - started
+    return {
+        "rebuildUs": round(rebuild_seconds / repeat * 1_000_000, 2),
+        "prebuiltUs": round(prebuilt_seconds / repeat * 1_000_000, 2),
+    }
+
+
+def time_executions(session: Session, params: CocktailListParams, executions: int) -> dict:
+    _, values = bind_cocktails_page(params)
+    session.execute(rebuild_statement(params), values).all()
+    started = time.perf_counter()
+    for _ in range(executions):
+        session.execute(rebuild_statement(params), values).all()
+    rebuild_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    for _ in range(executions):
+        session.execute(*bind_cocktails_page(params)).all()
+    prebuilt_seconds = time.perf_counter() - started
+    return {
+        "rebuildUs": round(rebuild_seconds / executions * 1_000_000, 2),
+        "prebuiltUs": round(prebuilt_seconds / executions * 1_000_000, 2),
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    catalog = SyntheticCatalog(cocktails=args.cocktails)
+    database_url = args.database_url or create_sqlite_database_url()
+    if args.database_url is None:
+        create_synthetic_database(database_url, catalog)
+    engine = build_engine(database_url)
+    install_query_instrumentation()
+    shapes = {}
+    with Session(engine) as session:
+        for name, params in build_params(catalog).items():
+            shapes[name] = {
+                "buildUs": time_builds(params, args.repeat),
+                "executeUs": time_executions(session, params, args.executions),
+            }
+    engine.dispose()
+    report = {
+        "cocktails": args.cocktails,
+        "statementCache": get_cocktails_page_statement.cache_info()._asdict(),
+        "compiledCache": {
+            result: COMPILED_CACHE.value(result) for result in ("hit", "miss", "uncacheable")
+        },
+        "shapes": shapes,
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
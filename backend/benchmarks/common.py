@@ -0,0 +1,91 @@
+"""Shared helpers for benchmark scripts."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.db import Base, build_engine
+from app.seed import insert_seed_data, load_seed_data
+from app.settings import get_settings
+from app.synthetic import SyntheticCatalog, insert_synthetic_catalog
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize_latencies(samples: list[float], elapsed: float) -> dict[str, float]:
+    """Summarize per-request latencies (seconds) as milliseconds plus throughput."""
+    return {
+        "requests": len(samples),
+        "throughputRps": round(len(samples) / elapsed, 1) if elapsed else 0.0,
+        "p50Ms": round(percentile(samples, 0.50) * 1000, 3),
+        "p95Ms": round(percentile(samples, 0.95) * 1000, 3),
+        "p99Ms": round(percentile(samples, 0.99) * 1000, 3),
+    }
+
+
+async def run_concurrently(
+    request: Callable[[], Awaitable[object]], total: int, concurrency: int
+) -> dict[str, float]:
+    """Issue ``total`` requests from ``concurrency`` workers and summarize their latency."""
+    samples: list[float] = []
+    remaining = iter(range(total))
+
+    async def worker() -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+            await request()
+            samples.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize_latencies(samples, time.perf_counter() - started)
+
+
+def create_sqlite_database_url() -> str:
+    database_path = Path(tempfile.mkdtemp(prefix="vibe-bench-")) / "bench.db"
+    return f"sqlite+pysqlite:///{database_path}"
+
+
+def create_seeded_sqlite_database() -> str:
+    """Create a temporary SQLite file seeded from ``seedData.ts`` and return its URL."""
+    database_url = create_sqlite_database_url()
+    engine = build_engine(database_url)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        insert_seed_data(session, load_seed_data())
+        session.commit()
+    engine.dispose()
+    return database_url
+
+
+def create_synthetic_database(database_url: str, catalog: SyntheticCatalog) -> None:
+    """Recreate every table at ``database_url`` and fill it with a synthetic catalog."""
+    engine = build_engine(database_url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        insert_synthetic_catalog(session, catalog)
+        session.commit()
+    with engine.begin() as connection:
+        connection.execute(text("ANALYZE"))
+    engine.dispose()
+
+
+def use_database(database_url: str) -> None:
+    os.environ["DATABASE_URL"] = database_url
+    get_settings.cache_clear()
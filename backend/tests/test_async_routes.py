@@ -0,0 +1,89 @@
+"""Async catalog endpoint tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from app import main as main_module
+from app.db import Base
+from app.models import AlcoholLevel, Cocktail, Difficulty, Occasion, Vibe
+
+
+def seed_database(database_path: Path) -> None:
+    engine = create_engine(f"sqlite+pysqlite:///{database_path}", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        vibe = Vibe(id="vibe-test", name="Test Vibe", description="Test vibe", icon="spark")
+        occasion = Occasion(id="occasion-test", name="Test Occasion", description="Test")
+        difficulty = Difficulty(id="difficulty-balanced", label="Balanced", rank=2)
+        alcohol = AlcoholLevel(id="alcohol-light", label="Light", rank=1)
+        cocktail = Cocktail(
+            id="cocktail-test",
+            name="Test Cocktail",
+            description="Test description",
+            image_url="test-image.jpg",
+            ingredients=[{"name": "Ice", "amount": "1", "unit": "cube"}],
+            steps=["mix"],
+            tags={"spirit": ["gin"], "flavor": ["citrus"]},
+            difficulty_id=difficulty.id,
+            alcohol_level_id=alcohol.id,
+            rank=1,
+        )
+        cocktail.vibes = [vibe]
+        cocktail.occasions = [occasion]
+        session.add_all([vibe, occasion, difficulty, alcohol, cocktail])
+        session.commit()
+    engine.dispose()
+
+
+@pytest.fixture()
+def async_client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    database_path = tmp_path / "async.db"
+    seed_database(database_path)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{database_path}")
+    monkeypatch.setattr(
+        main_module,
+        "create_async_session",
+        async_sessionmaker(bind=engine, expire_on_commit=False),
+    )
+    async_app = FastAPI()
+    main_module.include_catalog_routes(async_app, use_async=True)
+    return TestClient(async_app)
+
+
+def test_async_list_vibes(async_client: TestClient) -> None:
+    response = async_client.get("/vibes")
+
+    assert response.status_code == 200
+    assert [vibe["id"] for vibe in response.json()] == ["vibe-test"]
+
+
+def test_async_list_cocktails(async_client: TestClient) -> None:
+    response = async_client.get("/cocktails?vibe=vibe-test&page=1&limit=12")
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["total"] == 1
+    assert [item["id"] for item in payload["items"]] == ["cocktail-test"]
+
+
+def test_async_cocktail_detail(async_client: TestClient) -> None:
+    assert async_client.get("/cocktails/cocktail-test").json()["tags"] == {
+        "spirit": ["gin"],
+        "flavor": ["citrus"],
+    }
+    assert async_client.get("/cocktails/missing").status_code == 404
+
+
+def test_async_cocktail_details(async_client: TestClient) -> None:
+    payload = async_client.get("/cocktails/details?ids=missing,cocktail-test").json()
+
+    assert [item["id"] for item in payload["items"]] == ["cocktail-test"]
+    assert payload["missing"] == ["missing"]
@@ -0,0 +1,162 @@
+"""Response cache tests."""
+
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import cache as cache_module
+from app import main as main_module
+from app.cache import InMemoryCacheBackend, ResponseCache
+from app.db import Base
+from app.main import app
+from app.models import Vibe
+
+
+def build_cache(ttl: float = 60, lock_ttl: float = 1) -> ResponseCache:
+    return ResponseCache(InMemoryCacheBackend(), ttl=ttl, lock_ttl=lock_ttl)
+
+
+def test_in_memory_backend_expires_entries() -> None:
+    backend = InMemoryCacheBackend()
+    backend.set("key", b"value", ttl=0.01)
+
+    assert backend.get("key") == b"value"
+    time.sleep(0.02)
+    assert backend.get("key") is None
+
+
+def test_in_memory_backend_evicts_least_recently_used() -> None:
+    backend = InMemoryCacheBackend(max_entries=2)
+    backend.set("first", b"1", ttl=60)
+    backend.set("second", b"2", ttl=60)
+    backend.get("first")
+    backend.set("third", b"3", ttl=60)
+
+    assert backend.get("second") is None
+    assert backend.get("first") == b"1"
+
+
+def test_get_or_compute_caches_value() -> None:
+    response_cache = build_cache()
+    calls: list[int] = []
+
+    def compute() -> dict[str, int]:
+        calls.append(1)
+        return {"value": 1}
+
+    key = response_cache.build_key("v1", "vibes")
+    assert response_cache.get_or_compute(key, compute) == {"value": 1}
+    assert response_cache.get_or_compute(key, compute) == {"value": 1}
+    assert len(calls) == 1
+    assert (response_cache.hits, response_cache.misses) == (1, 1)
+
+
+def test_keys_are_versioned_and_order_independent() -> None:
+    response_cache = build_cache()
+
+    assert response_cache.build_key("v1", "cocktails", page=1, vibe="a") == (
+        response_cache.build_key("v1", "cocktails", vibe="a", page=1)
+    )
+    assert response_cache.build_key("v1", "vibes") != response_cache.build_key("v2", "vibes")
+
+
+def test_concurrent_misses_compute_once() -> None:
+    response_cache = build_cache()
+    barrier = threading.Barrier(8)
+    calls: list[int] = []
+
+    def compute() -> list[int]:
+        calls.append(1)
+        time.sleep(0.1)
+        return [1]
+
+    def worker() -> None:
+        barrier.wait()
+        assert response_cache.get_or_compute("key", compute) == [1]
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+
+
+def test_expired_lock_owner_cannot_release_a_newer_lock() -> None:
+    response_cache = build_cache(lock_ttl=0.01)
+    first = response_cache.acquire("key")
+    time.sleep(0.02)
+    second = response_cache.acquire("key")
+
+    response_cache.release("key", first)
+
+    assert first is not None and second is not None and first != second
+    assert response_cache.acquire("key") is None
+    response_cache.release("key", second)
+    assert response_cache.acquire("key") is not None
+
+
+def test_entries_refresh_early_near_expiry(monkeypatch: pytest.MonkeyPatch) -> None:
+    response_cache = build_cache(ttl=60)
+    response_cache.write("key", "old", compute_seconds=120)
+    monkeypatch.setattr(cache_module.random, "random", lambda: 0.999)
+
+    assert response_cache.get_or_compute("key", lambda: "new") == "new"
+
+
+def test_backend_errors_fall_back_to_compute() -> None:
+    class BrokenBackend(InMemoryCacheBackend):
+        errors = (ConnectionError,)
+
+        def get(self, key: str) -> bytes | None:
+            raise ConnectionError("cache down")
+
+        def set(self, key: str, value: bytes, ttl: float) -> None:
+            raise ConnectionError("cache down")
+
+    response_cache = ResponseCache(BrokenBackend(), ttl=60, lock_ttl=1)
+
+    assert response_cache.get_or_compute("key", lambda: "value") == "value"
+
+
+def test_vibes_served_from_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, future=True)
+    with session_factory() as session:
+        session.add(Vibe(id="vibe-test", name="Test Vibe", description="Test", icon=None))
+        session.commit()
+    sessions_opened: list[Session] = []
+
+    def create_session() -> Session:
+        session = session_factory()
+        sessions_opened.append(session)
+        return session
+
+    response_cache = build_cache()
+    monkeypatch.setattr(main_module, "create_session", create_session)
+    monkeypatch.setattr(main_module, "get_response_cache", lambda: response_cache)
+    monkeypatch.setattr(
+        main_module, "get_catalog_manager", lambda: SimpleNamespace(version="v1", index=None)
+    )
+
+    client = TestClient(app)
+    first = client.get("/vibes")
+    second = client.get("/vibes")
+
+    assert first.json() == second.json()
+    assert len(sessions_opened) == 1
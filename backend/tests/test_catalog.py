@@ -0,0 +1,135 @@
+"""Catalog index tests."""
+
+from __future__ import annotations
+
+from itertools import product
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import main as main_module
+from app.bitsets import iter_positions
+from app.catalog import (
+    CatalogIndexManager,
+    bump_catalog_version,
+    load_catalog_index,
+    read_catalog_version,
+)
+from app.db import Base
+from app.main import app, build_cocktails_query
+from app.seed import insert_seed_data, load_seed_data
+
+
+def create_session_factory() -> sessionmaker:
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, future=True)
+    with session_factory() as session:
+        insert_seed_data(session, load_seed_data())
+        bump_catalog_version(session)
+        session.commit()
+    return session_factory
+
+
+def query_ids(session: Session, vibe_id: str, difficulty_id: str, occasion_id: str) -> list[str]:
+    query = build_cocktails_query(vibe_id, difficulty_id, occasion_id)
+    return [row.id for row in session.execute(query)]
+
+
+def test_index_matches_sql_for_every_filter_combination() -> None:
+    session_factory = create_session_factory()
+    seed_data = load_seed_data()
+    vibe_ids = ["", "vibe-missing", *(vibe["id"] for vibe in seed_data["vibes"])]
+    occasion_ids = ["", *(occasion["id"] for occasion in seed_data["occasions"])]
+    difficulty_ids = ["", *(difficulty["id"] for difficulty in seed_data["difficulties"])]
+
+    with session_factory() as session:
+        catalog_index = load_catalog_index(session, read_catalog_version(session))
+        for vibe_id, occasion_id, difficulty_id in product(vibe_ids, occasion_ids, difficulty_ids):
+            matches = catalog_index.match(vibe_id, difficulty_id, occasion_id)
+            expected = query_ids(session, vibe_id, difficulty_id, occasion_id)
+            indexed = [entry.id for entry in catalog_index.slice(matches, 0, len(expected) + 1)]
+            assert indexed == expected
+            assert matches.bit_count() == len(expected)
+
+
+def test_iter_positions_skips_offset_across_chunks() -> None:
+    positions = [3, 4095, 4096, 9000, 20000]
+    bits = sum(1 << position for position in positions)
+
+    assert list(iter_positions(bits)) == positions
+    assert list(iter_positions(bits, offset=2)) == positions[2:]
+    assert list(iter_positions(bits, offset=5)) == []
+
+
+def test_manager_reloads_only_when_version_changes() -> None:
+    session_factory = create_session_factory()
+    manager = CatalogIndexManager(poll_interval=60, session_factory=session_factory)
+
+    assert manager.refresh() is True
+    assert manager.refresh() is False
+
+    with session_factory() as session:
+        bump_catalog_version(session)
+        session.commit()
+
+    assert manager.refresh() is True
+
+
+def test_list_cocktails_served_from_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    manager = CatalogIndexManager(poll_interval=60, session_factory=create_session_factory())
+    manager.refresh()
+
+    def fail_session() -> Session:
+        raise AssertionError("The catalog index should serve /cocktails without a session.")
+
+    monkeypatch.setattr(main_module, "get_catalog_manager", lambda: manager)
+    monkeypatch.setattr(main_module, "create_session", fail_session)
+
+    response = TestClient(app).get("/cocktails?vibe=vibe-date&difficulty=&page=1&limit=1")
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["total"] == 2
+    assert payload["items"] == [
+        {
+            "id": "cocktail-citrus-negroni",
+            "name": "Citrus Negroni",
+            "description": "A bright, balanced negroni with a zesty finish.",
+            "imageUrl": "citrus-negroni.jpg",
+        }
+    ]
+
+
+def test_index_seek_resumes_after_cursor() -> None:
+    session_factory = create_session_factory()
+
+    with session_factory() as session:
+        catalog_index = load_catalog_index(session, read_catalog_version(session))
+    matches = catalog_index.match("", "", "")
+    first, second = catalog_index.slice(matches, 0, 2)
+
+    resumed = catalog_index.slice(catalog_index.seek(matches, first.sort_key), 0, 1)
+
+    assert resumed == [second]
+    assert catalog_index.slice(catalog_index.seek(matches, ()), 0, 1) == [first]
+
+
+def test_index_skips_total_when_not_requested(monkeypatch: pytest.MonkeyPatch) -> None:
+    manager = CatalogIndexManager(poll_interval=60, session_factory=create_session_factory())
+    manager.refresh()
+    monkeypatch.setattr(main_module, "get_catalog_manager", lambda: manager)
+
+    payload = TestClient(app).get("/cocktails?difficulty=&limit=2&includeTotal=false").json()
+
+    assert payload["total"] is None
+    assert len(payload["items"]) == 2
+    assert payload["nextCursor"] is not None
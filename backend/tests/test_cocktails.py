@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import SimpleNamespace
+
 from fastapi.testclient import TestClient
 import pytest
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app import main as main_module
 from app.db import Base
+from app.encoding import FragmentCache
 from app.main import app
 from app.models import AlcoholLevel, Cocktail, Difficulty, Occasion, Vibe
+from app.query_budget import query_budget
 
 
 def create_session_factory() -> sessionmaker:
@@ -106,9 +112,11 @@ def test_get_cocktail_detail_success(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(main_module, "create_session", session_factory)
 
     client = TestClient(app)
-    response = client.get("/cocktails/cocktail-test")
+    with query_budget(1) as queries:
+        response = client.get("/cocktails/cocktail-test")
 
     assert response.status_code == 200
+    assert queries.count == 1
     payload = response.json()
     assert payload == {
         "id": "cocktail-test",
@@ -133,3 +141,203 @@ def test_get_cocktail_detail_not_found(monkeypatch: pytest.MonkeyPatch) -> None:
 
     assert response.status_code == 404
     assert response.json() == {"detail": "Cocktail with id 'missing-cocktail' not found."}
+
+
+def seed_ranked_cocktails(session_factory: sessionmaker, count: int) -> None:
+    session = session_factory()
+    try:
+        difficulty = Difficulty(id="difficulty-balanced", label="Balanced", rank=2)
+        alcohol = AlcoholLevel(id="alcohol-light", label="Light", rank=1)
+        session.add_all([difficulty, alcohol])
+        for index in range(count):
+            session.add(
+                Cocktail(
+                    id=f"cocktail-{index:03d}",
+                    name=f"Cocktail {index % 4}",
+                    description="Ranked cocktail",
+                    ingredients=[],
+                    steps=[],
+                    difficulty_id=difficulty.id,
+                    alcohol_level_id=alcohol.id,
+                    rank=index % 3,
+                )
+            )
+        session.commit()
+    finally:
+        session.close()
+
+
+def test_list_cocktails_cursor_walks_every_row(monkeypatch: pytest.MonkeyPatch) -> None:
+    session_factory = create_session_factory()
+    seed_ranked_cocktails(session_factory, 11)
+    monkeypatch.setattr(main_module, "create_session", session_factory)
+
+    client = TestClient(app)
+    paged = client.get("/cocktails?page=1&limit=20").json()
+    walked: list[str] = []
+    cursor = ""
+    while cursor is not None:
+        response = client.get("/cocktails", params={"cursor": cursor, "limit": 4})
+        assert response.status_code == 200
+        payload = response.json()
+        assert payload["total"] is None
+        walked.extend(item["id"] for item in payload["items"])
+        cursor = payload["nextCursor"]
+
+    assert walked == [item["id"] for item in paged["items"]]
+    assert paged["total"] == 11
+
+
+def test_list_cocktails_page_mode_returns_next_cursor(monkeypatch: pytest.MonkeyPatch) -> None:
+    session_factory = create_session_factory()
+    seed_ranked_cocktails(session_factory, 5)
+    monkeypatch.setattr(main_module, "create_session", session_factory)
+
+    client = TestClient(app)
+    first_page = client.get("/cocktails?page=1&limit=3").json()
+    second_page = client.get("/cocktails", params={"cursor": first_page["nextCursor"]}).json()
+    last_page = client.get("/cocktails?page=2&limit=3").json()
+
+    assert [item["id"] for item in second_page["items"]] == [
+        item["id"] for item in last_page["items"]
+    ]
+    assert last_page["nextCursor"] is None
+
+
+def test_list_cocktails_rejects_invalid_cursor(monkeypatch: pytest.MonkeyPatch) -> None:
+    session_factory = create_session_factory()
+    monkeypatch.setattr(main_module, "create_session", session_factory)
+
+    response = TestClient(app).get("/cocktails?cursor=not-a-cursor")
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid cursor."}
+
+
+def test_list_cocktails_clamps_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    session_factory = create_session_factory()
+    seed_cocktail(session_factory)
+    monkeypatch.setattr(main_module, "create_session", session_factory)
+
+    response = TestClient(app).get("/cocktails?limit=100000")
+
+    assert response.json()["limit"] == main_module.get_settings().COCKTAILS_MAX_LIMIT
+
+
+def test_list_cocktails_uses_one_round_trip(monkeypatch: pytest.MonkeyPatch) -> None:
+    session_factory = create_session_factory()
+    seed_ranked_cocktails(session_factory, 5)
+    monkeypatch.setattr(main_module, "create_session", session_factory)
+    client = TestClient(app)
+
+    with query_budget(1) as queries:
+        response = client.get("/cocktails?page=2&limit=2")
+
+    assert response.json()["total"] == 5
+    assert len(response.json()["items"]) == 2
+    assert queries.count == 1
+    assert "ingredients" not in next(iter(queries.statements))
+
+
+def test_list_cocktails_without_total(monkeypatch: pytest.MonkeyPatch) -> None:
+    session_factory = create_session_factory()
+    seed_ranked_cocktails(session_factory, 5)
+    monkeypatch.setattr(main_module, "create_session", session_factory)
+    client = TestClient(app)
+
+    with query_budget(1) as queries:
+        payload = client.get("/cocktails?page=1&limit=3&includeTotal=false").json()
+
+    assert payload["total"] is None
+    assert len(payload["items"]) == 3
+    assert payload["nextCursor"] is not None
+    assert queries.count == 1
+    assert not any("count" in statement.lower() for statement in queries.statements)
+
+
+def test_list_cocktails_total_past_last_page(monkeypatch: pytest.MonkeyPatch) -> None:
+    session_factory = create_session_factory()
+    seed_ranked_cocktails(session_factory, 5)
+    monkeypatch.setattr(main_module, "create_session", session_factory)
+    client = TestClient(app)
+
+    with query_budget(2) as queries:
+        payload = client.get("/cocktails?page=9&limit=2").json()
+
+    assert payload["items"] == []
+    assert payload["total"] == 5
+    assert queries.count == 2
+
+
+def test_list_cocktails_reuses_statements_per_filter_shape(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session_factory = create_session_factory()
+    seed_cocktail(session_factory)
+    engine = session_factory.kw["bind"]
+    monkeypatch.setattr(main_module, "create_session", session_factory)
+    client = TestClient(app)
+    client.get("/cocktails?vibe=vibe-unknown&difficulty=&page=1&limit=12")
+    compiled = len(engine._compiled_cache)
+    hits = main_module.get_cocktails_page_statement.cache_info().hits
+
+    other_vibe = client.get("/cocktails?vibe=vibe-missing&difficulty=&page=3&limit=5").json()
+    same_vibe = client.get("/cocktails?vibe=vibe-test&difficulty=&page=1&limit=12").json()
+
+    assert other_vibe["items"] == []
+    assert [item["id"] for item in same_vibe["items"]] == ["cocktail-test"]
+    assert main_module.get_cocktails_page_statement.cache_info().hits == hits + 2
+    assert len(engine._compiled_cache) == compiled
+
+
+def test_get_cocktail_details_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    session_factory = create_session_factory()
+    seed_ranked_cocktails(session_factory, 5)
+    monkeypatch.setattr(main_module, "create_session", session_factory)
+    client = TestClient(app)
+
+    with query_budget(1) as queries:
+        response = client.get(
+            "/cocktails/details?ids=cocktail-003,missing,cocktail-001,cocktail-003"
+        )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert [item["id"] for item in payload["items"]] == ["cocktail-003", "cocktail-001"]
+    assert payload["missing"] == ["missing"]
+    assert queries.count == 1
+
+
+def test_get_cocktail_details_caps_batch_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    session_factory = create_session_factory()
+    monkeypatch.setattr(main_module, "create_session", session_factory)
+    max_ids = main_module.get_settings().COCKTAIL_DETAILS_MAX_IDS
+    ids = ",".join(f"cocktail-{index}" for index in range(max_ids + 1))
+
+    client = TestClient(app)
+
+    assert client.get("/cocktails/details", params={"ids": ids}).status_code == 400
+    assert client.get("/cocktails/details?ids=,").status_code == 400
+
+
+def test_loaded_fragments_keep_the_version_read_before_the_query(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session_factory = create_session_factory()
+    seed_cocktail(session_factory)
+    catalog_manager = SimpleNamespace(version="v1", index=None)
+    fragment_cache = FragmentCache(max_entries=10)
+
+    @contextmanager
+    def session_then_reseed() -> Iterator[Session]:
+        with session_factory() as session:
+            yield session
+        catalog_manager.version = "v2"
+
+    monkeypatch.setattr(main_module, "create_session", session_then_reseed)
+    monkeypatch.setattr(main_module, "get_catalog_manager", lambda: catalog_manager)
+    monkeypatch.setattr(main_module, "get_fragment_cache", lambda: fragment_cache)
+
+    main_module.load_cocktail_detail("cocktail-test")
+
+    assert fragment_cache._state[0] == "v1"
@@ -0,0 +1,222 @@
+"""Response compression tests."""
+
+from __future__ import annotations
+
+import gzip
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+from app import main as main_module
+from app.compression import (
+    CompressedBodyCache,
+    CompressionMiddleware,
+    available_encodings,
+    is_repeatable_path,
+    negotiate_encoding,
+)
+from app.db import Base
+from app.main import app as main_app
+from app.models import Vibe
+
+BODY = orjson.dumps({"items": [{"name": f"Cocktail {index}"} for index in range(200)]})
+
+
+def build_client(cache: CompressedBodyCache | None, version: list[str]) -> TestClient:
+    def payload(request: Request) -> Response:
+        headers = {"etag": f'"{version[0]}-payload"'} if request.query_params.get("tag") else {}
+        return Response(BODY, media_type="application/json", headers=headers)
+
+    def small(_: Request) -> Response:
+        return Response(b'{"ok":true}', media_type="application/json")
+
+    def streamed(_: Request) -> StreamingResponse:
+        return StreamingResponse(iter([BODY, BODY]), media_type="application/json")
+
+    app = Starlette(
+        routes=[
+            Route("/payload", payload),
+            Route("/search", payload),
+            Route("/small", small),
+            Route("/streamed", streamed),
+        ]
+    )
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=512,
+        cache=cache,
+        version_provider=lambda: version[0],
+        cacheable_path=lambda path: path == "/payload",
+    )
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip, deflate, br", "br"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("br;q=0, gzip", "gzip"),
+        ("*", "br"),
+        ("identity", None),
+        ("", None),
+        ("gzip;q=0", None),
+    ],
+)
+def test_negotiate_encoding(accept_encoding: str, expected: str | None) -> None:
+    assert negotiate_encoding(accept_encoding, ("br", "gzip")) == expected
+
+
+def test_gzip_body_round_trips_with_vary_and_length() -> None:
+    client = build_client(None, ["v1"])
+
+    response = client.get("/payload", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(BODY)
+    assert response.content == BODY
+
+
+def test_brotli_is_preferred_when_installed() -> None:
+    pytest.importorskip("brotli")
+    client = build_client(None, ["v1"])
+
+    response = client.get("/payload", headers={"Accept-Encoding": "gzip, br"})
+
+    assert available_encodings() == ("br", "gzip")
+    assert response.headers["content-encoding"] == "br"
+    assert response.content == BODY
+
+
+def test_small_streamed_and_identity_responses_pass_through() -> None:
+    client = build_client(None, ["v1"])
+
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    streamed = client.get("/streamed", headers={"Accept-Encoding": "gzip"})
+    identity = client.get("/payload", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in small.headers
+    assert small.headers["vary"] == "Accept-Encoding"
+    assert "content-encoding" not in streamed.headers
+    assert streamed.content == BODY + BODY
+    assert "content-encoding" not in identity.headers
+    assert identity.content == BODY
+
+
+def test_tagged_bodies_are_compressed_once_per_version() -> None:
+    cache = CompressedBodyCache(max_bytes=1_000_000)
+    version = ["v1"]
+    client = build_client(cache, version)
+    headers = {"Accept-Encoding": "gzip"}
+
+    first = client.get("/payload?tag=1", headers=headers)
+    second = client.get("/payload?tag=1", headers=headers)
+    client.get("/payload", headers=headers)
+
+    assert first.headers["etag"] == 'W/"v1-payload"'
+    assert second.content == BODY
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    version[0] = "v2"
+    client.get("/payload?tag=1", headers=headers)
+
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert list(cache._state[1]) == [("gzip", '"v2-payload"')]
+
+
+def test_free_form_paths_skip_the_cache() -> None:
+    cache = CompressedBodyCache(max_bytes=1_000_000)
+    client = build_client(cache, ["v1"])
+
+    response = client.get("/search?tag=1", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == BODY
+    assert response.headers["etag"] == 'W/"v1-payload"'
+    assert (cache.hits, cache.misses, cache.size) == (0, 0, 0)
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("/vibes", True),
+        ("/cocktails", True),
+        ("/cocktails/negroni", True),
+        ("/cocktails/search", False),
+        ("/cocktails/makeable", False),
+        ("/cocktails/ranked", False),
+        ("/cocktails/details", False),
+        ("/health", False),
+    ],
+)
+def test_is_repeatable_path(path: str, expected: bool) -> None:
+    assert is_repeatable_path(path) is expected
+
+
+def test_cache_evicts_oldest_bodies_over_budget() -> None:
+    cache = CompressedBodyCache(max_bytes=10)
+
+    cache.put("v1", ("gzip", "a"), b"12345")
+    cache.put("v1", ("gzip", "b"), b"12345")
+    cache.put("v1", ("gzip", "c"), b"123")
+
+    assert cache.get("v1", ("gzip", "a")) is None
+    assert cache.get("v1", ("gzip", "c")) == b"123"
+    assert cache.size == 8
+
+
+def test_gzip_output_is_deterministic() -> None:
+    client = build_client(None, ["v1"])
+    headers = {"Accept-Encoding": "gzip"}
+
+    first = client.get("/payload", headers=headers)
+    second = client.get("/payload", headers=headers)
+
+    raw_first = gzip.compress(BODY, compresslevel=6, mtime=0)
+    assert first.headers["content-length"] == second.headers["content-length"]
+    assert int(first.headers["content-length"]) == len(raw_first)
+
+
+def test_compressed_catalog_response_revalidates(monkeypatch: pytest.MonkeyPatch) -> None:
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, future=True)
+    with session_factory() as session:
+        session.add_all(
+            Vibe(id=f"vibe-{index:02d}", name=f"Vibe {index}", description="Test " * 20, icon=None)
+            for index in range(40)
+        )
+        session.commit()
+    monkeypatch.setattr(main_module, "create_session", session_factory)
+    monkeypatch.setattr(main_module, "get_response_cache", lambda: None)
+    monkeypatch.setattr(
+        main_module, "get_catalog_manager", lambda: SimpleNamespace(version="v1", index=None)
+    )
+    client = TestClient(main_app)
+
+    response = client.get("/vibes", headers={"Accept-Encoding": "gzip"})
+    revalidated = client.get(
+        "/vibes", headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]}
+    )
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"].startswith('W/"v1-')
+    assert len(response.json()) == 40
+    assert revalidated.status_code == 304
+    assert revalidated.headers["vary"] == "Accept-Encoding"
+    assert client.get("/cocktails/missing").headers["vary"] == "Accept-Encoding"
@@ -0,0 +1,111 @@
+"""Encoding helper and fragment cache tests."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main as main_module
+from app.cache import InMemoryCacheBackend, ResponseCache
+from app.encoding import FragmentCache, dumps, encode_array, encode_object
+from app.main import app
+from tests.test_cocktails import create_session_factory, seed_cocktail
+
+
+def test_encoded_fragments_join_into_valid_json() -> None:
+    body = encode_object(
+        {
+            "items": encode_array([dumps({"id": "a"}), dumps({"id": "b"})]),
+            "empty": encode_array([]),
+            "total": dumps(None),
+        }
+    )
+
+    assert json.loads(body) == {"items": [{"id": "a"}, {"id": "b"}], "empty": [], "total": None}
+
+
+def test_fragment_cache_is_scoped_to_one_version() -> None:
+    fragment_cache = FragmentCache(max_entries=10)
+    calls: list[str] = []
+
+    def build(value: str) -> dict[str, str]:
+        calls.append(value)
+        return {"value": value}
+
+    assert fragment_cache.get("v1", "summary", "a", lambda: build("first")) == b'{"value":"first"}'
+    assert fragment_cache.get("v1", "summary", "a", lambda: build("second")) == (
+        b'{"value":"first"}'
+    )
+    assert fragment_cache.get("v1", "detail", "a", lambda: build("detail")) == (
+        b'{"value":"detail"}'
+    )
+    assert fragment_cache.get("v2", "summary", "a", lambda: build("third")) == (
+        b'{"value":"third"}'
+    )
+    assert fragment_cache.get(None, "summary", "a", lambda: build("fourth")) == (
+        b'{"value":"fourth"}'
+    )
+    assert fragment_cache.get(None, "summary", "a", lambda: build("fifth")) == (
+        b'{"value":"fifth"}'
+    )
+    assert calls == ["first", "detail", "third", "fourth", "fifth"]
+    assert (fragment_cache.hits, fragment_cache.misses) == (1, 5)
+
+
+def test_fragment_cache_evicts_oldest_entry() -> None:
+    fragment_cache = FragmentCache(max_entries=2)
+    for key in ("a", "b", "c"):
+        fragment_cache.get("v1", "summary", key, lambda key=key: key)
+
+    assert fragment_cache.get("v1", "summary", "a", lambda: "rebuilt") == b'"rebuilt"'
+    assert fragment_cache.get("v1", "summary", "c", lambda: "rebuilt") == b'"c"'
+
+
+def test_responses_reuse_encoded_fragments(monkeypatch: pytest.MonkeyPatch) -> None:
+    session_factory = create_session_factory()
+    seed_cocktail(session_factory)
+    fragment_cache = FragmentCache(max_entries=10)
+    serialized: list[str] = []
+    serialize_cocktail_detail = main_module.serialize_cocktail_detail
+
+    def counting_serializer(cocktail: object) -> dict[str, object]:
+        serialized.append(cocktail.id)
+        return serialize_cocktail_detail(cocktail)
+
+    monkeypatch.setattr(main_module, "create_session", session_factory)
+    monkeypatch.setattr(main_module, "get_response_cache", lambda: None)
+    monkeypatch.setattr(main_module, "get_fragment_cache", lambda: fragment_cache)
+    monkeypatch.setattr(main_module, "serialize_cocktail_detail", counting_serializer)
+    monkeypatch.setattr(
+        main_module, "get_catalog_manager", lambda: SimpleNamespace(version="v1", index=None)
+    )
+    client = TestClient(app)
+
+    detail = client.get("/cocktails/cocktail-test")
+    batch = client.get("/cocktails/details?ids=cocktail-test,missing")
+
+    assert detail.headers["content-type"] == "application/json"
+    assert batch.json() == {"items": [detail.json()], "missing": ["missing"]}
+    assert serialized == ["cocktail-test"]
+
+
+def test_response_cache_stores_encoded_bodies(monkeypatch: pytest.MonkeyPatch) -> None:
+    session_factory = create_session_factory()
+    seed_cocktail(session_factory)
+    response_cache = ResponseCache(InMemoryCacheBackend(), ttl=60, lock_ttl=1)
+    monkeypatch.setattr(main_module, "create_session", session_factory)
+    monkeypatch.setattr(main_module, "get_response_cache", lambda: response_cache)
+    monkeypatch.setattr(
+        main_module, "get_catalog_manager", lambda: SimpleNamespace(version="v1", index=None)
+    )
+    client = TestClient(app)
+
+    first = client.get("/cocktails?page=1&limit=5")
+    second = client.get("/cocktails?page=1&limit=5")
+
+    assert second.content == first.content
+    assert first.json()["items"][0]["id"] == "cocktail-test"
+    assert (response_cache.hits, response_cache.misses) == (1, 1)
@@ -1,9 +1,17 @@
 """Health endpoint tests."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 
+from app import health as health_module
 from app import main as main_module
+from app.health import HealthMonitor
 from app.main import app
 
 client = TestClient(app)
@@ -26,3 +34,124 @@ def test_health_degraded(monkeypatch: pytest.MonkeyPatch) -> None:
 
     assert response.status_code == 200
     assert response.json() == {"status": "degraded"}
+
+
+def test_health_live() -> None:
+    response = client.get("/health/live")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+def test_health_ready_reports_dependency_latency(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        health_module,
+        "get_dependency_checks",
+        lambda: {"database": lambda: True, "cache": lambda: False},
+    )
+    monitor = HealthMonitor(interval=60, max_age=60, timeout=1)
+    monkeypatch.setattr(main_module, "get_health_monitor", lambda: monitor)
+
+    response = client.get("/health/ready")
+
+    assert response.status_code == 503
+    payload = response.json()
+    assert payload["status"] == "degraded"
+    assert payload["dependencies"]["database"]["ok"] is True
+    assert payload["dependencies"]["cache"]["ok"] is False
+    assert payload["dependencies"]["database"]["latencyMs"] >= 0
+
+
+def test_monitor_serves_cached_snapshot(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def probe() -> bool:
+        calls.append("database")
+        return True
+
+    monkeypatch.setattr(health_module, "get_dependency_checks", lambda: {"database": probe})
+    monitor = HealthMonitor(interval=60, max_age=60, timeout=1)
+
+    first = monitor.snapshot()
+    second = monitor.snapshot()
+
+    assert first is second
+    assert calls == ["database"]
+
+
+def test_concurrent_stale_callers_share_one_probe_round(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def slow_probe() -> bool:
+        calls.append("database")
+        time.sleep(0.05)
+        return True
+
+    monkeypatch.setattr(health_module, "get_dependency_checks", lambda: {"database": slow_probe})
+    monitor = HealthMonitor(interval=60, max_age=60, timeout=1)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        snapshots = list(executor.map(lambda _: monitor.snapshot(), range(8)))
+
+    assert calls == ["database"]
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+
+
+def test_monitor_serves_stale_snapshot_while_refreshing_in_background(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+
+    def probe() -> bool:
+        calls.append("database")
+        return True
+
+    monkeypatch.setattr(health_module, "get_dependency_checks", lambda: {"database": probe})
+    monitor = HealthMonitor(interval=60, max_age=0, timeout=1)
+    stale = monitor.refresh()
+    monkeypatch.setattr(monitor, "_task", SimpleNamespace(running=True))
+
+    assert monitor.snapshot() is stale
+    assert health_module.serialize_health_snapshot(stale, monitor.max_age)["stale"] is True
+    assert calls == ["database"]
+
+
+def test_monitor_times_out_slow_probes(monkeypatch: pytest.MonkeyPatch) -> None:
+    def slow_probe() -> bool:
+        time.sleep(0.5)
+        return True
+
+    monkeypatch.setattr(
+        health_module,
+        "get_dependency_checks",
+        lambda: {"database": lambda: True, "cache": slow_probe},
+    )
+    monitor = HealthMonitor(interval=60, max_age=60, timeout=0.05)
+
+    snapshot = monitor.refresh()
+
+    assert snapshot.results["database"].ok is True
+    assert snapshot.results["cache"].ok is False
+    assert snapshot.results["cache"].timed_out is True
+
+
+def test_probe_connect_args_follow_the_probe_timeout() -> None:
+    assert health_module.build_probe_connect_args("postgresql+psycopg://db/app", 2.5) == {
+        "connect_timeout": 3,
+        "options": "-c statement_timeout=2500",
+    }
+    assert health_module.build_probe_connect_args("sqlite:///catalog.db", 0.5) == {
+        "timeout": 0.5
+    }
+
+
+def test_database_probe_keeps_one_pooled_connection(tmp_path: Path) -> None:
+    database_url = f"sqlite:///{tmp_path / 'probe.db'}"
+    engine = health_module.get_probe_engine(database_url, 0.5)
+    connects: list[object] = []
+    event.listen(engine, "connect", lambda *_: connects.append(None))
+
+    assert health_module.run_database_probe(database_url, timeout=0.5) is True
+    assert health_module.run_database_probe(database_url, timeout=0.5) is True
+    assert engine.pool.size() == 1
+    assert len(connects) == 1
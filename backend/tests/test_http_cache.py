@@ -0,0 +1,101 @@
+"""Conditional GET tests."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import main as main_module
+from app.db import Base
+from app.http_cache import build_etag, etag_matches
+from app.main import app
+from app.models import Vibe
+
+
+@pytest.fixture()
+def versioned_client(monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, future=True)
+    with session_factory() as session:
+        session.add(Vibe(id="vibe-test", name="Test Vibe", description="Test", icon=None))
+        session.commit()
+    catalog_manager = SimpleNamespace(version="v1", index=None)
+    monkeypatch.setattr(main_module, "create_session", session_factory)
+    monkeypatch.setattr(main_module, "get_response_cache", lambda: None)
+    monkeypatch.setattr(main_module, "get_catalog_manager", lambda: catalog_manager)
+    return TestClient(app)
+
+
+def test_catalog_responses_carry_validators(versioned_client: TestClient) -> None:
+    response = versioned_client.get("/vibes")
+
+    assert response.status_code == 200
+    assert response.headers["etag"].startswith('"v1-')
+    assert "stale-while-revalidate" in response.headers["cache-control"]
+
+
+def test_matching_etag_returns_304_without_query(
+    versioned_client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    etag = versioned_client.get("/vibes").headers["etag"]
+
+    def fail_session() -> Session:
+        raise AssertionError("A revalidation should not open a session.")
+
+    monkeypatch.setattr(main_module, "create_session", fail_session)
+    response = versioned_client.get("/vibes", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+
+def test_wildcard_revalidates_only_existing_resources(versioned_client: TestClient) -> None:
+    existing = versioned_client.get("/vibes", headers={"If-None-Match": "*"})
+    missing = versioned_client.get("/cocktails/missing", headers={"If-None-Match": "*"})
+
+    assert existing.status_code == 304
+    assert existing.headers["etag"].startswith('"v1-')
+    assert existing.content == b""
+    assert missing.status_code == 404
+
+
+def test_new_catalog_version_changes_etag(
+    versioned_client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    etag = versioned_client.get("/vibes").headers["etag"]
+    monkeypatch.setattr(
+        main_module, "get_catalog_manager", lambda: SimpleNamespace(version="v2", index=None)
+    )
+
+    response = versioned_client.get("/vibes", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_unversioned_catalog_skips_validators() -> None:
+    response = TestClient(app).get("/health")
+
+    assert "etag" not in response.headers
+
+
+def test_etag_varies_by_query_and_accepts_weak_match() -> None:
+    first = build_etag("v1", "/cocktails", b"page=1")
+    second = build_etag("v1", "/cocktails", b"page=2")
+
+    assert first != second
+    assert etag_matches(f"W/{first}, {second}", first)
+    assert not etag_matches('"other"', first)
+    assert not etag_matches("*", first)
@@ -0,0 +1,139 @@
+"""Metrics endpoint and instrumentation tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import main as main_module
+from app.db import TimedQueuePool
+from app.http_cache import build_etag
+from app.main import app
+from app.metrics import (
+    COMPILED_CACHE,
+    POOL_CHECKOUT_WAIT,
+    REQUEST_QUERIES,
+    REQUESTS,
+    Histogram,
+    MetricsMiddleware,
+    install_query_instrumentation,
+    render_metrics,
+)
+from tests.test_async_routes import seed_database
+
+DETAIL_ROUTE = "/cocktails/{cocktail_id}"
+
+
+@pytest.fixture()
+def database_path(tmp_path: Path) -> Path:
+    database_path = tmp_path / "metrics.db"
+    seed_database(database_path)
+    return database_path
+
+
+def test_requests_record_status_and_query_counts(
+    database_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    engine = create_engine(f"sqlite+pysqlite:///{database_path}", future=True)
+    monkeypatch.setattr(main_module, "create_session", sessionmaker(bind=engine, future=True))
+    monkeypatch.setattr(main_module, "get_response_cache", lambda: None)
+    client = TestClient(app)
+    ok_before = REQUESTS.value("GET", DETAIL_ROUTE, "200")
+    missing_before = REQUESTS.value("GET", DETAIL_ROUTE, "404")
+    requests_before = REQUEST_QUERIES.count(DETAIL_ROUTE)
+    queries_before = REQUEST_QUERIES.sum(DETAIL_ROUTE)
+
+    assert client.get("/cocktails/cocktail-test").status_code == 200
+    assert client.get("/cocktails/missing").status_code == 404
+
+    assert REQUESTS.value("GET", DETAIL_ROUTE, "200") == ok_before + 1
+    assert REQUESTS.value("GET", DETAIL_ROUTE, "404") == missing_before + 1
+    assert REQUEST_QUERIES.count(DETAIL_ROUTE) == requests_before + 2
+    assert REQUEST_QUERIES.sum(DETAIL_ROUTE) == queries_before + 2
+
+    body = client.get("/metrics").text
+    assert 'http_requests_total{method="GET",route="/cocktails/{cocktail_id}",status="200"}' in body
+    assert "# TYPE db_queries_per_request histogram" in body
+    assert 'cache_requests_total{cache="response",result="hit"}' not in body
+
+
+def test_async_requests_record_query_counts(
+    database_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{database_path}")
+    monkeypatch.setattr(
+        main_module, "create_async_session", async_sessionmaker(bind=engine, expire_on_commit=False)
+    )
+    async_app = FastAPI()
+    main_module.include_catalog_routes(async_app, use_async=True)
+    async_app.add_middleware(MetricsMiddleware)
+    install_query_instrumentation()
+    queries_before = REQUEST_QUERIES.sum("/vibes")
+
+    assert TestClient(async_app).get("/vibes").status_code == 200
+
+    assert REQUEST_QUERIES.sum("/vibes") == queries_before + 1
+
+
+def test_revalidated_requests_keep_their_route_label(monkeypatch: pytest.MonkeyPatch) -> None:
+    catalog_manager = SimpleNamespace(version="v1", index=None)
+    monkeypatch.setattr(main_module, "get_catalog_manager", lambda: catalog_manager)
+    client = TestClient(app)
+    before = REQUESTS.value("GET", DETAIL_ROUTE, "304")
+    response = client.get(
+        "/cocktails/cocktail-test",
+        headers={"If-None-Match": build_etag("v1", "/cocktails/cocktail-test", b"")},
+    )
+
+    assert response.status_code == 304
+    assert REQUESTS.value("GET", DETAIL_ROUTE, "304") == before + 1
+
+
+def test_pool_checkout_wait_is_observed(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'pool.db'}", poolclass=TimedQueuePool)
+    before = POOL_CHECKOUT_WAIT.count()
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    engine.dispose()
+
+    assert POOL_CHECKOUT_WAIT.count() == before + 1
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    histogram = Histogram("demo_seconds", "Demo.", ("route",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.5, "/a")
+    histogram.observe(5.0, "/a")
+
+    assert list(histogram.render())[2:] == [
+        'demo_seconds_bucket{route="/a",le="0.1"} 1',
+        'demo_seconds_bucket{route="/a",le="1"} 2',
+        'demo_seconds_bucket{route="/a",le="+Inf"} 3',
+        'demo_seconds_sum{route="/a"} 5.55',
+        'demo_seconds_count{route="/a"} 3',
+    ]
+
+
+def test_compiled_cache_results_are_counted(database_path: Path) -> None:
+    engine = create_engine(f"sqlite+pysqlite:///{database_path}", future=True)
+    install_query_instrumentation()
+    statement = text("SELECT count(*) FROM cocktails")
+    hits_before = COMPILED_CACHE.value("hit")
+    misses_before = COMPILED_CACHE.value("miss")
+
+    with engine.connect() as connection:
+        connection.execute(statement)
+        connection.execute(statement)
+
+    assert COMPILED_CACHE.value("miss") == misses_before + 1
+    assert COMPILED_CACHE.value("hit") == hits_before + 1
+    assert 'db_compiled_cache_total{result="hit"}' in render_metrics()
+    engine.dispose()
@@ -0,0 +1,118 @@
+"""Pantry index and /cocktails/makeable tests."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main as main_module
+from app.catalog import CatalogIndexManager
+from app.main import app
+from app.pantry import PantryIndex, normalize_ingredient
+from tests.test_catalog import create_session_factory
+
+INGREDIENTS = ("Gin", "Lime juice", "Simple syrup", "Mint leaves", "Soda water", "Campari", "Rum")
+
+
+def build_requirements(count: int, seed: int = 11) -> list[tuple[str, ...]]:
+    generator = random.Random(seed)
+    return [
+        (*generator.sample(INGREDIENTS, generator.randint(1, 5)), "Ice")
+        for _ in range(count)
+    ]
+
+
+def test_normalize_ingredient_drops_qualifiers_and_plurals() -> None:
+    assert normalize_ingredient("Fresh Lime Juices") == normalize_ingredient("lime juice")
+    assert normalize_ingredient("Angostura bitters") == "angostura bitter"
+    assert normalize_ingredient("Club Soda, chilled") == "club soda"
+
+
+@pytest.mark.parametrize(
+    ("have", "max_missing"),
+    [
+        (["gin", "lime juice", "simple syrup"], 0),
+        (["Gin", "Fresh lime juice"], 2),
+        (["rum", "mint leaf", "soda water", "lime juice", "simple syrup"], 1),
+        ([], 1),
+        (["gin", "vodka"], 5),
+    ],
+)
+def test_pantry_matches_a_naive_scan(have: list[str], max_missing: int) -> None:
+    requirements = build_requirements(200)
+    index = PantryIndex(requirements)
+    pantry = index.resolve(have)
+    owned = {normalize_ingredient(name) for name in have} | {"ice"}
+    expected = []
+    for position, names in enumerate(requirements):
+        missing = [name for name in names if normalize_ingredient(name) not in owned]
+        if len(missing) <= max_missing:
+            expected.append((len(missing), position, tuple(sorted(missing, key=str.lower))))
+    expected.sort()
+
+    walked = []
+    for offset in range(0, 210, 8):
+        page = index.match(pantry, (1 << len(requirements)) - 1, max_missing, offset, 8)
+        assert page.total == len(expected)
+        walked.extend(page.items)
+
+    assert walked == [(position, missing) for _, position, missing in expected]
+
+
+def test_resolve_reports_unknown_items_but_not_staples() -> None:
+    index = PantryIndex(build_requirements(20))
+
+    pantry = index.resolve(["Gin", "Crème de violette", "Ice", "water"])
+
+    assert pantry.unmatched == ("Crème de violette",)
+    assert pantry.ingredient_ids == {index.ingredient_ids["gin"]}
+
+
+@pytest.fixture()
+def pantry_client(monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    manager = CatalogIndexManager(poll_interval=60, session_factory=create_session_factory())
+    manager.refresh()
+    monkeypatch.setattr(main_module, "get_catalog_manager", lambda: manager)
+    return TestClient(app)
+
+
+def test_makeable_endpoint_lists_fully_makeable_cocktails(pantry_client: TestClient) -> None:
+    payload = pantry_client.get(
+        "/cocktails/makeable?have=gin,sweet vermouth&have=bitter aperitivo,orange peel,salt"
+    ).json()
+
+    assert [item["id"] for item in payload["items"]] == ["cocktail-citrus-negroni"]
+    assert payload["items"][0]["missing"] == []
+    assert payload["unmatched"] == ["salt"]
+    assert payload["total"] == 1
+
+
+def test_makeable_endpoint_orders_by_missing_count(pantry_client: TestClient) -> None:
+    payload = pantry_client.get("/cocktails/makeable?have=gin,sweet vermouth&maxMissing=2").json()
+
+    missing = [len(item["missing"]) for item in payload["items"]]
+    assert missing == sorted(missing)
+    negroni = next(item for item in payload["items"] if item["id"] == "cocktail-citrus-negroni")
+    assert negroni["missing"] == ["Bitter aperitivo", "Orange peel"]
+
+
+def test_makeable_endpoint_combines_catalog_filters(pantry_client: TestClient) -> None:
+    everything = pantry_client.get("/cocktails/makeable?maxMissing=5&limit=100").json()
+    filtered = pantry_client.get("/cocktails/makeable?maxMissing=5&limit=100&vibe=vibe-date").json()
+
+    assert 0 < filtered["total"] < everything["total"]
+    assert {item["id"] for item in filtered["items"]} <= {
+        item["id"] for item in everything["items"]
+    }
+
+
+def test_makeable_endpoint_requires_the_pantry_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    manager = CatalogIndexManager(
+        poll_interval=60, session_factory=create_session_factory(), load_pantry=False
+    )
+    manager.refresh()
+    monkeypatch.setattr(main_module, "get_catalog_manager", lambda: manager)
+
+    assert TestClient(app).get("/cocktails/makeable?have=gin").status_code == 503
@@ -0,0 +1,93 @@
+"""Query budget and repeated-statement detection tests."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.models import Cocktail
+from app.query_budget import (
+    QueryBudgetExceeded,
+    QueryBudgetMiddleware,
+    query_budget,
+    route_query_budget,
+)
+from tests.test_cocktails import create_session_factory, seed_ranked_cocktails
+
+
+def test_budget_raises_when_exceeded() -> None:
+    session_factory = create_session_factory()
+    seed_ranked_cocktails(session_factory, 2)
+
+    with pytest.raises(QueryBudgetExceeded, match="executed 2 SQL statements, budget is 1"):
+        with query_budget(1, repeat_threshold=3), session_factory() as session:
+            session.execute(select(Cocktail.id)).all()
+            session.execute(select(Cocktail.name)).all()
+
+
+def test_repeated_statements_are_flagged_as_n_plus_one() -> None:
+    session_factory = create_session_factory()
+    seed_ranked_cocktails(session_factory, 3)
+
+    with pytest.raises(QueryBudgetExceeded, match="repeated a statement 3 times"):
+        with query_budget(label="lazy vibes"), session_factory() as session:
+            for cocktail in session.execute(select(Cocktail)).scalars():
+                list(cocktail.vibes)
+
+
+def test_nested_budgets_see_the_same_statements() -> None:
+    session_factory = create_session_factory()
+
+    with query_budget(2) as outer:
+        with query_budget(1) as inner, session_factory() as session:
+            session.execute(select(Cocktail.id)).all()
+        with session_factory() as session:
+            session.execute(select(Cocktail.name)).all()
+
+    assert inner.count == 1
+    assert outer.count == 2
+
+
+def build_budgeted_app(strict: bool) -> FastAPI:
+    session_factory = create_session_factory()
+    seed_ranked_cocktails(session_factory, 2)
+    budgeted_app = FastAPI()
+    budgeted_app.add_middleware(QueryBudgetMiddleware, strict=strict)
+
+    @budgeted_app.get("/names/{count}")
+    @route_query_budget(1)
+    def names(count: int) -> list[str]:
+        with session_factory() as session:
+            return [
+                name
+                for index in range(count)
+                for name in session.execute(select(Cocktail.name).offset(index)).scalars()
+            ]
+
+    return budgeted_app
+
+
+def test_middleware_enforces_declared_route_budget(caplog: pytest.LogCaptureFixture) -> None:
+    client = TestClient(build_budgeted_app(strict=True))
+
+    assert client.get("/names/1").status_code == 200
+    with caplog.at_level(logging.ERROR, logger="app.query_budget"):
+        response = client.get("/names/2")
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Query budget exceeded."}
+    assert "GET /names/{count} executed 2 SQL statements, budget is 1" in caplog.text
+
+
+def test_middleware_logs_when_not_strict(caplog: pytest.LogCaptureFixture) -> None:
+    client = TestClient(build_budgeted_app(strict=False))
+
+    with caplog.at_level(logging.WARNING, logger="app.query_budget"):
+        assert client.get("/names/3").status_code == 200
+
+    assert "executed 3 SQL statements, budget is 1" in caplog.text
+    assert "repeated a statement 3 times" in caplog.text
@@ -0,0 +1,125 @@
+"""EXPLAIN-based regression checks for the cocktail filter and sort paths.
+
+Runs against an in-memory SQLite catalog by default. Set ``QUERY_PLAN_DATABASE_URL`` to a
+scratch PostgreSQL database to check the same statements there; its tables are recreated.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import Iterator
+from itertools import product
+from typing import Any
+
+import pytest
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.orm import Session
+
+from app.db import Base
+from app.main import CocktailListParams, build_cocktails_statement
+from app.synthetic import SyntheticCatalog, insert_synthetic_catalog
+
+SQLITE_COCKTAILS = 20_000
+POSTGRES_COCKTAILS = 200_000
+LARGE_TABLES = {"cocktails", "cocktail_vibes", "cocktail_occasions"}
+MID_CATALOG_CURSOR = (50, "Synthetic Cocktail", "")
+SQLITE_SCAN = re.compile(r"^SCAN (?P<table>\w+?)(?:_\d+)?(?: |$)")
+# Walking the sort index is bounded by LIMIT, so it is only a full read when rows are filtered.
+ORDERED_WALK = "SCAN cocktails USING INDEX ix_cocktails_rank_name_id"
+
+
+def build_plan_engines() -> list[Any]:
+    engines = [pytest.param(("sqlite+pysqlite:///:memory:", SQLITE_COCKTAILS), id="sqlite")]
+    postgres_url = os.getenv("QUERY_PLAN_DATABASE_URL")
+    engines.append(
+        pytest.param(
+            (postgres_url, POSTGRES_COCKTAILS),
+            id="postgresql",
+            marks=pytest.mark.skipif(
+                not postgres_url, reason="QUERY_PLAN_DATABASE_URL is not set."
+            ),
+        )
+    )
+    return engines
+
+
+@pytest.fixture(scope="module", params=build_plan_engines())
+def plan_engine(request: pytest.FixtureRequest) -> Iterator[Engine]:
+    database_url, cocktails = request.param
+    engine = create_engine(database_url, future=True)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        insert_synthetic_catalog(session, SyntheticCatalog(cocktails=cocktails))
+        session.commit()
+    with engine.begin() as connection:
+        connection.execute(text("ANALYZE"))
+    yield engine
+    if engine.dialect.name != "sqlite":
+        Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+def iter_postgres_nodes(node: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from iter_postgres_nodes(child)
+
+
+def find_sequential_scans(engine: Engine, statement) -> list[str]:
+    """Return the plan steps that read a large table end to end."""
+    sql = str(statement.compile(engine, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as connection:
+        if engine.dialect.name == "sqlite":
+            details = [row[3] for row in connection.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+            return [
+                detail
+                for detail in details
+                if (match := SQLITE_SCAN.match(detail)) and match["table"] in LARGE_TABLES
+            ]
+        plan = connection.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar_one()
+    return [
+        f"Seq Scan on {node['Relation Name']}"
+        for node in iter_postgres_nodes(plan[0]["Plan"])
+        if node["Node Type"] == "Seq Scan" and node["Relation Name"] in LARGE_TABLES
+    ]
+
+
+def build_plan_cases() -> list[Any]:
+    cases = []
+    for vibe_id, occasion_id, difficulty_id in product(
+        ("", "vibe-001"), ("", "occasion-002"), ("", "difficulty-easy")
+    ):
+        shapes = {
+            "keyset": (MID_CATALOG_CURSOR, False),
+            "page": (None, False),
+            "page-total": (None, True),
+        }
+        for shape, (cursor_key, include_total) in shapes.items():
+            if shape == "page-total" and not (vibe_id or occasion_id or difficulty_id):
+                # Counting the whole unfiltered catalog has to read every row.
+                continue
+            params = CocktailListParams(
+                vibe_id=vibe_id,
+                difficulty_id=difficulty_id,
+                occasion_id=occasion_id,
+                page=3,
+                limit=12,
+                cursor_key=cursor_key,
+                include_total=include_total,
+            )
+            case_id = f"{vibe_id or '-'}/{occasion_id or '-'}/{difficulty_id or '-'}/{shape}"
+            cases.append(pytest.param(params, id=case_id))
+    return cases
+
+
+@pytest.mark.parametrize("params", build_plan_cases())
+def test_cocktail_filters_avoid_sequential_scans(
+    plan_engine: Engine, params: CocktailListParams
+) -> None:
+    scans = find_sequential_scans(plan_engine, build_cocktails_statement(params))
+    if not (params.vibe_id or params.occasion_id or params.difficulty_id):
+        scans = [scan for scan in scans if scan != ORDERED_WALK]
+
+    assert scans == []
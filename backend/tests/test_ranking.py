@@ -0,0 +1,143 @@
+"""Ranking engine and /cocktails/ranked tests."""
+
+from __future__ import annotations
+
+import random
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main as main_module
+from app.catalog import CatalogEntry, CatalogIndex
+from app.main import app
+from app.ranking import RankingQuery, rank_cocktails, score_tiers
+
+VIBES = ("vibe-a", "vibe-b", "vibe-c")
+OCCASIONS = ("occasion-x", "occasion-y", "occasion-z")
+ALCOHOL_LEVELS = ("alcohol-light", "alcohol-strong")
+
+
+def build_index(count: int, seed: int = 3) -> tuple[CatalogIndex, dict[str, dict[str, set]]]:
+    generator = random.Random(seed)
+    entries = []
+    features: dict[str, dict[str, set]] = {}
+    for index in range(count):
+        entry = CatalogEntry(
+            id=f"cocktail-{index:03d}",
+            name=f"Cocktail {generator.randrange(count):03d}",
+            description="",
+            image_url=None,
+            rank=generator.randrange(5),
+            difficulty_id=generator.choice(("difficulty-easy", "difficulty-hard")),
+            alcohol_level_id=generator.choice(ALCOHOL_LEVELS),
+            complexity=generator.randrange(3, 15),
+        )
+        entries.append(entry)
+        features[entry.id] = {
+            "vibes": set(generator.sample(VIBES, generator.randint(0, 2))),
+            "occasions": set(generator.sample(OCCASIONS, generator.randint(0, 3))),
+        }
+    catalog_index = CatalogIndex(
+        version="v1",
+        entries=entries,
+        vibe_links=[(key, item) for key, value in features.items() for item in value["vibes"]],
+        occasion_links=[
+            (key, item) for key, value in features.items() for item in value["occasions"]
+        ],
+    )
+    return catalog_index, features
+
+
+def rank_naively(
+    catalog_index: CatalogIndex, features: dict[str, dict[str, set]], query: RankingQuery
+) -> list[tuple[str, int]]:
+    ranked = []
+    for entry in catalog_index.entries:
+        item = features[entry.id]
+        if query.vibe_ids and not item["vibes"] & set(query.vibe_ids):
+            continue
+        if query.alcohol_level_ids and entry.alcohol_level_id not in query.alcohol_level_ids:
+            continue
+        if query.difficulty_id and entry.difficulty_id != query.difficulty_id:
+            continue
+        if not query.accepts_complexity(entry.complexity):
+            continue
+        ranked.append((entry.id, len(item["occasions"] & set(query.occasion_ids))))
+    return sorted(ranked, key=lambda pair: -pair[1])
+
+
+def test_score_tiers_counts_each_boost_once() -> None:
+    tiers = score_tiers(0b11111, [0b00111, 0b01101, 0b00001])
+
+    assert tiers == [(3, 0b00001), (2, 0b00100), (1, 0b01010), (0, 0b10000)]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        RankingQuery(),
+        RankingQuery(occasion_ids=("occasion-x",)),
+        RankingQuery(vibe_ids=("vibe-a", "vibe-c"), occasion_ids=OCCASIONS),
+        RankingQuery(alcohol_level_ids=("alcohol-strong",), occasion_ids=("occasion-y", "z")),
+        RankingQuery(difficulty_id="difficulty-easy", min_complexity=6, max_complexity=11),
+        RankingQuery(vibe_ids=("vibe-missing",)),
+    ],
+)
+def test_ranking_matches_a_naive_scan(query: RankingQuery) -> None:
+    catalog_index, features = build_index(200)
+    expected = rank_naively(catalog_index, features, query)
+
+    walked = []
+    for offset in range(0, 220, 7):
+        page = rank_cocktails(catalog_index, query, offset, 7)
+        assert page.total == len(expected)
+        walked.extend((entry.id, score) for entry, score in page.items)
+
+    assert walked == expected
+
+
+@pytest.fixture()
+def ranked_client(monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    catalog_index, _ = build_index(40)
+    monkeypatch.setattr(
+        main_module,
+        "get_catalog_manager",
+        lambda: SimpleNamespace(version="v1", index=catalog_index),
+    )
+    return TestClient(app)
+
+
+def test_ranked_endpoint_accepts_repeated_and_comma_separated_values(
+    ranked_client: TestClient,
+) -> None:
+    repeated = ranked_client.get(
+        "/cocktails/ranked?vibe=vibe-a&vibe=vibe-b&occasion=occasion-x&alcoholLevel=alcohol-light"
+    )
+    joined = ranked_client.get(
+        "/cocktails/ranked?vibe=vibe-a,vibe-b&occasion=occasion-x&alcoholLevel=alcohol-light"
+    )
+
+    assert repeated.status_code == 200
+    assert repeated.json() == joined.json()
+    payload = repeated.json()
+    scores = [item["score"] for item in payload["items"]]
+    assert scores == sorted(scores, reverse=True)
+    assert set(payload["items"][0]) == {"score", "id", "name", "description", "imageUrl"}
+    assert (payload["page"], payload["limit"]) == (1, 12)
+
+
+def test_ranked_endpoint_requires_the_catalog_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        main_module, "get_catalog_manager", lambda: SimpleNamespace(version="v1", index=None)
+    )
+
+    response = TestClient(app).get("/cocktails/ranked")
+
+    assert response.status_code == 503
+
+
+def test_score_tiers_saturates_at_cap() -> None:
+    tiers = score_tiers(0b1111, [0b0111, 0b0011, 0b0001], cap=2)
+
+    assert tiers == [(2, 0b0011), (1, 0b0100), (0, 0b1000)]
@@ -0,0 +1,243 @@
+"""Search index and /cocktails/search tests."""
+
+from __future__ import annotations
+
+import random
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main as main_module
+from app import search as search_module
+from app.catalog import CatalogEntry, CatalogIndex, CatalogIndexManager
+from app.main import app
+from app.search import (
+    MAX_TOKEN_GROUPS,
+    SCORE_PRECISION,
+    SearchDocument,
+    SearchIndex,
+    build_search_document,
+    cap_groups,
+    tokenize,
+)
+from tests.test_catalog import create_session_factory
+
+SPIRITS = ("Tequila", "Mezcal", "Gin", "Rum", "Whiskey")
+INGREDIENTS = ("Fresh lime juice", "Grapefruit soda", "Agave syrup", "Mint leaves", "Ginger beer")
+FLAVORS = ("citrus", "smoky", "herbal", "spicy", "sweet")
+
+
+def build_documents(count: int, seed: int = 5) -> list[SearchDocument]:
+    generator = random.Random(seed)
+    return [
+        SearchDocument(
+            name=f"{generator.choice(SPIRITS)} {generator.choice(('Sour', 'Paloma', 'Mule'))}",
+            description=generator.choice(("Bright and tall.", "Smoky, with a lime finish.", "")),
+            ingredients=tuple(generator.sample(INGREDIENTS, generator.randint(1, 3))),
+            spirits=tuple(generator.sample(SPIRITS, generator.randint(0, 2))),
+            flavors=tuple(generator.sample(FLAVORS, generator.randint(0, 2))),
+        )
+        for _ in range(count)
+    ]
+
+
+def search_naively(index: SearchIndex, documents: list[SearchDocument], query: str) -> list:
+    tokens = list(dict.fromkeys(tokenize(query)))
+    expansions = [index.expand(token) for token in tokens]
+    hits = []
+    for position, document in enumerate(documents):
+        weights = document.term_weights()
+        total = 0.0
+        for expanded in expansions:
+            scores = [
+                round(weights[term] * factor * index.idf[term], SCORE_PRECISION)
+                for term, factor in expanded.items()
+                if term in weights
+            ]
+            if not scores:
+                break
+            total += max(scores)
+        else:
+            if tokens:
+                hits.append((position, round(total, SCORE_PRECISION)))
+    return sorted(hits, key=lambda hit: (-hit[1], hit[0]))
+
+
+def test_tokenize_normalizes_case_accents_and_stopwords() -> None:
+    assert tokenize("Añejo Tequila & the LIME-juice") == ["anejo", "tequila", "lime", "juice"]
+
+
+def test_build_search_document_reads_seed_shapes() -> None:
+    document = build_search_document(
+        "Paloma",
+        None,
+        [{"name": "Grapefruit soda", "amount": "4", "unit": "oz"}],
+        {"spirit": ["Tequila"], "flavor": ["citrus"]},
+    )
+
+    assert document == SearchDocument(
+        name="Paloma",
+        ingredients=("Grapefruit soda",),
+        spirits=("Tequila",),
+        flavors=("citrus",),
+    )
+
+
+def test_expand_uses_prefixes_then_trigrams() -> None:
+    index = SearchIndex(build_documents(50))
+
+    assert set(index.expand("grape")) == {"grapefruit"}
+    assert index.expand("gin") == {"gin": 1.0, "ginger": pytest.approx(0.7)}
+    assert list(index.expand("tequlia")) == ["tequila"]
+    assert index.expand("xylophone") == {}
+
+
+@pytest.mark.parametrize("direct_limit", [0, 10_000], ids=["tiers", "direct"])
+@pytest.mark.parametrize(
+    "query",
+    ["tequila", "lime tequila", "gin", "smoky mezc", "tequlia grapefruit", "mule", "the", "zzz"],
+)
+def test_search_matches_a_naive_scan(
+    query: str, direct_limit: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(search_module, "DIRECT_SCORING_LIMIT", direct_limit)
+    documents = build_documents(300)
+    index = SearchIndex(documents)
+    expected = search_naively(index, documents, query)
+
+    walked = []
+    for offset in range(0, 320, 9):
+        page = index.search(query, offset, 9)
+        assert page.total == len(expected)
+        walked.extend(page.hits)
+
+    assert walked == expected
+
+
+@pytest.fixture(scope="module")
+def prefix_heavy_documents() -> list[SearchDocument]:
+    """Short words over a small alphabet, so every two-letter prefix expands to many groups."""
+    generator = random.Random(3)
+
+    def words(count: int) -> str:
+        return " ".join(
+            "".join(generator.choice("abcdefgh") for _ in range(3)) for _ in range(count)
+        )
+
+    return [
+        SearchDocument(name=words(3), description=words(6), ingredients=(words(1), words(1)))
+        for _ in range(20_000)
+    ]
+
+
+@pytest.mark.parametrize("direct_limit", [0, 10_000], ids=["tiers", "direct"])
+def test_multi_prefix_query_is_bounded(
+    prefix_heavy_documents: list[SearchDocument],
+    direct_limit: int,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(search_module, "DIRECT_SCORING_LIMIT", direct_limit)
+    index = SearchIndex(prefix_heavy_documents)
+    query = "ab ba ca da"
+    assert all(len(index.score_groups(token)) >= 30 for token in tokenize(query))
+
+    started = time.perf_counter()
+    page = index.search(query, 0, 12)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 1.0
+    assert page.total == len(search_naively(index, prefix_heavy_documents, query))
+    scores = [score for _, score in page.hits]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_cap_groups_folds_the_lowest_scoring_groups() -> None:
+    groups = [(float(score), 1 << score) for score in range(40, 0, -1)]
+
+    capped = cap_groups(groups)
+
+    assert len(capped) == MAX_TOKEN_GROUPS
+    assert capped[:-1] == groups[: MAX_TOKEN_GROUPS - 1]
+    assert capped[-1][0] == groups[MAX_TOKEN_GROUPS - 1][0]
+    assert capped[-1][1] == sum(bits for _, bits in groups[MAX_TOKEN_GROUPS - 1 :])
+
+
+def test_search_prefers_name_matches() -> None:
+    index = SearchIndex(
+        [
+            SearchDocument(name="Garden Spritz", description="A paloma cousin."),
+            SearchDocument(name="Paloma"),
+        ]
+    )
+
+    assert [position for position, _ in index.search("paloma", 0, 10).hits] == [1, 0]
+
+
+@pytest.fixture()
+def search_client(monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    documents = build_documents(40)
+    catalog_index = CatalogIndex(
+        version="v1",
+        entries=[
+            CatalogEntry(
+                id=f"cocktail-{position:03d}",
+                name=document.name,
+                description=document.description,
+                image_url=None,
+                rank=position,
+                difficulty_id="difficulty-easy",
+                alcohol_level_id="alcohol-light",
+                complexity=3,
+            )
+            for position, document in enumerate(documents)
+        ],
+        vibe_links=[],
+        occasion_links=[],
+    )
+    catalog_index.search = SearchIndex(documents)
+    monkeypatch.setattr(
+        main_module,
+        "get_catalog_manager",
+        lambda: SimpleNamespace(version="v1", index=catalog_index),
+    )
+    return TestClient(app)
+
+
+def test_search_endpoint_pages_scored_summaries(search_client: TestClient) -> None:
+    first = search_client.get("/cocktails/search?q=tequila&limit=5").json()
+    second = search_client.get("/cocktails/search?q=tequila&limit=5&page=2").json()
+
+    assert first["total"] > 5
+    assert (first["page"], first["limit"]) == (1, 5)
+    assert set(first["items"][0]) == {"score", "id", "name", "description", "imageUrl"}
+    scores = [item["score"] for item in first["items"] + second["items"]]
+    assert scores == sorted(scores, reverse=True)
+    assert not {item["id"] for item in first["items"]} & {item["id"] for item in second["items"]}
+
+
+def test_search_endpoint_requires_a_query(search_client: TestClient) -> None:
+    assert search_client.get("/cocktails/search").status_code == 422
+
+
+def test_search_endpoint_requires_the_search_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    catalog_index = CatalogIndex(version="v1", entries=[], vibe_links=[], occasion_links=[])
+    monkeypatch.setattr(
+        main_module,
+        "get_catalog_manager",
+        lambda: SimpleNamespace(version="v1", index=catalog_index),
+    )
+
+    assert TestClient(app).get("/cocktails/search?q=gin").status_code == 503
+
+
+def test_search_index_loads_with_the_catalog(monkeypatch: pytest.MonkeyPatch) -> None:
+    manager = CatalogIndexManager(poll_interval=60, session_factory=create_session_factory())
+    manager.refresh()
+    monkeypatch.setattr(main_module, "get_catalog_manager", lambda: manager)
+
+    payload = TestClient(app).get("/cocktails/search?q=negroni aperitivo").json()
+
+    assert [item["id"] for item in payload["items"]] == ["cocktail-citrus-negroni"]
+    assert payload["total"] == 1
@@ -11,7 +11,8 @@ import pytest
 from app import main as main_module
 from app.db import Base
 from app.main import app
-from app.models import Vibe
+from app.models import AlcoholLevel, Cocktail, Difficulty, Occasion, Vibe
+from app.query_budget import query_budget
 
 
 def create_session_factory() -> sessionmaker:
@@ -48,9 +49,11 @@ def test_list_vibes_shape(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(main_module, "create_session", session_factory)
 
     client = TestClient(app)
-    response = client.get("/vibes")
+    with query_budget(1) as queries:
+        response = client.get("/vibes")
 
     assert response.status_code == 200
+    assert queries.count == 1
     payload = response.json()
     assert isinstance(payload, list)
     assert payload == [
@@ -62,3 +65,57 @@ def test_list_vibes_shape(monkeypatch: pytest.MonkeyPatch) -> None:
             "tags": [],
         }
     ]
+
+
+def test_list_vibes_ranked_by_occasion(monkeypatch: pytest.MonkeyPatch) -> None:
+    session_factory = create_session_factory()
+    session = session_factory()
+    try:
+        vibes = {
+            name: Vibe(id=f"vibe-{name}", name=name, description=name, icon=None)
+            for name in ("Alpha", "Bravo", "Charlie", "Delta")
+        }
+        party = Occasion(id="occasion-party", name="Party", description="Party")
+        brunch = Occasion(id="occasion-brunch", name="Brunch", description="Brunch")
+        session.add_all(
+            [
+                *vibes.values(),
+                Difficulty(id="difficulty-balanced", label="Balanced", rank=2),
+                AlcoholLevel(id="alcohol-light", label="Light", rank=1),
+            ]
+        )
+        pairings = [
+            (["Charlie", "Bravo"], [party]),
+            (["Charlie"], [party, brunch]),
+            (["Alpha"], [brunch]),
+        ]
+        for index, (vibe_names, occasions) in enumerate(pairings):
+            session.add(
+                Cocktail(
+                    id=f"cocktail-{index}",
+                    name=f"Cocktail {index}",
+                    description="",
+                    ingredients=[],
+                    steps=[],
+                    difficulty_id="difficulty-balanced",
+                    alcohol_level_id="alcohol-light",
+                    vibes=[vibes[name] for name in vibe_names],
+                    occasions=occasions,
+                )
+            )
+        session.commit()
+    finally:
+        session.close()
+    monkeypatch.setattr(main_module, "create_session", session_factory)
+    client = TestClient(app)
+
+    with query_budget(1):
+        ranked = client.get("/vibes?occasion=occasion-party").json()
+
+    assert [vibe["name"] for vibe in ranked] == ["Charlie", "Bravo", "Alpha", "Delta"]
+    assert [vibe["name"] for vibe in client.get("/vibes").json()] == [
+        "Alpha",
+        "Bravo",
+        "Charlie",
+        "Delta",
+    ]
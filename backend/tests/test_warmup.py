@@ -0,0 +1,117 @@
+"""Startup warm-up and readiness tests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+from app import health as health_module
+from app import main as main_module
+from app.catalog import CatalogIndexManager
+from app.health import HealthMonitor
+from app.main import app
+from app.warmup import Warmup, WarmupStep, preconnect_pool
+from tests.test_catalog import create_session_factory
+
+
+@pytest.fixture()
+def healthy_monitor(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(health_module, "get_dependency_checks", lambda: {"database": lambda: True})
+    monitor = HealthMonitor(interval=60, max_age=60, timeout=1)
+    monkeypatch.setattr(main_module, "get_health_monitor", lambda: monitor)
+
+
+def test_warmup_records_steps_and_survives_failures() -> None:
+    calls: list[str] = []
+
+    def fail() -> None:
+        raise RuntimeError("database unreachable")
+
+    async def warm_async() -> None:
+        calls.append("async")
+
+    warmup = Warmup()
+    steps = [
+        WarmupStep("sync", lambda: calls.append("sync")),
+        WarmupStep("failing", fail),
+        WarmupStep("async", warm_async),
+    ]
+
+    assert not warmup.ready
+    asyncio.run(warmup.run(steps))
+
+    assert warmup.ready
+    assert calls == ["sync", "async"]
+    assert [name for name in warmup.results] == ["sync", "failing", "async"]
+    assert warmup.results["failing"].ok is False
+    assert warmup.results["async"].ok is True
+    assert warmup.duration_ms >= 0
+
+
+def test_ready_stays_false_until_warmup_finishes(
+    monkeypatch: pytest.MonkeyPatch, healthy_monitor: None
+) -> None:
+    warmup = Warmup()
+    monkeypatch.setattr(main_module, "get_warmup", lambda: warmup)
+    client = TestClient(app)
+
+    warming = client.get("/health/ready")
+    asyncio.run(warmup.run([WarmupStep("noop", lambda: None)]))
+    ready = client.get("/health/ready")
+
+    assert warming.status_code == 503
+    assert warming.json()["status"] == "warming"
+    assert warming.json()["warmup"]["ready"] is False
+    assert ready.status_code == 200
+    assert ready.json()["warmup"]["steps"]["noop"]["ok"] is True
+
+
+def test_lifespan_runs_warmup(monkeypatch: pytest.MonkeyPatch, healthy_monitor: None) -> None:
+    warmup = Warmup()
+    monkeypatch.setattr(main_module, "get_warmup", lambda: warmup)
+
+    with TestClient(app) as client:
+        deadline = time.monotonic() + 5
+        while client.get("/health/ready").status_code != 200 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        payload = client.get("/health/ready").json()
+
+    assert payload["status"] == "ok"
+    assert "mappers" in payload["warmup"]["steps"]
+
+
+def test_preconnect_pool_fills_the_pool(tmp_path) -> None:
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'warm.db'}", pool_size=3)
+
+    assert preconnect_pool(engine) == 3
+    assert engine.pool.checkedin() == 3
+    engine.dispose()
+
+
+def test_warm_statements_compile_every_list_shape(monkeypatch: pytest.MonkeyPatch) -> None:
+    session_factory = create_session_factory()
+    engine = session_factory.kw["bind"]
+    monkeypatch.setattr(main_module, "create_session", session_factory)
+    monkeypatch.setattr(main_module, "get_response_cache", lambda: None)
+    manager = CatalogIndexManager(
+        poll_interval=60, session_factory=session_factory, load_index=False
+    )
+    monkeypatch.setattr(main_module, "get_catalog_manager", lambda: manager)
+    client = TestClient(app)
+
+    main_module.warm_statements()
+    compiled = len(engine._compiled_cache)
+    for query in (
+        "/cocktails",
+        "/cocktails?vibe=vibe-date&occasion=occasion-brunch&difficulty=&limit=5",
+        "/cocktails?vibe=vibe-date&includeTotal=false",
+        "/vibes?occasion=occasion-brunch",
+        "/cocktails/details?ids=cocktail-citrus-negroni",
+    ):
+        assert client.get(query).status_code == 200
+
+    assert len(engine._compiled_cache) == compiled
@@ -17,9 +17,10 @@ export type CocktailListItem = {
 
 export type CocktailsResponse = {
   items: CocktailListItem[];
-  page: number;
+  page: number | null;
   limit: number;
-  total: number;
+  total: number | null;
+  nextCursor?: string | null;
 };
 
 type FetchVibesParams = {